@@ -85,8 +85,8 @@ async def run_analysis(project_id: UUID, request: AnalysisRequest):
         )
 
     # Prepare materials and sections
-    materials = {m.name: m for m in _materials_repo.all()}
-    sections = {s.name: s for s in _sections_repo.all()}
+    materials = {m.name: m for m in _materials_repo.iter()}
+    sections = {s.name: s for s in _sections_repo.iter()}
 
     # Create load case
     load_type_map = {
@@ -263,8 +263,8 @@ async def get_mass(project_id: UUID):
         )
 
     # Get materials and sections
-    materials = {m.name: m for m in _materials_repo.all()}
-    sections = {s.name: s for s in _sections_repo.all()}
+    materials = {m.name: m for m in _materials_repo.iter()}
+    sections = {s.name: s for s in _sections_repo.iter()}
 
     # Get node positions for frame length calculation
     nodes_dict = {n.id: n for n in model.nodes}
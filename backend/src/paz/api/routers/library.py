@@ -3,6 +3,7 @@ Library router - materials and sections.
 """
 
 import math
+from itertools import islice
 
 from fastapi import APIRouter, HTTPException, Query
 
@@ -66,12 +67,14 @@ async def list_sections(
     limit: int = Query(default=100, le=500),
 ):
     """List available sections."""
-    sections = _sections_repo.all()
+    sections = _sections_repo.iter()
 
     if shape:
-        sections = [s for s in sections if s.shape.value.upper() == shape.upper()]
+        shape_upper = shape.upper()
+        sections = (s for s in sections if s.shape.value.upper() == shape_upper)
 
-    sections = sections[:limit]
+    # Stop after `limit` matches instead of copying the whole catalog first
+    sections = islice(sections, limit)
 
     return [
         SectionSchema(
@@ -114,9 +117,8 @@ async def get_section(name: str):
 @router.get("/sections/shapes", response_model=list[str])
 async def list_shapes():
     """List available section shapes."""
-    sections = _sections_repo.all()
-    shapes = set(s.shape.value for s in sections)
-    return sorted(shapes)
+    # The repository indexes sections by shape; no need to scan them all
+    return sorted(shape.value for shape in _sections_repo.get_shapes())
 
 
 @router.post("/sections/parametric", response_model=SectionSchema, status_code=201)
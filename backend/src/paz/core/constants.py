@@ -38,6 +38,7 @@ MAX_RECENT_PROJECTS: Final[int] = 10
 # File format
 PAZ_FILE_EXTENSION: Final[str] = ".paz"
 PAZ_FILE_VERSION: Final[str] = "1.0"
+PAZ_COMPRESS_LEVEL: Final[int] = 6  # gzip level: ~10x faster than 9, ~9% larger
 
 # API
 API_V1_PREFIX: Final[str] = "/api/v1"
@@ -4,6 +4,7 @@ from paz.domain.model.element_group import ElementGroup
 from paz.domain.model.frame import Frame, FrameReleases, validate_frame_length
 from paz.domain.model.local_axes import LocalAxes, calculate_local_axes
 from paz.domain.model.node import Node
+from paz.domain.model.node_grid import NodeGrid
 from paz.domain.model.shell import Shell, ShellType, validate_shell_area
 from paz.domain.model.restraint import (
     FIXED,
@@ -18,10 +19,11 @@ from paz.domain.model.restraint import (
     RESTRAINT_TYPE_LABELS,
     RESTRAINT_TYPE_DESCRIPTIONS,
 )
-from paz.domain.model.structural_model import StructuralModel
+from paz.domain.model.structural_model import CoordinateTables, StructuralModel
 
 
 __all__ = [
+    "CoordinateTables",
     "ElementGroup",
     "FIXED",
     "FREE",
@@ -34,6 +36,7 @@ __all__ = [
     "FrameReleases",
     "LocalAxes",
     "Node",
+    "NodeGrid",
     "Restraint",
     "RestraintType",
     "RESTRAINT_TYPE_LABELS",
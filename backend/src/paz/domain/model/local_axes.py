@@ -88,10 +88,41 @@ def calculate_local_axes(
     Raises:
         ValueError: If nodes are coincident (zero length)
     """
+    return calculate_local_axes_xyz(
+        node_i.x, node_i.y, node_i.z, node_j.x, node_j.y, node_j.z, rotation
+    )
+
+
+def calculate_local_axes_xyz(
+    xi: float,
+    yi: float,
+    zi: float,
+    xj: float,
+    yj: float,
+    zj: float,
+    rotation: float = 0.0,
+) -> LocalAxes:
+    """
+    Calculate local axes for a frame element from its end coordinates.
+
+    Same as calculate_local_axes, for callers that have positions rather
+    than Node objects (e.g. deformed or array-stored coordinates).
+
+    Args:
+        xi, yi, zi: Start point
+        xj, yj, zj: End point
+        rotation: Rotation angle in radians about the element axis
+
+    Returns:
+        LocalAxes object with the three unit vectors
+
+    Raises:
+        ValueError: If the points are coincident (zero length)
+    """
     # Calculate element direction vector
-    dx = node_j.x - node_i.x
-    dy = node_j.y - node_i.y
-    dz = node_j.z - node_i.z
+    dx = xj - xi
+    dy = yj - yi
+    dz = zj - zi
 
     length = sqrt(dx * dx + dy * dy + dz * dz)
 
@@ -5,10 +5,13 @@ The StructuralModel is the central container for nodes, frames, materials,
 sections, and other structural components.
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from paz.core.constants import MAX_NODES, NODE_DUPLICATE_TOLERANCE
 from paz.core.exceptions import (
     DuplicateNodeError,
@@ -21,6 +24,7 @@ from paz.core.exceptions import (
 from paz.domain.model.element_group import ElementGroup
 from paz.domain.model.frame import Frame, FrameReleases, validate_frame_length
 from paz.domain.model.node import Node
+from paz.domain.model.node_grid import NodeGrid
 from paz.domain.model.restraint import Restraint
 from paz.domain.model.shell import Shell, ShellType, validate_shell_area
 
@@ -31,6 +35,28 @@ MAX_SHELLS = 100000
 MAX_GROUPS = 10000
 
 
+@dataclass(frozen=True)
+class CoordinateTables:
+    """
+    Node coordinates and frame connectivity as struct-of-arrays.
+
+    A snapshot: later edits to the model are not reflected in it.
+
+    Attributes:
+        node_ids: Node IDs in model order
+        nodes_xyz: (N, 3) coordinates, row k for node_ids[k]
+        node_id_to_row: Row in nodes_xyz of each node ID
+        frame_ids: IDs of frames whose end nodes both exist, in model order
+        frames_ij: (M, 2) rows in nodes_xyz of the i and j node of each frame
+    """
+
+    node_ids: list[int]
+    nodes_xyz: NDArray[np.float64]
+    node_id_to_row: dict[int, int]
+    frame_ids: list[int]
+    frames_ij: NDArray[np.int64]
+
+
 @dataclass
 class StructuralModel:
     """
@@ -145,6 +171,80 @@ class StructuralModel:
 
         return node
 
+    def add_nodes(
+        self,
+        nodes: Iterable[tuple[float, float, float, Restraint | None, int | None]],
+        check_duplicate: bool = True,
+    ) -> list[Node]:
+        """
+        Add many nodes in one batch.
+
+        Equivalent to calling add_node for each entry, but duplicate
+        detection uses a spatial hash built once for the batch (O(N) overall
+        instead of an O(N) scan per node), and the batch is all-or-nothing:
+        if any entry is rejected, no node is added.
+
+        Args:
+            nodes: Entries of (x, y, z, restraint, node_id); restraint and
+                node_id may be None as in add_node
+            check_duplicate: Whether to check for duplicate nodes
+
+        Returns:
+            The created nodes, in input order
+
+        Raises:
+            ValidationError: If max nodes exceeded
+            DuplicateNodeError: If a node exists at the same location
+            NodeError: If a node ID is already in use
+        """
+        entries = list(nodes)
+
+        # Check limit
+        if self.node_count + len(entries) > MAX_NODES:
+            raise ValidationError(
+                f"Maximum number of nodes ({MAX_NODES}) exceeded",
+                field="nodes",
+            )
+
+        from paz.domain.model.restraint import FREE
+
+        grid = NodeGrid(self._nodes.values()) if check_duplicate else None
+        next_node_id = self._next_node_id
+        created: dict[int, Node] = {}
+
+        for x, y, z, restraint, node_id in entries:
+            # Check for duplicate (against the model and earlier entries)
+            if grid is not None:
+                existing = grid.find(x, y, z)
+                if existing is not None:
+                    raise DuplicateNodeError(x, y, z, existing.id)
+
+            # Determine ID
+            if node_id is None:
+                node_id = next_node_id
+                next_node_id += 1
+            else:
+                if node_id in self._nodes or node_id in created:
+                    raise NodeError(f"Node ID {node_id} already exists", node_id=node_id)
+                if node_id >= next_node_id:
+                    next_node_id = node_id + 1
+
+            node = Node(
+                id=node_id,
+                x=x,
+                y=y,
+                z=z,
+                restraint=restraint if restraint is not None else FREE,
+            )
+            created[node_id] = node
+            if grid is not None:
+                grid.add(node)
+
+        self._nodes.update(created)
+        self._next_node_id = next_node_id
+
+        return list(created.values())
+
     def remove_node(self, node_id: int) -> Node:
         """
         Remove a node from the model.
@@ -392,6 +492,92 @@ class StructuralModel:
         self._frames[frame_id] = frame
         return frame
 
+    def add_frames(
+        self,
+        frames: Iterable[tuple[int, int, str, str, float, int | None, str]],
+    ) -> list[Frame]:
+        """
+        Add many frames in one batch.
+
+        Equivalent to calling add_frame for each entry, but the duplicate
+        check uses a set of connected node pairs built once for the batch
+        instead of scanning every frame per entry, and the batch is
+        all-or-nothing: if any entry is rejected, no frame is added.
+
+        Args:
+            frames: Entries of (node_i_id, node_j_id, material_name,
+                section_name, rotation, frame_id, label); frame_id may be
+                None as in add_frame
+
+        Returns:
+            The created frames, in input order
+
+        Raises:
+            ValidationError: If max frames exceeded or invalid parameters
+            NodeError: If nodes don't exist
+            FrameError: If a frame is too short or already exists
+        """
+        entries = list(frames)
+
+        # Check limit
+        if self.frame_count + len(entries) > MAX_FRAMES:
+            raise ValidationError(
+                f"Maximum number of frames ({MAX_FRAMES}) exceeded",
+                field="frames",
+            )
+
+        connected = {
+            frozenset((f.node_i_id, f.node_j_id)): f.id for f in self._frames.values()
+        }
+        next_frame_id = self._next_frame_id
+        created: dict[int, Frame] = {}
+
+        for node_i_id, node_j_id, material_name, section_name, rotation, frame_id, label in entries:
+            # Validate nodes exist
+            node_i = self.get_node(node_i_id)
+            node_j = self.get_node(node_j_id)
+
+            # Validate length
+            validate_frame_length(node_i, node_j)
+
+            # Check for duplicate frame (against the model and earlier entries)
+            pair = frozenset((node_i_id, node_j_id))
+            if pair in connected:
+                raise FrameError(
+                    f"Frame already exists between nodes {node_i_id} and {node_j_id}",
+                    frame_id=connected[pair],
+                )
+
+            # Determine ID
+            if frame_id is None:
+                frame_id = next_frame_id
+                next_frame_id += 1
+            else:
+                if frame_id in self._frames or frame_id in created:
+                    raise FrameError(f"Frame ID {frame_id} already exists", frame_id=frame_id)
+                if frame_id >= next_frame_id:
+                    next_frame_id = frame_id + 1
+
+            frame = Frame(
+                id=frame_id,
+                node_i_id=node_i_id,
+                node_j_id=node_j_id,
+                material_name=material_name,
+                section_name=section_name,
+                rotation=rotation,
+                releases=FrameReleases(),
+                label=label,
+            )
+            frame.set_nodes(node_i, node_j)
+
+            created[frame_id] = frame
+            connected[pair] = frame_id
+
+        self._frames.update(created)
+        self._next_frame_id = next_frame_id
+
+        return list(created.values())
+
     def remove_frame(self, frame_id: int) -> Frame:
         """
         Remove a frame from the model.
@@ -496,6 +682,42 @@ class StructuralModel:
         """Iterate over all frames."""
         return iter(self._frames.values())
 
+    def coordinate_tables(self) -> CoordinateTables:
+        """
+        Get node coordinates and frame connectivity as arrays.
+
+        The tables are built on every call, since nodes can be moved in
+        place (Node.move_to) without the model seeing it; gather them once
+        per operation rather than once per frame.
+
+        Returns:
+            Coordinate tables of the current model state
+        """
+        node_ids = list(self._nodes)
+        nodes_xyz = np.array(
+            [(node.x, node.y, node.z) for node in self._nodes.values()],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        node_id_to_row = {node_id: row for row, node_id in enumerate(node_ids)}
+
+        frame_ids: list[int] = []
+        frame_rows: list[tuple[int, int]] = []
+        for frame in self._frames.values():
+            row_i = node_id_to_row.get(frame.node_i_id)
+            row_j = node_id_to_row.get(frame.node_j_id)
+            if row_i is not None and row_j is not None:
+                frame_ids.append(frame.id)
+                frame_rows.append((row_i, row_j))
+        frames_ij = np.array(frame_rows, dtype=np.int64).reshape(-1, 2)
+
+        return CoordinateTables(
+            node_ids=node_ids,
+            nodes_xyz=nodes_xyz,
+            node_id_to_row=node_id_to_row,
+            frame_ids=frame_ids,
+            frames_ij=frames_ij,
+        )
+
     # Shell operations
 
     @property
@@ -4,15 +4,26 @@ Analysis results container.
 Holds all results from a structural analysis for a specific load case.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 from uuid import UUID, uuid4
 
+import numpy as np
+from numpy.typing import NDArray
+
 from paz.domain.results.frame_results import FrameResult
 from paz.domain.results.nodal_results import NodalDisplacement, NodalReaction
 
 
+# Component readers for the struct-of-arrays views
+_DISPLACEMENT_COMPONENTS = attrgetter("Ux", "Uy", "Uz", "Rx", "Ry", "Rz")
+_REACTION_COMPONENTS = attrgetter("Fx", "Fy", "Fz", "Mx", "My", "Mz")
+
+
 @dataclass
 class AnalysisResults:
     """
@@ -39,6 +50,10 @@ class AnalysisResults:
     analysis_time_seconds: float = 0.0
     iterations: int = 0
 
+    # Bumped by add_displacement, so caches of derived displacement data
+    # can tell that the same results object has new values
+    displacement_revision: int = field(default=0, init=False, repr=False, compare=False)
+
     def get_displacement(self, node_id: int) -> NodalDisplacement | None:
         """Get displacement for a specific node."""
         return self.displacements.get(node_id)
@@ -68,6 +83,7 @@ class AnalysisResults:
     def add_displacement(self, disp: NodalDisplacement) -> None:
         """Add a nodal displacement result."""
         self.displacements[disp.node_id] = disp
+        self.displacement_revision += 1
 
     def add_reaction(self, reaction: NodalReaction) -> None:
         """Add a nodal reaction result."""
@@ -77,6 +93,26 @@ class AnalysisResults:
         """Add a frame result."""
         self.frame_results[result.frame_id] = result
 
+    def displacement_array(self) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """
+        Nodal displacements as struct-of-arrays.
+
+        Returns:
+            Tuple of (node_ids, values); values has shape (n, 6) with
+            columns Ux, Uy, Uz, Rx, Ry, Rz, rows in insertion order
+        """
+        return _to_arrays(self.displacements, _DISPLACEMENT_COMPONENTS)
+
+    def reaction_array(self) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """
+        Support reactions as struct-of-arrays.
+
+        Returns:
+            Tuple of (node_ids, values); values has shape (n, 6) with
+            columns Fx, Fy, Fz, Mx, My, Mz, rows in insertion order
+        """
+        return _to_arrays(self.reactions, _REACTION_COMPONENTS)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -135,3 +171,17 @@ def create_failed_result(load_case_id: UUID, error: str) -> AnalysisResults:
         success=False,
         error_message=error,
     )
+
+
+def _to_arrays(
+    records: dict[int, Any], components: Callable[[Any], tuple[float, ...]]
+) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+    """Pack id-keyed nodal records into an id array and an (n, 6) value array."""
+    n = len(records)
+    ids = np.fromiter(records.keys(), dtype=np.int64, count=n)
+    values = np.fromiter(
+        chain.from_iterable(map(components, records.values())),
+        dtype=np.float64,
+        count=6 * n,
+    ).reshape(n, 6)
+    return ids, values
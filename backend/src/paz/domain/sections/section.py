@@ -7,6 +7,7 @@ Properties follow AISC notation and SI units (m, m², m⁴).
 
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -42,6 +43,54 @@ class SectionStandard(str, Enum):
     CUSTOM = "Custom"
 
 
+# Direct value -> member maps for hot deserialization paths; avoids the
+# EnumMeta.__call__ dispatch of SectionShape(value)/SectionStandard(value)
+_SHAPE_BY_VALUE: dict[str, SectionShape] = {m.value: m for m in SectionShape}
+_STANDARD_BY_VALUE: dict[str, SectionStandard] = {m.value: m for m in SectionStandard}
+
+
+def _parse_shape(value: str) -> SectionShape:
+    """Resolve a serialized shape value, raising ValueError if unknown."""
+    shape = _SHAPE_BY_VALUE.get(value)
+    return shape if shape is not None else SectionShape(value)
+
+
+def _parse_standard(value: str) -> SectionStandard:
+    """Resolve a serialized standard value, raising ValueError if unknown."""
+    standard = _STANDARD_BY_VALUE.get(value)
+    return standard if standard is not None else SectionStandard(value)
+
+
+# Serialized field order for Section.to_dict; read in one attrgetter call
+_DICT_FIELDS = (
+    "id",
+    "name",
+    "shape",
+    "standard",
+    "A",
+    "Ix",
+    "Iy",
+    "Sx",
+    "Sy",
+    "Zx",
+    "Zy",
+    "rx",
+    "ry",
+    "J",
+    "Cw",
+    "d",
+    "bf",
+    "tw",
+    "tf",
+    "t",
+    "OD",
+    "W",
+    "description",
+    "is_custom",
+)
+_get_dict_fields = attrgetter(*_DICT_FIELDS)
+
+
 @dataclass
 class Section:
     """
@@ -163,15 +212,23 @@ class Section:
                 field="Iy",
             )
 
-        # Validate optional positive properties
-        positive_fields = ["Sx", "Sy", "Zx", "Zy", "rx", "ry", "J", "Cw", "d", "bf", "tw", "tf", "t", "OD", "W"]
-        for field_name in positive_fields:
-            value = getattr(self, field_name)
-            if value is not None and value <= 0:
-                raise ValidationError(
-                    f"{field_name} must be positive, got {value}",
-                    field=field_name,
-                )
+        # Validate optional positive properties (unrolled: direct attribute
+        # reads instead of a getattr() per field name)
+        _validate_optional_positive(self.Sx, "Sx")
+        _validate_optional_positive(self.Sy, "Sy")
+        _validate_optional_positive(self.Zx, "Zx")
+        _validate_optional_positive(self.Zy, "Zy")
+        _validate_optional_positive(self.rx, "rx")
+        _validate_optional_positive(self.ry, "ry")
+        _validate_optional_positive(self.J, "J")
+        _validate_optional_positive(self.Cw, "Cw")
+        _validate_optional_positive(self.d, "d")
+        _validate_optional_positive(self.bf, "bf")
+        _validate_optional_positive(self.tw, "tw")
+        _validate_optional_positive(self.tf, "tf")
+        _validate_optional_positive(self.t, "t")
+        _validate_optional_positive(self.OD, "OD")
+        _validate_optional_positive(self.W, "W")
 
     @property
     def rx_calculated(self) -> float:
@@ -189,32 +246,11 @@ class Section:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "shape": self.shape.value,
-            "standard": self.standard.value,
-            "A": self.A,
-            "Ix": self.Ix,
-            "Iy": self.Iy,
-            "Sx": self.Sx,
-            "Sy": self.Sy,
-            "Zx": self.Zx,
-            "Zy": self.Zy,
-            "rx": self.rx,
-            "ry": self.ry,
-            "J": self.J,
-            "Cw": self.Cw,
-            "d": self.d,
-            "bf": self.bf,
-            "tw": self.tw,
-            "tf": self.tf,
-            "t": self.t,
-            "OD": self.OD,
-            "W": self.W,
-            "description": self.description,
-            "is_custom": self.is_custom,
-        }
+        data = dict(zip(_DICT_FIELDS, _get_dict_fields(self), strict=True))
+        data["id"] = str(data["id"])
+        data["shape"] = data["shape"].value
+        data["standard"] = data["standard"].value
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Section":
@@ -222,8 +258,8 @@ class Section:
         return cls(
             id=UUID(data["id"]) if "id" in data else uuid4(),
             name=data["name"],
-            shape=SectionShape(data.get("shape", "CUSTOM")),
-            standard=SectionStandard(data.get("standard", "Custom")),
+            shape=_parse_shape(data.get("shape", "CUSTOM")),
+            standard=_parse_standard(data.get("standard", "Custom")),
             A=float(data["A"]),
             Ix=float(data["Ix"]),
             Iy=float(data["Iy"]),
@@ -284,6 +320,15 @@ class Section:
         )
 
 
+def _validate_optional_positive(value: float | None, name: str) -> None:
+    """Validate that an optional property is positive when provided."""
+    if value is not None and value <= 0:
+        raise ValidationError(
+            f"{name} must be positive, got {value}",
+            field=name,
+        )
+
+
 # Unit conversion helpers (AISC uses imperial, we store in SI)
 def in2_to_m2(in2: float) -> float:
     """Convert square inches to square meters."""
@@ -5,8 +5,13 @@ Creates T-shaped sections with automatic property calculation.
 """
 
 from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID, uuid4
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from paz.core.exceptions import ValidationError
 from paz.domain.sections.parametric import (
     ParametricSection,
     _validate_positive,
@@ -67,6 +72,70 @@ class TSection(ParametricSection):
                 f"Stem thickness ({self.tw}) should be less than flange width ({self.bf})"
             )
 
+    @classmethod
+    def batch(
+        cls,
+        d: ArrayLike,
+        bf: ArrayLike,
+        tf: ArrayLike,
+        tw: ArrayLike,
+    ) -> dict[str, NDArray[np.float64]]:
+        """
+        Calculate properties for many T-sections at once.
+
+        Intended for parametric sweeps: dimensions are broadcast against
+        each other and every property is evaluated with array operations
+        instead of instantiating one TSection per combination.
+
+        Args:
+            d: Total depths (m)
+            bf: Flange widths (m)
+            tf: Flange thicknesses (m)
+            tw: Stem thicknesses (m)
+
+        Returns:
+            Dictionary mapping property names (A, Ix, Iy, J, Sx, Sy, Zx,
+            Zy, rx, ry) to arrays of the broadcast shape
+        """
+        d, bf, tf, tw = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (d, bf, tf, tw))
+        )
+        for values, name in (
+            (d, "d (depth)"),
+            (bf, "bf (flange width)"),
+            (tf, "tf (flange thickness)"),
+            (tw, "tw (stem thickness)"),
+        ):
+            if np.any(values <= 0):
+                raise ValidationError(f"{name} must be positive", field=name)
+
+        hs = d - tf
+        if np.any(hs <= 0):
+            raise ValueError("Stem height (d - tf) must be positive for all sections")
+        if np.any(tw >= bf):
+            raise ValueError(
+                "Stem thickness (tw) should be less than flange width (bf) "
+                "for all sections"
+            )
+
+        A = _tsection_A(d, bf, tf, tw)
+        yc, Ix = _tsection_centroid_y_and_Ix(d, bf, tf, tw)
+        Iy = _tsection_Iy(d, bf, tf, tw)
+        Sx = _tsection_Sx(d, yc, Ix)
+
+        return {
+            "A": A,
+            "Ix": Ix,
+            "Iy": Iy,
+            "J": _tsection_J(d, bf, tf, tw),
+            "Sx": Sx,
+            "Sy": _tsection_Sy(bf, Iy),
+            "Zx": _tsection_Zx(Sx),
+            "Zy": _tsection_Zy(d, bf, tf, tw),
+            "rx": np.sqrt(Ix / A),
+            "ry": np.sqrt(Iy / A),
+        }
+
     def _get_shape(self) -> SectionShape:
         return SectionShape.WT
 
@@ -86,15 +155,7 @@ class TSection(ParametricSection):
     @property
     def _centroid_y(self) -> float:
         """Y-coordinate of centroid from bottom of stem."""
-        # Flange area
-        Af = self.bf * self.tf
-        yf = self.d - self.tf / 2  # Distance to flange centroid from bottom
-
-        # Stem area
-        As = self.hs * self.tw
-        ys = self.hs / 2  # Distance to stem centroid from bottom
-
-        return (Af * yf + As * ys) / (Af + As)
+        return float(_tsection_centroid_y(self.d, self.bf, self.tf, self.tw))
 
     def _calculate_A(self) -> float:
         """
@@ -102,7 +163,7 @@ class TSection(ParametricSection):
 
         A = bf * tf + hs * tw
         """
-        return self.bf * self.tf + self.hs * self.tw
+        return float(_tsection_A(self.d, self.bf, self.tf, self.tw))
 
     def _calculate_Ix(self) -> float:
         """
@@ -110,19 +171,7 @@ class TSection(ParametricSection):
 
         Uses parallel axis theorem for composite section.
         """
-        yc = self._centroid_y
-
-        # Flange contribution
-        Af = self.bf * self.tf
-        yf = self.d - self.tf / 2
-        Ix_flange = self.bf * self.tf**3 / 12 + Af * (yc - yf) ** 2
-
-        # Stem contribution
-        As = self.hs * self.tw
-        ys = self.hs / 2
-        Ix_stem = self.tw * self.hs**3 / 12 + As * (yc - ys) ** 2
-
-        return Ix_flange + Ix_stem
+        return float(_tsection_Ix(self.d, self.bf, self.tf, self.tw))
 
     def _calculate_Iy(self) -> float:
         """
@@ -130,7 +179,7 @@ class TSection(ParametricSection):
 
         Iy = tf * bf³ / 12 + hs * tw³ / 12
         """
-        return self.tf * self.bf**3 / 12 + self.hs * self.tw**3 / 12
+        return float(_tsection_Iy(self.d, self.bf, self.tf, self.tw))
 
     def _calculate_J(self) -> float:
         """
@@ -138,21 +187,31 @@ class TSection(ParametricSection):
 
         J ≈ (1/3) * (bf*tf³ + hs*tw³)
         """
-        return (self.bf * self.tf**3 + self.hs * self.tw**3) / 3
+        return float(_tsection_J(self.d, self.bf, self.tf, self.tw))
 
     def _get_extreme_fiber_x(self) -> float:
         """Distance from centroid to extreme fiber (x-axis)."""
         yc = self._centroid_y
         return max(yc, self.d - yc)
 
+    @property
+    def Sx(self) -> float:
+        """Elastic section modulus about x-axis (m³)."""
+        yc, Ix = _tsection_centroid_y_and_Ix(self.d, self.bf, self.tf, self.tw)
+        return float(_tsection_Sx(self.d, yc, Ix))
+
+    @property
+    def Sy(self) -> float:
+        """Elastic section modulus about y-axis (m³)."""
+        return float(_tsection_Sy(self.bf, self.Iy))
+
     def _get_extreme_fiber_y(self) -> float:
         """Distance from centroid to extreme fiber (y-axis)."""
         return self.bf / 2
 
     def _calculate_Zx(self) -> float:
         """Approximate plastic section modulus about x-axis."""
-        # Simplified approximation for non-symmetric section
-        return 1.3 * self.Sx
+        return float(_tsection_Zx(self.Sx))
 
     def _calculate_Zy(self) -> float:
         """
@@ -160,4 +219,75 @@ class TSection(ParametricSection):
 
         For symmetric section about y: Zy = tf*bf²/4 + hs*tw²/4
         """
-        return self.tf * self.bf**2 / 4 + self.hs * self.tw**2 / 4
+        return float(_tsection_Zy(self.d, self.bf, self.tf, self.tw))
+
+
+# Pure-arithmetic kernels shared by the per-instance properties and
+# TSection.batch. They only use element-wise operations, so they accept
+# either floats or NumPy arrays of dimensions.
+
+
+def _tsection_A(d: Any, bf: Any, tf: Any, tw: Any) -> Any:
+    """Area of a T-section: A = bf * tf + hs * tw."""
+    return bf * tf + (d - tf) * tw
+
+
+def _tsection_Iy(d: Any, bf: Any, tf: Any, tw: Any) -> Any:
+    """Moment of inertia about the symmetric y-axis: tf*bf³/12 + hs*tw³/12."""
+    return tf * bf**3 / 12 + (d - tf) * tw**3 / 12
+
+
+def _tsection_J(d: Any, bf: Any, tf: Any, tw: Any) -> Any:
+    """Approximate torsional constant: (bf*tf³ + hs*tw³) / 3."""
+    return (bf * tf**3 + (d - tf) * tw**3) / 3
+
+
+def _tsection_Sx(d: Any, yc: Any, Ix: Any) -> Any:
+    """Elastic modulus about x, using the farther of the two extreme fibers."""
+    return Ix / np.maximum(yc, d - yc)
+
+
+def _tsection_Sy(bf: Any, Iy: Any) -> Any:
+    """Elastic modulus about y, with the extreme fiber at the flange tip."""
+    return Iy / (bf / 2)
+
+
+def _tsection_Zx(Sx: Any) -> Any:
+    """Approximate plastic modulus about x (simplified for a non-symmetric section)."""
+    return 1.3 * Sx
+
+
+def _tsection_Zy(d: Any, bf: Any, tf: Any, tw: Any) -> Any:
+    """Plastic modulus about the symmetric y-axis: tf*bf²/4 + hs*tw²/4."""
+    return tf * bf**2 / 4 + (d - tf) * tw**2 / 4
+
+
+def _tsection_centroid_y(d: Any, bf: Any, tf: Any, tw: Any) -> Any:
+    """Y-coordinate of the T-section centroid from the bottom of the stem."""
+    return _tsection_centroid_y_and_Ix(d, bf, tf, tw)[0]
+
+
+def _tsection_Ix(d: Any, bf: Any, tf: Any, tw: Any) -> Any:
+    """Moment of inertia of a T-section about its centroidal x-axis."""
+    return _tsection_centroid_y_and_Ix(d, bf, tf, tw)[1]
+
+
+def _tsection_centroid_y_and_Ix(d: Any, bf: Any, tf: Any, tw: Any) -> tuple[Any, Any]:
+    """
+    Centroid height and centroidal Ix of a T-section.
+
+    The flange/stem areas and centroid distances are needed by both
+    results, so they are computed once here.
+    """
+    hs = d - tf
+    Af = bf * tf  # Flange area
+    yf = d - tf / 2  # Distance to flange centroid from bottom
+    As = hs * tw  # Stem area
+    ys = hs / 2  # Distance to stem centroid from bottom
+    yc = (Af * yf + As * ys) / (Af + As)
+
+    # Parallel axis theorem: flange + stem contributions
+    Ix_flange = bf * tf**3 / 12 + Af * (yc - yf) ** 2
+    Ix_stem = tw * hs**3 / 12 + As * (yc - ys) ** 2
+
+    return yc, Ix_flange + Ix_stem
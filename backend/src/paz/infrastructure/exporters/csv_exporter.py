@@ -7,21 +7,121 @@ Exports nodes, frames, materials, sections, and analysis results to CSV format.
 from __future__ import annotations
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import StringIO
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 from paz.core.logging_config import get_logger
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from paz.domain.model import StructuralModel
+    from paz.domain.model.restraint import Restraint
     from paz.domain.results import AnalysisResults
 
 
 logger = get_logger("csv_exporter")
 
 
+class _CSVDialect(csv.excel):
+    """Excel dialect with LF line endings instead of CRLF (one byte less per row)."""
+
+    lineterminator = "\n"
+
+
+# Numeric-only exports bypass csv.writer: no field ever needs quoting, so
+# rows are formatted directly. "{}" uses str(), which is what csv.writer
+# emits for ints and floats, and the terminator matches _CSVDialect.
+_LINE_END = _CSVDialect.lineterminator
+_format_node_row = ("{},{},{},{},{}" + _LINE_END).format
+_format_nodal_row = ("{},{},{},{},{},{},{}" + _LINE_END).format
+_format_force_row = ("{},{},{},{},{},{},{},{}" + _LINE_END).format
+
+# Header rows, written in the same call as the data rows
+_NODES_HEADER = "id,x,y,z,ux,uy,uz,rx,ry,rz" + _LINE_END
+_FRAMES_HEADER = ("id", "node_i", "node_j", "material", "section", "rotation", "label")
+_DISPLACEMENTS_HEADER = "node_id,Ux,Uy,Uz,Rx,Ry,Rz" + _LINE_END
+_REACTIONS_HEADER = "node_id,Fx,Fy,Fz,Mx,My,Mz" + _LINE_END
+_FRAME_FORCES_HEADER = "frame_id,station,P,V2,V3,T,M2,M3" + _LINE_END
+
+# Frame force columns after frame_id, read in one C-level call per row
+# (station = location along the frame as a 0-1 fraction)
+_force_values = attrgetter("location", "P", "V2", "V3", "T", "M2", "M3")
+
+# Buffer size for file exports (the default is 8 KiB): fewer write() calls
+_FILE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=64)
+def _restraint_columns(restraint: Restraint) -> str:
+    """
+    Restraint flags as CSV columns (1=fixed, 0=free).
+
+    Restraints are frozen and most nodes share a few distinct values, so
+    the six bool->int conversions are done once per distinct restraint.
+    """
+    return ",".join(str(int(flag)) for flag in restraint.to_list())
+
+
+def _export(filepath: str | Path | None, write: Callable[[TextIO], None]) -> str:
+    """
+    Run a CSV writer against a file, or an in-memory buffer.
+
+    With a filepath, rows are streamed straight into the file instead of
+    being built in a StringIO first, so the CSV is never held in memory.
+
+    Args:
+        filepath: Output file path (None writes to a string)
+        write: Function writing the CSV header and rows to a text sink
+
+    Returns:
+        CSV content as string, or "" when written to filepath
+    """
+    if not filepath:
+        output = StringIO()
+        write(output)
+        return output.getvalue()
+
+    with Path(filepath).open("w", newline="", buffering=_FILE_BUFFER_SIZE) as f:
+        write(f)
+    return ""
+
+
+def _export_files(
+    output_dir: Path,
+    exports: dict[str, tuple[str, Callable[[Path], str]]],
+) -> dict[str, Path]:
+    """
+    Run independent file exports concurrently.
+
+    Each export writes its own file, so they share no state; running them
+    on a thread pool overlaps formatting in one with file I/O in another.
+
+    Args:
+        output_dir: Directory for output files
+        exports: Mapping of data type to (file name, export method)
+
+    Returns:
+        Dictionary mapping data type to file path
+    """
+    files = {key: output_dir / filename for key, (filename, _) in exports.items()}
+
+    with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+        futures = [
+            executor.submit(export, files[key]) for key, (_, export) in exports.items()
+        ]
+        for future in futures:
+            future.result()  # Re-raise any export error
+
+    return files
+
+
 class CSVExporter:
     """
     Export structural model data to CSV files.
@@ -49,41 +149,31 @@ class CSVExporter:
             filepath: Output file path (None returns string)
 
         Returns:
-            CSV content as string
+            CSV content as string ("" when written to filepath)
 
         CSV columns: id, x, y, z, ux, uy, uz, rx, ry, rz
         (restraints: 1=fixed, 0=free)
         """
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["id", "x", "y", "z", "ux", "uy", "uz", "rx", "ry", "rz"])
-
-        # Data
-        for node in self._model.nodes:
-            r = node.restraint
-            writer.writerow([
-                node.id,
-                node.x,
-                node.y,
-                node.z,
-                1 if r.ux else 0,
-                1 if r.uy else 0,
-                1 if r.uz else 0,
-                1 if r.rx else 0,
-                1 if r.ry else 0,
-                1 if r.rz else 0,
-            ])
-
-        content = output.getvalue()
+        content = _export(filepath, self._write_nodes)
 
         if filepath:
-            Path(filepath).write_text(content)
             logger.info(f"Exported {self._model.node_count} nodes to {filepath}")
 
         return content
 
+    def _write_nodes(self, output: TextIO) -> None:
+        """Write the nodes CSV to a text sink."""
+        # Header + data (numeric only: formatted directly, no csv quoting needed)
+        output.writelines(chain(
+            (_NODES_HEADER,),
+            (
+                _format_node_row(
+                    node.id, node.x, node.y, node.z, _restraint_columns(node.restraint)
+                )
+                for node in self._model.nodes
+            ),
+        ))
+
     def export_frames(self, filepath: str | Path | None = None) -> str:
         """
         Export frames to CSV.
@@ -92,38 +182,38 @@ class CSVExporter:
             filepath: Output file path (None returns string)
 
         Returns:
-            CSV content as string
+            CSV content as string ("" when written to filepath)
 
         CSV columns: id, node_i, node_j, material, section, rotation, label
         """
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            "id", "node_i", "node_j", "material", "section", "rotation", "label"
-        ])
-
-        # Data
-        for frame in self._model.frames:
-            writer.writerow([
-                frame.id,
-                frame.node_i_id,
-                frame.node_j_id,
-                frame.material_name,
-                frame.section_name,
-                frame.rotation,
-                frame.label,
-            ])
-
-        content = output.getvalue()
+        content = _export(filepath, self._write_frames)
 
         if filepath:
-            Path(filepath).write_text(content)
             logger.info(f"Exported {self._model.frame_count} frames to {filepath}")
 
         return content
 
+    def _write_frames(self, output: TextIO) -> None:
+        """Write the frames CSV to a text sink."""
+        writer = csv.writer(output, dialect=_CSVDialect)
+
+        # Header + data in a single writerows call
+        writer.writerows(chain(
+            (_FRAMES_HEADER,),
+            (
+                (
+                    frame.id,
+                    frame.node_i_id,
+                    frame.node_j_id,
+                    frame.material_name,
+                    frame.section_name,
+                    frame.rotation,
+                    frame.label,
+                )
+                for frame in self._model.frames
+            ),
+        ))
+
     def export_all(self, output_dir: str | Path) -> dict[str, Path]:
         """
         Export all model data to separate CSV files.
@@ -137,17 +227,13 @@ class CSVExporter:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        files: dict[str, Path] = {}
-
-        # Export nodes
-        nodes_file = output_dir / "nodes.csv"
-        self.export_nodes(nodes_file)
-        files["nodes"] = nodes_file
-
-        # Export frames
-        frames_file = output_dir / "frames.csv"
-        self.export_frames(frames_file)
-        files["frames"] = frames_file
+        files = _export_files(
+            output_dir,
+            {
+                "nodes": ("nodes.csv", self.export_nodes),
+                "frames": ("frames.csv", self.export_frames),
+            },
+        )
 
         logger.info(f"Exported model to {output_dir}")
 
@@ -176,36 +262,30 @@ class ResultsExporter:
             filepath: Output file path (None returns string)
 
         Returns:
-            CSV content as string
+            CSV content as string ("" when written to filepath)
 
         CSV columns: node_id, Ux, Uy, Uz, Rx, Ry, Rz
         """
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["node_id", "Ux", "Uy", "Uz", "Rx", "Ry", "Rz"])
-
-        # Data
-        for disp in self._results.displacements:
-            writer.writerow([
-                disp.node_id,
-                disp.Ux,
-                disp.Uy,
-                disp.Uz,
-                disp.Rx,
-                disp.Ry,
-                disp.Rz,
-            ])
-
-        content = output.getvalue()
+        content = _export(filepath, self._write_displacements)
 
         if filepath:
-            Path(filepath).write_text(content)
             logger.info(f"Exported displacements to {filepath}")
 
         return content
 
+    def _write_displacements(self, output: TextIO) -> None:
+        """Write the displacements CSV to a text sink."""
+        # Header + data
+        output.writelines(chain(
+            (_DISPLACEMENTS_HEADER,),
+            (
+                _format_nodal_row(
+                    disp.node_id, disp.Ux, disp.Uy, disp.Uz, disp.Rx, disp.Ry, disp.Rz
+                )
+                for disp in self._results.displacements.values()
+            ),
+        ))
+
     def export_reactions(self, filepath: str | Path | None = None) -> str:
         """
         Export support reactions to CSV.
@@ -214,36 +294,28 @@ class ResultsExporter:
             filepath: Output file path (None returns string)
 
         Returns:
-            CSV content as string
+            CSV content as string ("" when written to filepath)
 
         CSV columns: node_id, Fx, Fy, Fz, Mx, My, Mz
         """
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["node_id", "Fx", "Fy", "Fz", "Mx", "My", "Mz"])
-
-        # Data
-        for reaction in self._results.reactions:
-            writer.writerow([
-                reaction.node_id,
-                reaction.Fx,
-                reaction.Fy,
-                reaction.Fz,
-                reaction.Mx,
-                reaction.My,
-                reaction.Mz,
-            ])
-
-        content = output.getvalue()
+        content = _export(filepath, self._write_reactions)
 
         if filepath:
-            Path(filepath).write_text(content)
             logger.info(f"Exported reactions to {filepath}")
 
         return content
 
+    def _write_reactions(self, output: TextIO) -> None:
+        """Write the reactions CSV to a text sink."""
+        # Header + data
+        output.writelines(chain(
+            (_REACTIONS_HEADER,),
+            (
+                _format_nodal_row(r.node_id, r.Fx, r.Fy, r.Fz, r.Mx, r.My, r.Mz)
+                for r in self._results.reactions.values()
+            ),
+        ))
+
     def export_frame_forces(self, filepath: str | Path | None = None) -> str:
         """
         Export frame internal forces to CSV.
@@ -252,38 +324,30 @@ class ResultsExporter:
             filepath: Output file path (None returns string)
 
         Returns:
-            CSV content as string
+            CSV content as string ("" when written to filepath)
 
         CSV columns: frame_id, station, P, V2, V3, T, M2, M3
         """
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["frame_id", "station", "P", "V2", "V3", "T", "M2", "M3"])
-
-        # Data
-        for frame_result in self._results.frame_results:
-            for forces in frame_result.forces:
-                writer.writerow([
-                    frame_result.frame_id,
-                    forces.station,
-                    forces.P,
-                    forces.V2,
-                    forces.V3,
-                    forces.T,
-                    forces.M2,
-                    forces.M3,
-                ])
-
-        content = output.getvalue()
+        content = _export(filepath, self._write_frame_forces)
 
         if filepath:
-            Path(filepath).write_text(content)
             logger.info(f"Exported frame forces to {filepath}")
 
         return content
 
+    def _write_frame_forces(self, output: TextIO) -> None:
+        """Write the frame forces CSV to a text sink."""
+        # Header
+        output.write(_FRAME_FORCES_HEADER)
+
+        # Data (frame_id hoisted out of the per-station loop)
+        for frame_result in self._results.frame_results.values():
+            frame_id = frame_result.frame_id
+            output.writelines(
+                _format_force_row(frame_id, *_force_values(forces))
+                for forces in frame_result.forces
+            )
+
     def export_all(self, output_dir: str | Path) -> dict[str, Path]:
         """
         Export all results to separate CSV files.
@@ -297,22 +361,14 @@ class ResultsExporter:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        files: dict[str, Path] = {}
-
-        # Displacements
-        disp_file = output_dir / "displacements.csv"
-        self.export_displacements(disp_file)
-        files["displacements"] = disp_file
-
-        # Reactions
-        reactions_file = output_dir / "reactions.csv"
-        self.export_reactions(reactions_file)
-        files["reactions"] = reactions_file
-
-        # Frame forces
-        forces_file = output_dir / "frame_forces.csv"
-        self.export_frame_forces(forces_file)
-        files["frame_forces"] = forces_file
+        files = _export_files(
+            output_dir,
+            {
+                "displacements": ("displacements.csv", self.export_displacements),
+                "reactions": ("reactions.csv", self.export_reactions),
+                "frame_forces": ("frame_forces.csv", self.export_frame_forces),
+            },
+        )
 
         logger.info(f"Exported results to {output_dir}")
 
@@ -8,12 +8,12 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 from paz.core.exceptions import ValidationError
 from paz.core.logging_config import get_logger
 from paz.domain.model import StructuralModel
-from paz.domain.model.restraint import Restraint
+from paz.domain.model.restraint import FREE, Restraint
 
 
 if TYPE_CHECKING:
@@ -22,6 +22,9 @@ if TYPE_CHECKING:
 
 logger = get_logger("csv_importer")
 
+# Strings accepted as "true" in restraint columns (case-insensitive)
+_TRUE_VALUES = frozenset({"1", "true", "yes", "t", "y"})
+
 
 class CSVImporter:
     """
@@ -59,46 +62,51 @@ class CSVImporter:
         Expected CSV columns: id, x, y, z, [ux, uy, uz, rx, ry, rz]
         Restraint columns are optional (default: all free)
         """
-        filepath = Path(filepath)
-        if not filepath.exists():
-            raise ValidationError(f"File not found: {filepath}", field="filepath")
-
-        count = 0
-
-        with filepath.open(newline="") as f:
-            reader = csv.DictReader(f)
+        entries: list[tuple[float, float, float, Restraint, int]] = []
+
+        with _open_csv(filepath) as f:
+            reader = csv.reader(f)
+            columns = _header_columns(next(reader, []))
+
+            # Resolve column positions once; rows are then indexed positionally
+            try:
+                id_col, x_col, y_col, z_col = (columns[name] for name in ("id", "x", "y", "z"))
+            except KeyError as e:
+                logger.warning(f"Missing required column {e} in {filepath}")
+                return 0
+            restraint_cols = [
+                columns.get(name) for name in ("ux", "uy", "uz", "rx", "ry", "rz")
+            ]
+            has_restraints = any(col is not None for col in restraint_cols)
+            parse_bool = _parse_bool
 
             for row in reader:
                 try:
-                    node_id = int(row["id"])
-                    x = float(row["x"])
-                    y = float(row["y"])
-                    z = float(row["z"])
-
-                    # Parse restraints if present
-                    restraint = Restraint(
-                        ux=self._parse_bool(row.get("ux", "0")),
-                        uy=self._parse_bool(row.get("uy", "0")),
-                        uz=self._parse_bool(row.get("uz", "0")),
-                        rx=self._parse_bool(row.get("rx", "0")),
-                        ry=self._parse_bool(row.get("ry", "0")),
-                        rz=self._parse_bool(row.get("rz", "0")),
-                    )
-
-                    self._model.add_node(
-                        x=x,
-                        y=y,
-                        z=z,
-                        restraint=restraint,
-                        node_id=node_id,
-                        check_duplicate=True,
-                    )
-                    count += 1
-
-                except (KeyError, ValueError) as e:
+                    node_id = int(row[id_col])
+                    x = float(row[x_col])
+                    y = float(row[y_col])
+                    z = float(row[z_col])
+
+                    # Parse restraints if present; unrestrained nodes share
+                    # the frozen FREE instance instead of allocating one each
+                    restraint = FREE
+                    if has_restraints:
+                        flags = [
+                            parse_bool(row[col]) if col is not None else False
+                            for col in restraint_cols
+                        ]
+                        if any(flags):
+                            restraint = Restraint(*flags)
+
+                    entries.append((x, y, z, restraint, node_id))
+
+                except (IndexError, ValueError) as e:
                     logger.warning(f"Skipping invalid row: {row} - {e}")
                     continue
 
+        # Add all parsed rows in one batch (single duplicate-check index)
+        count = len(self._model.add_nodes(entries, check_duplicate=True))
+
         logger.info(f"Imported {count} nodes from {filepath}")
         return count
 
@@ -114,40 +122,45 @@ class CSVImporter:
 
         Expected CSV columns: id, node_i, node_j, material, section, [rotation, label]
         """
-        filepath = Path(filepath)
-        if not filepath.exists():
-            raise ValidationError(f"File not found: {filepath}", field="filepath")
-
-        count = 0
-
-        with filepath.open(newline="") as f:
-            reader = csv.DictReader(f)
+        entries: list[tuple[int, int, str, str, float, int, str]] = []
+
+        with _open_csv(filepath) as f:
+            reader = csv.reader(f)
+            columns = _header_columns(next(reader, []))
+
+            # Resolve column positions once; rows are then indexed positionally
+            try:
+                id_col, node_i_col, node_j_col, material_col, section_col = (
+                    columns[name]
+                    for name in ("id", "node_i", "node_j", "material", "section")
+                )
+            except KeyError as e:
+                logger.warning(f"Missing required column {e} in {filepath}")
+                return 0
+            rotation_col = columns.get("rotation")
+            label_col = columns.get("label")
 
             for row in reader:
                 try:
-                    frame_id = int(row["id"])
-                    node_i_id = int(row["node_i"])
-                    node_j_id = int(row["node_j"])
-                    material = row["material"]
-                    section = row["section"]
-                    rotation = float(row.get("rotation", "0"))
-                    label = row.get("label", "")
-
-                    self._model.add_frame(
-                        node_i_id=node_i_id,
-                        node_j_id=node_j_id,
-                        material_name=material,
-                        section_name=section,
-                        rotation=rotation,
-                        frame_id=frame_id,
-                        label=label,
+                    frame_id = int(row[id_col])
+                    node_i_id = int(row[node_i_col])
+                    node_j_id = int(row[node_j_col])
+                    material = row[material_col]
+                    section = row[section_col]
+                    rotation = float(row[rotation_col]) if rotation_col is not None else 0.0
+                    label = row[label_col] if label_col is not None else ""
+
+                    entries.append(
+                        (node_i_id, node_j_id, material, section, rotation, frame_id, label)
                     )
-                    count += 1
 
-                except (KeyError, ValueError) as e:
+                except (IndexError, ValueError) as e:
                     logger.warning(f"Skipping invalid row: {row} - {e}")
                     continue
 
+        # Add all parsed rows in one batch (single duplicate-check index)
+        count = len(self._model.add_frames(entries))
+
         logger.info(f"Imported {count} frames from {filepath}")
         return count
 
@@ -178,10 +191,32 @@ class CSVImporter:
 
         return counts
 
-    @staticmethod
-    def _parse_bool(value: str) -> bool:
-        """Parse boolean from string (1/0, true/false, yes/no)."""
-        return value.lower() in ("1", "true", "yes", "t", "y")
+
+def _parse_bool(value: str) -> bool:
+    """Parse boolean from string (1/0, true/false, yes/no)."""
+    # Exact match first: skips the lower() copy for the usual "1"/"true"
+    return value in _TRUE_VALUES or value.lower() in _TRUE_VALUES
+
+
+def _open_csv(filepath: str | Path) -> TextIO:
+    """
+    Open a CSV file for reading.
+
+    A missing file surfaces from open() itself, so no separate exists()
+    check (an extra stat call) is needed.
+
+    Raises:
+        ValidationError: If the file does not exist
+    """
+    try:
+        return Path(filepath).open(newline="")
+    except FileNotFoundError as e:
+        raise ValidationError(f"File not found: {filepath}", field="filepath") from e
+
+
+def _header_columns(header: list[str]) -> dict[str, int]:
+    """Map CSV header names to their column positions."""
+    return {name: i for i, name in enumerate(header)}
 
 
 def import_model_from_csv(
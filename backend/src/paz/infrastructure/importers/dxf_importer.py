@@ -6,14 +6,18 @@ Converts LINE entities from DXF files into nodes and frames.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import pairwise
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 from paz.core.constants import NODE_DUPLICATE_TOLERANCE
 from paz.core.exceptions import ValidationError
 from paz.core.logging_config import get_logger
-from paz.domain.model import StructuralModel
+from paz.domain.model import Node, NodeGrid, StructuralModel
 
 
 if TYPE_CHECKING:
@@ -74,6 +78,19 @@ class DXFImporter:
         self._model = model if model is not None else StructuralModel()
         self._settings = settings if settings is not None else DXFImportSettings()
 
+        # Layer filter as a set for O(1) membership (None = all layers)
+        layers = self._settings.layers
+        self._layers = frozenset(layers) if layers is not None else None
+
+        # Axis mapping resolved once to DXF coordinate indexes (x=0, y=1, z=2)
+        self._axis_order = tuple("xyz".index(axis) for axis in self._settings.axis_map)
+        self._scale = self._settings.scale
+
+        # Lookup indexes for node merging and frame de-duplication, built
+        # lazily from the model so each line is O(1) instead of O(N)
+        self._node_grid: NodeGrid | None = None
+        self._frame_pairs: set[frozenset[int]] | None = None
+
     @property
     def model(self) -> StructuralModel:
         """Get the structural model."""
@@ -99,6 +116,7 @@ class DXFImporter:
         """
         try:
             import ezdxf
+            from ezdxf.entities import Line, LWPolyline, Polyline
         except ImportError as e:
             raise ValidationError(
                 "ezdxf library required for DXF import. "
@@ -106,83 +124,54 @@ class DXFImporter:
                 field="dependency",
             ) from e
 
-        filepath = Path(filepath)
-        if not filepath.exists():
-            raise ValidationError(f"File not found: {filepath}", field="filepath")
-
         try:
             doc = ezdxf.readfile(str(filepath))
+        except FileNotFoundError as e:
+            raise ValidationError(f"File not found: {filepath}", field="filepath") from e
         except Exception as e:
             raise ValidationError(f"Failed to read DXF file: {e}", field="filepath") from e
 
         # Get modelspace entities
         msp = doc.modelspace()
 
+        # Re-index the model in case it changed since the last import
+        self._node_grid = None
+        self._frame_pairs = None
+
         nodes_created = 0
         frames_created = 0
 
-        # Process LINE entities
-        for entity in msp.query("LINE"):
-            if not self._layer_allowed(entity.dxf.layer):
+        # Single pass over modelspace, dispatching on entity type. Without a
+        # layer filter the per-entity layer lookup is skipped entirely.
+        layers = self._layers
+        for entity in msp:
+            if not isinstance(entity, (Line, LWPolyline, Polyline)):
                 continue
-
-            start = self._transform_point(entity.dxf.start)
-            end = self._transform_point(entity.dxf.end)
-
-            result = self._create_frame_from_line(start, end)
-            if result:
-                nodes_created += result[0]
-                frames_created += result[1]
-
-        # Process LWPOLYLINE entities (2D polylines)
-        for entity in msp.query("LWPOLYLINE"):
-            if not self._layer_allowed(entity.dxf.layer):
+            if layers is not None and entity.dxf.layer not in layers:
                 continue
 
-            points = list(entity.get_points(format="xyz"))
-            for i in range(len(points) - 1):
-                start = self._transform_point(points[i])
-                end = self._transform_point(points[i + 1])
+            if isinstance(entity, Line):
+                start = self._transform_point(entity.dxf.start)
+                end = self._transform_point(entity.dxf.end)
 
                 result = self._create_frame_from_line(start, end)
                 if result:
                     nodes_created += result[0]
                     frames_created += result[1]
-
-            # Handle closed polylines
-            if entity.closed and len(points) > 2:
-                start = self._transform_point(points[-1])
-                end = self._transform_point(points[0])
-
-                result = self._create_frame_from_line(start, end)
-                if result:
-                    nodes_created += result[0]
-                    frames_created += result[1]
-
-        # Process POLYLINE entities (3D polylines)
-        for entity in msp.query("POLYLINE"):
-            if not self._layer_allowed(entity.dxf.layer):
                 continue
 
-            points = [v.dxf.location for v in entity.vertices]
-            for i in range(len(points) - 1):
-                start = self._transform_point(points[i])
-                end = self._transform_point(points[i + 1])
-
-                result = self._create_frame_from_line(start, end)
-                if result:
-                    nodes_created += result[0]
-                    frames_created += result[1]
+            if isinstance(entity, LWPolyline):
+                # 2D polylines
+                points = list(entity.get_points(format="xyz"))
+                closed = entity.closed
+            else:
+                # 3D polylines
+                points = [v.dxf.location for v in entity.vertices]
+                closed = entity.is_closed
 
-            # Handle closed polylines
-            if entity.is_closed and len(points) > 2:
-                start = self._transform_point(points[-1])
-                end = self._transform_point(points[0])
-
-                result = self._create_frame_from_line(start, end)
-                if result:
-                    nodes_created += result[0]
-                    frames_created += result[1]
+            new_nodes, new_frames = self._create_frames_from_polyline(points, closed)
+            nodes_created += new_nodes
+            frames_created += new_frames
 
         logger.info(
             f"Imported from {filepath}: {nodes_created} nodes, {frames_created} frames"
@@ -190,34 +179,60 @@ class DXFImporter:
 
         return {"nodes": nodes_created, "frames": frames_created}
 
-    def _layer_allowed(self, layer: str) -> bool:
-        """Check if layer should be imported."""
-        if self._settings.layers is None:
-            return True
-        return layer in self._settings.layers
-
     def _transform_point(
         self, point: tuple[float, float, float] | object
     ) -> tuple[float, float, float]:
         """Apply scale and axis mapping to a point."""
         # Handle ezdxf Vec3 objects
         if hasattr(point, "x"):
-            px, py, pz = point.x, point.y, point.z
+            coords = (point.x, point.y, point.z)
         else:
-            px, py, pz = point[0], point[1], point[2] if len(point) > 2 else 0.0
-
-        # Apply scale
-        px *= self._settings.scale
-        py *= self._settings.scale
-        pz *= self._settings.scale
-
-        # Apply axis mapping
-        coords = {"x": px, "y": py, "z": pz}
-        return (
-            coords[self._settings.axis_map[0]],
-            coords[self._settings.axis_map[1]],
-            coords[self._settings.axis_map[2]],
+            coords = (point[0], point[1], point[2] if len(point) > 2 else 0.0)
+
+        # Apply axis mapping and scale
+        i, j, k = self._axis_order
+        scale = self._scale
+        return (coords[i] * scale, coords[j] * scale, coords[k] * scale)
+
+    def _transform_points(self, points: Sequence[Any]) -> list[tuple[float, float, float]]:
+        """Apply scale and axis mapping to all points of a polyline at once."""
+        if not points:
+            return []
+        coords = np.array(
+            [(p[0], p[1], p[2] if len(p) > 2 else 0.0) for p in points], dtype=np.float64
         )
+        mapped = coords[:, self._axis_order] * self._scale
+        return [tuple(p) for p in mapped.tolist()]
+
+    def _create_frames_from_polyline(
+        self, points: Sequence[Any], closed: bool
+    ) -> tuple[int, int]:
+        """
+        Create frames along polyline segments.
+
+        Args:
+            points: Polyline vertices in DXF coordinates
+            closed: Whether to add the closing segment (last -> first)
+
+        Returns:
+            Tuple of (new_nodes_count, new_frames_count)
+        """
+        vertices = self._transform_points(points)
+        segments = list(pairwise(vertices))
+
+        # Handle closed polylines
+        if closed and len(vertices) > 2:
+            segments.append((vertices[-1], vertices[0]))
+
+        nodes_created = 0
+        frames_created = 0
+        for start, end in segments:
+            result = self._create_frame_from_line(start, end)
+            if result:
+                nodes_created += result[0]
+                frames_created += result[1]
+
+        return nodes_created, frames_created
 
     def _create_frame_from_line(
         self,
@@ -232,29 +247,20 @@ class DXFImporter:
         """
         new_nodes = 0
 
-        # Get or create start node
-        node_i = self._model.find_node_at(
-            start[0], start[1], start[2], self._settings.node_tolerance
-        )
-        if node_i is None:
-            node_i = self._model.add_node(start[0], start[1], start[2])
-            new_nodes += 1
-
-        # Get or create end node
-        node_j = self._model.find_node_at(
-            end[0], end[1], end[2], self._settings.node_tolerance
-        )
-        if node_j is None:
-            node_j = self._model.add_node(end[0], end[1], end[2])
-            new_nodes += 1
+        # Get or create start/end nodes
+        node_i, created = self._get_or_create_node(start)
+        new_nodes += created
+        node_j, created = self._get_or_create_node(end)
+        new_nodes += created
 
         # Skip if same node (zero-length line)
         if node_i.id == node_j.id:
             return None
 
         # Check if frame already exists
-        existing = self._model.find_frame_between(node_i.id, node_j.id)
-        if existing is not None:
+        pair = frozenset((node_i.id, node_j.id))
+        frame_pairs = self._get_frame_pairs()
+        if pair in frame_pairs:
             return (new_nodes, 0)
 
         # Create frame
@@ -265,11 +271,41 @@ class DXFImporter:
                 material_name=self._settings.default_material,
                 section_name=self._settings.default_section,
             )
+            frame_pairs.add(pair)
             return (new_nodes, 1)
         except Exception as e:
             logger.warning(f"Failed to create frame: {e}")
             return (new_nodes, 0)
 
+    def _get_or_create_node(self, point: tuple[float, float, float]) -> tuple[Node, bool]:
+        """
+        Find the node within tolerance of a point, or create one.
+
+        Returns:
+            Tuple of (node, whether it was created)
+        """
+        if self._node_grid is None:
+            self._node_grid = NodeGrid(
+                self._model.iter_nodes(), tolerance=self._settings.node_tolerance
+            )
+
+        node = self._node_grid.find(point[0], point[1], point[2])
+        if node is not None:
+            return node, False
+
+        # The grid lookup above already covers the duplicate check
+        node = self._model.add_node(point[0], point[1], point[2], check_duplicate=False)
+        self._node_grid.add(node)
+        return node, True
+
+    def _get_frame_pairs(self) -> set[frozenset[int]]:
+        """Get the set of node pairs already connected by a frame."""
+        if self._frame_pairs is None:
+            self._frame_pairs = {
+                frozenset((f.node_i_id, f.node_j_id)) for f in self._model.iter_frames()
+            }
+        return self._frame_pairs
+
 
 def import_model_from_dxf(
     filepath: str | Path,
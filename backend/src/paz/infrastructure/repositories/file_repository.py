@@ -6,11 +6,13 @@ The .paz format is JSON compressed with gzip.
 """
 
 import gzip
-import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
-from paz.core.constants import PAZ_FILE_EXTENSION, PAZ_FILE_VERSION
+import orjson
+
+from paz.core.constants import PAZ_COMPRESS_LEVEL, PAZ_FILE_EXTENSION, PAZ_FILE_VERSION
 from paz.core.exceptions import FileError, InvalidProjectFileError, ProjectNotFoundError
 from paz.core.logging_config import get_logger
 from paz.domain.model.project import ProjectFile
@@ -18,6 +20,21 @@ from paz.domain.model.project import ProjectFile
 
 logger = get_logger("file_repository")
 
+# Non-string keys are stringified, as the stdlib encoder did. The gzipped
+# .paz payload is written compact (indentation only costs bytes nobody reads);
+# save_json output stays pretty-printed for debugging.
+_PAZ_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Extension compared case-insensitively when saving
+_EXTENSION_FOLDED = PAZ_FILE_EXTENSION.casefold()
+
+# Major version of the current file format, the part compared on load
+_CURRENT_MAJOR = int(PAZ_FILE_VERSION.split(".", 1)[0])
+
+# Decompressed payloads kept per repository for repeated loads of a file
+_PAYLOAD_CACHE_SIZE = 4
+
 
 class FileRepository:
     """
@@ -40,26 +57,38 @@ class FileRepository:
         """
         self.base_path = base_path or Path.cwd()
 
+        # LRU of decompressed JSON keyed by (path, mtime_ns, size), so a file
+        # changed on disk is never served stale. Bytes are immutable and each
+        # load parses them into fresh objects, so callers never share state.
+        self._payload_cache: OrderedDict[tuple[Path, int, int], bytes] = OrderedDict()
+
     def _resolve_path(self, path: Path | str) -> Path:
         """Resolve a path, making it absolute if necessary."""
-        p = Path(path)
+        # Path(path) re-parses even Path inputs; reuse them as-is
+        p = path if isinstance(path, Path) else Path(path)
         if not p.is_absolute():
             p = self.base_path / p
         return p
 
     def _ensure_extension(self, path: Path) -> Path:
         """Ensure the path has the .paz extension."""
-        if path.suffix.lower() != PAZ_FILE_EXTENSION:
+        if path.suffix.casefold() != _EXTENSION_FOLDED:
             return path.with_suffix(PAZ_FILE_EXTENSION)
         return path
 
-    def save(self, project_file: ProjectFile, path: Path | str) -> Path:
+    def save(
+        self,
+        project_file: ProjectFile,
+        path: Path | str,
+        compresslevel: int = PAZ_COMPRESS_LEVEL,
+    ) -> Path:
         """
         Save a project file to disk.
 
         Args:
             project_file: The project file to save
             path: Destination path (will add .paz extension if missing)
+            compresslevel: gzip compression level (1 = fastest, 9 = smallest)
 
         Returns:
             The actual path where the file was saved
@@ -80,15 +109,26 @@ class FileRepository:
 
             # Serialize to JSON
             data = project_file.to_dict()
-            json_bytes = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
-
-            # Compress and write
-            with gzip.open(resolved_path, "wb") as f:
-                f.write(json_bytes)
+            json_bytes = orjson.dumps(data, option=_PAZ_JSON_OPTIONS)
+
+            # Compress with a zeroed header mtime so identical projects give
+            # identical bytes, then write to a sibling temp file and rename it
+            # over the target: a crash mid-write never leaves a truncated .paz
+            compressed = gzip.compress(json_bytes, compresslevel=compresslevel, mtime=0)
+            tmp_path = resolved_path.with_suffix(resolved_path.suffix + ".tmp")
+            try:
+                tmp_path.write_bytes(compressed)
+                tmp_path.replace(resolved_path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            # Drop any cached payload of the old file
+            self._forget_payload(resolved_path)
 
             logger.info(
                 f"Project saved successfully: {resolved_path} "
-                f"({len(json_bytes)} bytes -> {resolved_path.stat().st_size} bytes)"
+                f"({len(json_bytes)} bytes -> {len(compressed)} bytes)"
             )
 
             return resolved_path
@@ -122,12 +162,11 @@ class FileRepository:
             raise ProjectNotFoundError(str(resolved_path))
 
         try:
-            # Read and decompress
-            with gzip.open(resolved_path, "rb") as f:
-                json_bytes = f.read()
+            # Read and decompress (or reuse the cached payload)
+            json_bytes = self._read_payload(resolved_path)
 
-            # Parse JSON
-            data = json.loads(json_bytes.decode("utf-8"))
+            # Parse JSON (orjson consumes the UTF-8 bytes directly)
+            data = orjson.loads(json_bytes)
 
             # Validate version
             file_version = data.get("version", "unknown")
@@ -153,7 +192,7 @@ class FileRepository:
                 str(resolved_path),
                 reason="File is not a valid gzip archive",
             ) from e
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON: {e}")
             raise InvalidProjectFileError(
                 str(resolved_path),
@@ -166,13 +205,34 @@ class FileRepository:
                 reason=f"Invalid project structure: {e}",
             ) from e
 
+    def _read_payload(self, path: Path) -> bytes:
+        """Read and decompress a .paz file, reusing the payload if unchanged."""
+        stat = path.stat()
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        cached = self._payload_cache.get(key)
+        if cached is not None:
+            self._payload_cache.move_to_end(key)
+            return cached
+
+        with gzip.open(path, "rb") as f:
+            payload = f.read()
+
+        self._payload_cache[key] = payload
+        if len(self._payload_cache) > _PAYLOAD_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+        return payload
+
+    def _forget_payload(self, path: Path) -> None:
+        """Drop cached payloads of a file (mtime may be too coarse to tell)."""
+        for key in [key for key in self._payload_cache if key[0] == path]:
+            del self._payload_cache[key]
+
     def _is_version_compatible(self, file_version: str) -> bool:
         """Check if a file version is compatible with current version."""
         try:
-            file_major = int(file_version.split(".")[0])
-            current_major = int(PAZ_FILE_VERSION.split(".")[0])
-            return file_major == current_major
-        except (ValueError, IndexError):
+            return int(file_version.split(".", 1)[0]) == _CURRENT_MAJOR
+        except ValueError:
             return False
 
     def exists(self, path: Path | str) -> bool:
@@ -199,6 +259,7 @@ class FileRepository:
 
         try:
             resolved_path.unlink()
+            self._forget_payload(resolved_path)
             logger.info(f"Deleted project file: {resolved_path}")
             return True
         except OSError as e:
@@ -221,8 +282,7 @@ class FileRepository:
         resolved_path = self._resolve_path(path)
         resolved_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with resolved_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        resolved_path.write_bytes(orjson.dumps(data, option=_JSON_OPTIONS))
 
         return resolved_path
 
@@ -241,5 +301,4 @@ class FileRepository:
         if not resolved_path.exists():
             raise ProjectNotFoundError(str(resolved_path))
 
-        with resolved_path.open(encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
+        return orjson.loads(resolved_path.read_bytes())  # type: ignore[no-any-return]
@@ -6,9 +6,11 @@ Loads predefined sections from JSON files (AISC, Eurocode, etc.) and supports cu
 
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
+
+import orjson
 
 from paz.core.exceptions import SectionNotFoundError
 from paz.core.logging_config import get_logger
@@ -31,8 +33,16 @@ class SectionsRepository:
 
     Loads predefined sections from JSON files and manages custom sections.
     Supports searching and filtering by name, shape, and standard.
+
+    Parsed catalogs are shared between instances: a data directory is only
+    re-read when one of its JSON files is added, removed or modified.
     """
 
+    # data_path -> (catalog signature, sections by name, loaded count)
+    _catalog_cache: ClassVar[
+        dict[Path, tuple[tuple[tuple[str, int, int], ...], dict[str, Section], int]]
+    ] = {}
+
     def __init__(self, data_path: Path | None = None) -> None:
         """
         Initialize the sections repository.
@@ -49,6 +59,12 @@ class SectionsRepository:
 
         self._data_path = data_path
         self._sections: dict[str, Section] = {}
+        # Secondary indexes (name -> section buckets) kept in sync by _put/_discard
+        self._by_shape: dict[SectionShape, dict[str, Section]] = {}
+        self._by_standard: dict[SectionStandard, dict[str, Section]] = {}
+        self._by_id: dict[str, Section] = {}
+        # name -> (lowercase name, lowercase description) for search()
+        self._search_keys: dict[str, tuple[str, str]] = {}
         self._loaded = False
 
     def _ensure_loaded(self) -> None:
@@ -56,6 +72,58 @@ class SectionsRepository:
         if not self._loaded:
             self.load_all()
 
+    def _put(self, section: Section) -> None:
+        """Store a section by name, replacing (and unindexing) any previous one."""
+        previous = self._sections.get(section.name)
+        if previous is not None:
+            self._discard(previous)
+
+        self._sections[section.name] = section
+        self._by_shape.setdefault(section.shape, {})[section.name] = section
+        self._by_standard.setdefault(section.standard, {})[section.name] = section
+        self._by_id[str(section.id)] = section
+        self._search_keys[section.name] = (
+            section.name.lower(),
+            section.description.lower(),
+        )
+
+    def _put_all(self, sections: dict[str, Section]) -> None:
+        """
+        Store a name -> section mapping into empty indexes in one pass.
+
+        Bulk counterpart of _put for load_all: the maps are filled with
+        dict.update from comprehensions instead of per-section inserts.
+        """
+        self._sections.update(sections)
+        self._by_id.update({str(section.id): section for section in sections.values()})
+        self._search_keys.update(
+            {
+                name: (name.lower(), section.description.lower())
+                for name, section in sections.items()
+            }
+        )
+        by_shape = self._by_shape
+        by_standard = self._by_standard
+        for name, section in sections.items():
+            by_shape.setdefault(section.shape, {})[name] = section
+            by_standard.setdefault(section.standard, {})[name] = section
+
+    def _discard(self, section: Section) -> None:
+        """Remove a section from the name map and the secondary indexes."""
+        del self._sections[section.name]
+        del self._search_keys[section.name]
+        self._by_id.pop(str(section.id), None)
+
+        shape_bucket = self._by_shape[section.shape]
+        del shape_bucket[section.name]
+        if not shape_bucket:
+            del self._by_shape[section.shape]
+
+        standard_bucket = self._by_standard[section.standard]
+        del standard_bucket[section.name]
+        if not standard_bucket:
+            del self._by_standard[section.standard]
+
     def load_all(self) -> int:
         """
         Load all predefined sections from JSON files.
@@ -64,51 +132,68 @@ class SectionsRepository:
             Number of sections loaded
         """
         self._sections.clear()
+        self._by_shape.clear()
+        self._by_standard.clear()
+        self._by_id.clear()
+        self._search_keys.clear()
         count = 0
 
-        if not self._data_path.exists():
+        try:
+            entries = _scan_catalog(self._data_path)
+        except FileNotFoundError:
             logger.warning(f"Sections data path does not exist: {self._data_path}")
             self._loaded = True
             return 0
 
-        for json_file in self._data_path.glob("*.json"):
+        signature = _catalog_signature(entries)
+
+        cached = self._catalog_cache.get(self._data_path)
+        if cached is not None and cached[0] == signature:
+            _, cached_sections, count = cached
+            self._put_all(cached_sections)
+            self._loaded = True
+            logger.info(f"Reusing {count} cached sections from {self._data_path}")
+            return count
+
+        # Later files replace same-named sections of earlier ones
+        sections: dict[str, Section] = {}
+        for json_file in (Path(entry.path) for entry in entries):
             try:
                 loaded = self._load_file(json_file)
-                count += loaded
-                logger.info(f"Loaded {loaded} sections from {json_file.name}")
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                sections.update((section.name, section) for section in loaded)
+                count += len(loaded)
+                logger.info(f"Loaded {len(loaded)} sections from {json_file.name}")
+            except (orjson.JSONDecodeError, KeyError, ValueError) as e:
                 logger.error(f"Failed to load sections from {json_file}: {e}")
 
+        self._put_all(sections)
+        self._catalog_cache[self._data_path] = (signature, sections, count)
         self._loaded = True
         logger.info(f"Total sections loaded: {count}")
         return count
 
-    def _load_file(self, path: Path) -> int:
+    def _load_file(self, path: Path) -> list[Section]:
         """
-        Load sections from a single JSON file.
+        Parse the sections of a single JSON file.
 
         Args:
             path: Path to the JSON file
 
         Returns:
-            Number of sections loaded
+            Sections parsed from the file, in file order
         """
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
 
-        count = 0
+        sections: list[Section] = []
         for section_data in data.get("sections", []):
             try:
-                section = Section.from_dict(section_data)
-                # Use name as key for predefined sections
-                self._sections[section.name] = section
-                count += 1
+                sections.append(Section.from_dict(section_data))
             except Exception as e:
                 logger.warning(
                     f"Failed to load section {section_data.get('name', '?')}: {e}"
                 )
 
-        return count
+        return sections
 
     def get(self, name: str) -> Section:
         """
@@ -145,11 +230,11 @@ class SectionsRepository:
         """
         self._ensure_loaded()
 
-        for section in self._sections.values():
-            if str(section.id) == section_id:
-                return section
+        section = self._by_id.get(section_id)
+        if section is None:
+            raise SectionNotFoundError(section_id)
 
-        raise SectionNotFoundError(section_id)
+        return section
 
     def exists(self, name: str) -> bool:
         """Check if a section exists by name."""
@@ -182,7 +267,7 @@ class SectionsRepository:
             List of matching sections
         """
         self._ensure_loaded()
-        return [s for s in self._sections.values() if s.shape == shape]
+        return list(self._by_shape.get(shape, {}).values())
 
     def filter_by_standard(self, standard: SectionStandard) -> list[Section]:
         """
@@ -195,7 +280,7 @@ class SectionsRepository:
             List of matching sections
         """
         self._ensure_loaded()
-        return [s for s in self._sections.values() if s.standard == standard]
+        return list(self._by_standard.get(standard, {}).values())
 
     def search(self, query: str) -> list[Section]:
         """
@@ -209,10 +294,11 @@ class SectionsRepository:
         """
         self._ensure_loaded()
         query_lower = query.lower()
+        sections = self._sections
         return [
-            s
-            for s in self._sections.values()
-            if query_lower in s.name.lower() or query_lower in s.description.lower()
+            sections[name]
+            for name, (name_lower, description_lower) in self._search_keys.items()
+            if query_lower in name_lower or query_lower in description_lower
         ]
 
     def get_w_shapes(self) -> list[Section]:
@@ -247,7 +333,7 @@ class SectionsRepository:
             section: The custom section to add
         """
         self._ensure_loaded()
-        self._sections[section.name] = section
+        self._put(section)
         logger.info(f"Added custom section: {section.name}")
 
     def remove_custom(self, name: str) -> bool:
@@ -270,7 +356,7 @@ class SectionsRepository:
             logger.warning(f"Cannot remove predefined section: {name}")
             return False
 
-        del self._sections[name]
+        self._discard(section)
         logger.info(f"Removed custom section: {name}")
         return True
 
@@ -282,9 +368,36 @@ class SectionsRepository:
     def get_shapes(self) -> list[SectionShape]:
         """Get list of unique section shapes in the repository."""
         self._ensure_loaded()
-        return list({s.shape for s in self._sections.values()})
+        return list(self._by_shape)
 
     def get_standards(self) -> list[SectionStandard]:
         """Get list of unique standards in the repository."""
         self._ensure_loaded()
-        return list({s.standard for s in self._sections.values()})
+        return list(self._by_standard)
+
+
+def _scan_catalog(data_path: Path) -> list[os.DirEntry[str]]:
+    """
+    List the catalog JSON files of a directory, sorted by name.
+
+    os.scandir reports names and file types from the directory listing
+    itself, without the per-entry Path objects and stat calls of glob.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    with os.scandir(data_path) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _catalog_signature(
+    entries: list[os.DirEntry[str]],
+) -> tuple[tuple[str, int, int], ...]:
+    """Identify a catalog's contents by file name, mtime and size."""
+    signature = []
+    for entry in entries:
+        stat = entry.stat()
+        signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
@@ -39,7 +39,7 @@ from paz.presentation.viewport import ViewportWidget
 
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable
 
 
 class DrawingTool(Enum):
@@ -482,9 +482,19 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _on_model_changed(self) -> None:
-        """Handle model data change."""
-        self._viewport.set_model(self._model)
+    def _on_model_changed(self, edited_frame_ids: Iterable[int] | None = None) -> None:
+        """
+        Handle model data change.
+
+        Args:
+            edited_frame_ids: Frames edited in place (moved end nodes, new
+                rotation), which the viewport can update without rebuilding
+                the whole model; None redraws everything
+        """
+        if edited_frame_ids is None:
+            self._viewport.set_model(self._model)
+        else:
+            self._viewport.update_frames(edited_frame_ids)
         self._update_model_tree()
         self._update_status_bar()
         self._update_undo_redo_actions()
@@ -858,7 +868,9 @@ class MainWindow(QMainWindow):
                 data = dialog.get_node_data()
                 node.move_to(data["x"], data["y"], data["z"])
                 node.restraint = data["restraint"]
-                self._on_model_changed()
+                self._on_model_changed(
+                    [frame.id for frame in self._model.get_frames_using_node(node_id)]
+                )
                 self._show_node_properties(node_id)
                 self._status_bar.showMessage(f"Node {node_id} updated", 2000)
         except Exception as e:
@@ -883,7 +895,7 @@ class MainWindow(QMainWindow):
                 frame.rotation = dialog.get_rotation()
                 frame.releases = dialog.get_releases()
                 frame.label = dialog.get_label()
-                self._on_model_changed()
+                self._on_model_changed([frame_id])
                 self._show_frame_properties(frame_id)
                 self._status_bar.showMessage(f"Frame {frame_id} updated", 2000)
         except Exception as e:
@@ -926,7 +938,9 @@ class MainWindow(QMainWindow):
             if "restraint" in properties:
                 node.restraint = properties["restraint"]
 
-            self._on_model_changed()
+            self._on_model_changed(
+                [frame.id for frame in self._model.get_frames_using_node(node_id)]
+            )
         except Exception as e:
             self._status_bar.showMessage(f"Error: {e}", 3000)
 
@@ -943,7 +957,7 @@ class MainWindow(QMainWindow):
             if "releases" in properties:
                 frame.releases = properties["releases"]
 
-            self._on_model_changed()
+            self._on_model_changed([frame_id])
         except Exception as e:
             self._status_bar.showMessage(f"Error: {e}", 3000)
 
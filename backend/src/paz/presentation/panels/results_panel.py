@@ -7,9 +7,20 @@ for highlighting specific elements.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from PySide6.QtCore import Signal
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -19,6 +30,7 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QPushButton,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QVBoxLayout,
@@ -29,9 +41,106 @@ from paz.presentation.viewport.force_diagrams import ForceType
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from paz.domain.results import AnalysisResults
 
 
+# Column of each force type in the stacked force array (combo box order)
+_FORCE_COLUMNS: dict[ForceType, int] = {
+    ForceType.M3: 0,
+    ForceType.V2: 1,
+    ForceType.P: 2,
+    ForceType.M2: 3,
+    ForceType.V3: 4,
+    ForceType.T: 5,
+}
+_force_values = attrgetter("M3", "V2", "P", "M2", "V3", "T")
+
+# Number of frames listed in the frame results table
+_TOP_FRAMES = 10
+
+# Quiet period before spin box edits are applied as a filter (ms)
+_FILTER_DEBOUNCE_MS = 50
+
+
+class FrameSummaryModel(QAbstractTableModel):
+    """
+    Read-only table model of per-frame force summaries.
+
+    Backed directly by NumPy arrays, so no item objects are allocated when
+    the summary changes. Cell texts are formatted once per summary: views
+    query data() on every repaint (hover, selection), which then only
+    indexes the cache.
+    """
+
+    HEADERS: ClassVar[tuple[str, ...]] = ("Frame", "Max", "Min", "Abs Max")
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._frame_ids = np.empty(0, dtype=np.int64)
+        self._cells: list[tuple[str, str, str, str]] = []
+
+    def set_summary(self, frame_ids: np.ndarray, values: np.ndarray) -> None:
+        """
+        Replace the displayed rows.
+
+        Args:
+            frame_ids: Frame id of each row
+            values: Array of shape (rows, 3) with max, min and abs max
+        """
+        self.beginResetModel()
+        self._frame_ids = frame_ids
+        self._cells = [
+            (str(frame_id), f"{max_val:.2f}", f"{min_val:.2f}", f"{abs_max:.2f}")
+            for frame_id, (max_val, min_val, abs_max) in zip(
+                frame_ids.tolist(), values.tolist(), strict=True
+            )
+        ]
+        self.endResetModel()
+
+    def frame_id(self, row: int) -> int:
+        """Get the frame id shown in a row."""
+        return int(self._frame_ids[row])
+
+    def rowCount(
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Number of summary rows."""
+        return 0 if parent.isValid() else len(self._frame_ids)
+
+    def columnCount(
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Number of columns (frame, max, min, abs max)."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> str | None:
+        """Text of a cell (display role only)."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._cells[index.row()][index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> str | None:
+        """Column titles."""
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
+
+
 class ResultsPanel(QWidget):
     """
     Panel displaying analysis results summary.
@@ -42,6 +151,8 @@ class ResultsPanel(QWidget):
     - Per-frame maximum values
     - Buttons to highlight max elements
 
+    Everything below the selector is built when results are first set.
+
     Signals:
         force_type_changed(ForceType): Emitted when force type selection changes
         highlight_frame(int): Emitted to highlight a specific frame
@@ -62,12 +173,34 @@ class ResultsPanel(QWidget):
         self._results: AnalysisResults | None = None
         self._current_force_type = ForceType.M3
 
+        # Forces of all frames stacked once per results, shape
+        # (n_frames, max_stations, 6), NaN-padded; see _stack_frame_forces
+        self._force_array = np.empty((0, 1, len(_FORCE_COLUMNS)))
+        self._frame_ids = np.empty(0, dtype=np.int64)
+
+        # (global extremes, top frames) per force type for the current
+        # results; filled on first display, cleared by set_results
+        self._summary_cache: dict[
+            ForceType, tuple[dict[str, float], tuple[np.ndarray, np.ndarray]]
+        ] = {}
+
+        # Holding a spin box arrow steps its value continuously; only the
+        # value it settles on is emitted as filter_changed
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(_FILTER_DEBOUNCE_MS)
+        self._filter_debounce.timeout.connect(self._emit_filter_changed)
+
+        # Tables and filter are only built once there are results to show
+        self._results_ui_built = False
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
-        """Create the panel layout."""
+        """Create the panel layout with the force type selector."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
+        self._layout = layout
 
         # Force type selector
         selector_layout = QHBoxLayout()
@@ -81,6 +214,15 @@ class ResultsPanel(QWidget):
 
         layout.addLayout(selector_layout)
 
+        layout.addStretch()
+
+    def _setup_results_ui(self) -> None:
+        """Create the results tables and filter (on the first results set)."""
+        # Lay the groups out in a sub-layout placed above the stretch
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.insertLayout(self._layout.count() - 1, layout)
+
         # Global extremes group
         extremes_group = QGroupBox("Global Extremes")
         extremes_layout = QVBoxLayout(extremes_group)
@@ -97,9 +239,11 @@ class ResultsPanel(QWidget):
         self._extremes_table.setItem(0, 0, QTableWidgetItem("Maximum"))
         self._extremes_table.setItem(1, 0, QTableWidgetItem("Minimum"))
         self._extremes_table.setItem(2, 0, QTableWidgetItem("Abs. Max"))
-        self._extremes_table.setItem(0, 1, QTableWidgetItem("-"))
-        self._extremes_table.setItem(1, 1, QTableWidgetItem("-"))
-        self._extremes_table.setItem(2, 1, QTableWidgetItem("-"))
+
+        # Value cells are created once and only have their text rewritten
+        self._extremes_items = [QTableWidgetItem("-") for _ in range(3)]
+        for row, item in enumerate(self._extremes_items):
+            self._extremes_table.setItem(row, 1, item)
 
         extremes_layout.addWidget(self._extremes_table)
         layout.addWidget(extremes_group)
@@ -108,18 +252,19 @@ class ResultsPanel(QWidget):
         frame_group = QGroupBox("Frame Results (Top 10)")
         frame_layout = QVBoxLayout(frame_group)
 
-        self._frame_table = QTableWidget(0, 4)
-        self._frame_table.setHorizontalHeaderLabels(
-            ["Frame", "Max", "Min", "Abs Max"]
-        )
+        self._frame_model = FrameSummaryModel(self)
+        self._frame_table = QTableView()
+        self._frame_table.setModel(self._frame_model)
         self._frame_table.verticalHeader().setVisible(False)
         self._frame_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
         self._frame_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QTableView.SelectionBehavior.SelectRows
+        )
+        self._frame_table.selectionModel().selectionChanged.connect(
+            self._on_frame_selected
         )
-        self._frame_table.itemSelectionChanged.connect(self._on_frame_selected)
 
         frame_layout.addWidget(self._frame_table)
 
@@ -154,6 +299,7 @@ class ResultsPanel(QWidget):
         self._min_spin.setValue(0.0)
         self._min_spin.setEnabled(False)
         self._min_spin.valueChanged.connect(self._on_filter_value_changed)
+        self._min_spin.editingFinished.connect(self._flush_filter)
         min_layout.addWidget(self._min_spin)
         filter_layout.addLayout(min_layout)
 
@@ -166,12 +312,13 @@ class ResultsPanel(QWidget):
         self._max_spin.setValue(1000.0)
         self._max_spin.setEnabled(False)
         self._max_spin.valueChanged.connect(self._on_filter_value_changed)
+        self._max_spin.editingFinished.connect(self._flush_filter)
         max_layout.addWidget(self._max_spin)
         filter_layout.addLayout(max_layout)
 
         layout.addWidget(filter_group)
 
-        layout.addStretch()
+        self._results_ui_built = True
 
     def set_results(self, results: AnalysisResults | None) -> None:
         """
@@ -181,6 +328,10 @@ class ResultsPanel(QWidget):
             results: Analysis results or None to clear
         """
         self._results = results
+        if results is not None and not self._results_ui_built:
+            self._setup_results_ui()
+        self._force_array, self._frame_ids = _stack_frame_forces(results)
+        self._summary_cache.clear()
         self._update_display()
 
     def get_force_type(self) -> ForceType:
@@ -203,16 +354,9 @@ class ResultsPanel(QWidget):
 
     def _on_frame_selected(self) -> None:
         """Handle frame table selection."""
-        selected = self._frame_table.selectedItems()
+        selected = self._frame_table.selectionModel().selectedRows()
         if selected:
-            row = selected[0].row()
-            frame_item = self._frame_table.item(row, 0)
-            if frame_item:
-                try:
-                    frame_id = int(frame_item.text())
-                    self.highlight_frame.emit(frame_id)
-                except ValueError:
-                    pass
+            self.highlight_frame.emit(self._frame_model.frame_id(selected[0].row()))
 
     def _on_highlight_max(self) -> None:
         """Highlight frame with maximum value."""
@@ -234,141 +378,176 @@ class ResultsPanel(QWidget):
         self._min_spin.setEnabled(enabled)
         self._max_spin.setEnabled(enabled)
 
-        if enabled:
-            self.filter_changed.emit(
-                self._min_spin.value(),
-                self._max_spin.value(),
-            )
-        else:
-            self.filter_changed.emit(None, None)
+        # A toggle is a single click: apply it (and any pending edit) now
+        self._filter_debounce.stop()
+        self._emit_filter_changed()
 
     def _on_filter_value_changed(self) -> None:
-        """Handle filter value changes."""
+        """Handle filter value changes (applied once the edits settle)."""
+        if self._filter_enabled.isChecked():
+            self._filter_debounce.start()
+
+    def _flush_filter(self) -> None:
+        """Apply a pending filter edit immediately (e.g. on Enter)."""
+        if self._filter_debounce.isActive():
+            self._filter_debounce.stop()
+            self._emit_filter_changed()
+
+    def _emit_filter_changed(self) -> None:
+        """Emit filter_changed with the current filter state."""
         if self._filter_enabled.isChecked():
             self.filter_changed.emit(
                 self._min_spin.value(),
                 self._max_spin.value(),
             )
+        else:
+            self.filter_changed.emit(None, None)
 
     def _update_display(self) -> None:
         """Update tables with current results."""
+        if not self._results_ui_built:
+            return
         if self._results is None:
             self._clear_tables()
             return
 
+        extremes, frame_data = self._current_summary()
+
         # Update global extremes
-        extremes = self._calculate_global_extremes()
-        self._extremes_table.item(0, 1).setText(f"{extremes['max']:.2f}")
-        self._extremes_table.item(1, 1).setText(f"{extremes['min']:.2f}")
-        self._extremes_table.item(2, 1).setText(f"{extremes['abs_max']:.2f}")
+        self._set_extremes_text(
+            f"{extremes['max']:.2f}",
+            f"{extremes['min']:.2f}",
+            f"{extremes['abs_max']:.2f}",
+        )
 
         # Update frame table (top 10 by absolute max)
-        frame_data = self._get_frame_summary()
-        self._update_frame_table(frame_data)
+        self._frame_model.set_summary(*frame_data)
 
     def _clear_tables(self) -> None:
         """Clear all table data."""
-        self._extremes_table.item(0, 1).setText("-")
-        self._extremes_table.item(1, 1).setText("-")
-        self._extremes_table.item(2, 1).setText("-")
-        self._frame_table.setRowCount(0)
-
-    def _calculate_global_extremes(self) -> dict[str, float]:
-        """Calculate global extreme values for current force type."""
-        if self._results is None:
-            return {"max": 0.0, "min": 0.0, "abs_max": 0.0}
+        self._set_extremes_text("-", "-", "-")
+        self._frame_model.set_summary(np.empty(0, dtype=np.int64), np.empty((0, 3)))
+
+    def _set_extremes_text(self, *texts: str) -> None:
+        """Rewrite the extremes value cells (max, min, abs max) in place."""
+        with _batched_updates(self._extremes_table):
+            for item, text in zip(self._extremes_items, texts, strict=True):
+                item.setText(text)
+
+    def _current_summary(
+        self,
+    ) -> tuple[dict[str, float], tuple[np.ndarray, np.ndarray]]:
+        """Get the scan of the current force type, reusing it on switch-back."""
+        summary = self._summary_cache.get(self._current_force_type)
+        if summary is None:
+            summary = self._scan_results()
+            self._summary_cache[self._current_force_type] = summary
+        return summary
+
+    def _scan_results(self) -> tuple[dict[str, float], tuple[np.ndarray, np.ndarray]]:
+        """
+        Get global extremes and the top frames of the current force type.
 
-        max_val = float("-inf")
-        min_val = float("inf")
+        The stacked forces are reduced once, per frame; the global extremes
+        are taken from those per-frame values instead of a second pass.
 
-        for frame_result in self._results.frame_results.values():
-            for forces in frame_result.forces:
-                val = self._get_force_value(forces)
-                max_val = max(max_val, val)
-                min_val = min(min_val, val)
+        Returns:
+            Tuple of (extremes, (frame_ids, values)): extremes has keys max,
+            min and abs_max; the top frames by absolute max are in
+            descending order, values having columns max, min and abs max
+        """
+        if self._results is None or not self._frame_ids.size:
+            return {"max": 0.0, "min": 0.0, "abs_max": 0.0}, (
+                np.empty(0, dtype=np.int64),
+                np.empty((0, 3)),
+            )
 
-        if max_val == float("-inf"):
-            max_val = 0.0
-        if min_val == float("inf"):
-            min_val = 0.0
+        values = self._force_array[..., _FORCE_COLUMNS[self._current_force_type]]
+        # fmax/fmin skip the NaN padding; frames without force stations
+        # stay NaN, so they are ignored by the global reductions as well
+        frame_max = np.fmax.reduce(values, axis=1)
+        frame_min = np.fmin.reduce(values, axis=1)
 
-        return {
+        max_val = float(np.nan_to_num(np.fmax.reduce(frame_max), nan=0.0))
+        min_val = float(np.nan_to_num(np.fmin.reduce(frame_min), nan=0.0))
+        extremes = {
             "max": max_val,
             "min": min_val,
             "abs_max": max(abs(max_val), abs(min_val)),
         }
 
-    def _get_frame_summary(self) -> list[dict]:
-        """Get summary data for each frame, sorted by absolute max."""
-        if self._results is None:
-            return []
-
-        summaries = []
-        for frame_id, frame_result in self._results.frame_results.items():
-            max_val = float("-inf")
-            min_val = float("inf")
-
-            for forces in frame_result.forces:
-                val = self._get_force_value(forces)
-                max_val = max(max_val, val)
-                min_val = min(min_val, val)
-
-            if max_val == float("-inf"):
-                max_val = 0.0
-            if min_val == float("inf"):
-                min_val = 0.0
+        # Frames without force stations get zeros, as in the results table
+        max_vals = np.nan_to_num(frame_max, nan=0.0)
+        min_vals = np.nan_to_num(frame_min, nan=0.0)
+        abs_max = np.maximum(np.abs(max_vals), np.abs(min_vals))
+
+        # Select the top frames without sorting them all: the frames above
+        # the k-th largest value, then the first frames tied with it, so at
+        # most k values are sorted; the stable sort keeps frame order for ties
+        n = abs_max.size
+        k = min(_TOP_FRAMES, n)
+        candidates = np.arange(n)
+        if n > k:
+            kth = np.partition(abs_max, n - k)[n - k]
+            above = np.flatnonzero(abs_max > kth)
+            tied = np.flatnonzero(abs_max == kth)[: k - above.size]
+            candidates = np.concatenate((above, tied))
+        top = candidates[np.argsort(-abs_max[candidates], kind="stable")]
+
+        return extremes, (
+            self._frame_ids[top],
+            np.column_stack((max_vals[top], min_vals[top], abs_max[top])),
+        )
 
-            summaries.append({
-                "frame_id": frame_id,
-                "max": max_val,
-                "min": min_val,
-                "abs_max": max(abs(max_val), abs(min_val)),
-            })
+    def _find_max_frame(self) -> tuple[int | None, float]:
+        """Find frame with maximum absolute value."""
+        if self._results is None or not self._frame_ids.size:
+            return None, 0.0
 
-        # Sort by absolute max, descending
-        summaries.sort(key=lambda x: x["abs_max"], reverse=True)
+        # The first of the top frames; ties keep the first frame
+        frame_ids, values = self._current_summary()[1]
+        max_abs = float(values[0, 2])
+        if max_abs <= 0.0:
+            return None, 0.0
+        return int(frame_ids[0]), max_abs
 
-        return summaries[:10]  # Top 10
 
-    def _update_frame_table(self, data: list[dict]) -> None:
-        """Update frame table with summary data."""
-        self._frame_table.setRowCount(len(data))
+@contextmanager
+def _batched_updates(table: QTableWidget) -> Iterator[None]:
+    """Suspend repaints and signals of a table while its cells are rewritten."""
+    table.setUpdatesEnabled(False)
+    was_blocked = table.blockSignals(True)
+    try:
+        yield
+    finally:
+        table.blockSignals(was_blocked)
+        table.setUpdatesEnabled(True)
 
-        for row, item in enumerate(data):
-            self._frame_table.setItem(row, 0, QTableWidgetItem(str(item["frame_id"])))
-            self._frame_table.setItem(row, 1, QTableWidgetItem(f"{item['max']:.2f}"))
-            self._frame_table.setItem(row, 2, QTableWidgetItem(f"{item['min']:.2f}"))
-            self._frame_table.setItem(row, 3, QTableWidgetItem(f"{item['abs_max']:.2f}"))
 
-    def _find_max_frame(self) -> tuple[int | None, float]:
-        """Find frame with maximum absolute value."""
-        if self._results is None:
-            return None, 0.0
+def _stack_frame_forces(
+    results: AnalysisResults | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack all frame forces into one array for vectorized reductions.
 
-        max_frame_id: int | None = None
-        max_abs = 0.0
-
-        for frame_id, frame_result in self._results.frame_results.items():
-            for forces in frame_result.forces:
-                val = abs(self._get_force_value(forces))
-                if val > max_abs:
-                    max_abs = val
-                    max_frame_id = frame_id
-
-        return max_frame_id, max_abs
-
-    def _get_force_value(self, forces: object) -> float:
-        """Get force value based on current force type."""
-        if self._current_force_type == ForceType.P:
-            return float(getattr(forces, "P", 0.0))
-        if self._current_force_type == ForceType.V2:
-            return float(getattr(forces, "V2", 0.0))
-        if self._current_force_type == ForceType.V3:
-            return float(getattr(forces, "V3", 0.0))
-        if self._current_force_type == ForceType.T:
-            return float(getattr(forces, "T", 0.0))
-        if self._current_force_type == ForceType.M2:
-            return float(getattr(forces, "M2", 0.0))
-        if self._current_force_type == ForceType.M3:
-            return float(getattr(forces, "M3", 0.0))
-        return 0.0
+    Returns:
+        Tuple of (forces, frame_ids): forces has shape
+        (n_frames, max_stations, 6) with columns in _FORCE_COLUMNS order,
+        NaN-padded for frames with fewer stations; frame_ids is parallel
+        to its first axis.
+    """
+    frame_results = results.frame_results if results is not None else {}
+    rows = [
+        [_force_values(forces) for forces in frame_result.forces]
+        for frame_result in frame_results.values()
+    ]
+    stations = max((len(row) for row in rows), default=0)
+
+    # At least one station column so per-frame reductions are never empty
+    force_array = np.full((len(rows), max(stations, 1), len(_FORCE_COLUMNS)), np.nan)
+    for i, row in enumerate(rows):
+        if row:
+            force_array[i, : len(row)] = row
+
+    frame_ids = np.fromiter(frame_results.keys(), dtype=np.int64, count=len(rows))
+    return force_array, frame_ids
@@ -7,6 +7,7 @@ displacement values.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -16,10 +17,23 @@ from paz.presentation.viewport.render_modes import DisplacementComponent
 
 
 if TYPE_CHECKING:
-    from paz.domain.model import Frame, StructuralModel
+    from paz.domain.model import StructuralModel
+    from paz.domain.model.structural_model import CoordinateTables
     from paz.domain.results import AnalysisResults
 
 
+# Column of each single displacement component in an (..., 3) array;
+# TOTAL (the magnitude) has no column
+_COMPONENT_COLUMNS: dict[DisplacementComponent, int] = {
+    DisplacementComponent.UX: 0,
+    DisplacementComponent.UY: 1,
+    DisplacementComponent.UZ: 2,
+}
+
+# Deformed meshes kept for repeated renders of the same inputs
+_MESH_CACHE_SIZE = 4
+
+
 class DeformedRenderer:
     """
     Renders deformed structural shapes from analysis results.
@@ -38,7 +52,19 @@ class DeformedRenderer:
             interpolation_points: Number of points per frame for smooth deformation.
                 Higher values give smoother curves but increase memory usage.
         """
-        self._interpolation_points = max(2, interpolation_points)
+        # LRU of built meshes keyed by (model id, results id, results
+        # displacement revision, scale, component); each entry keeps its
+        # model, results and the coordinate tables it was built from, so a
+        # recycled id() or a node moved in place can never match. Emptied
+        # whenever interpolation changes.
+        self._mesh_cache: OrderedDict[
+            tuple[int, int, int, float, DisplacementComponent],
+            tuple[
+                StructuralModel, AnalysisResults, CoordinateTables, pv.PolyData, np.ndarray
+            ],
+        ] = OrderedDict()
+
+        self.interpolation_points = interpolation_points
 
     @property
     def interpolation_points(self) -> int:
@@ -49,6 +75,14 @@ class DeformedRenderer:
     def interpolation_points(self, value: int) -> None:
         """Set interpolation points (minimum 2)."""
         self._interpolation_points = max(2, value)
+        # Interpolation parameters along a frame, as a column for broadcasting
+        # against (1, 3) end values
+        self._t = np.linspace(0.0, 1.0, self._interpolation_points)[:, np.newaxis]
+        self._mesh_cache.clear()
+
+    def clear_cache(self) -> None:
+        """Drop cached meshes."""
+        self._mesh_cache.clear()
 
     def build_deformed_mesh(
         self,
@@ -68,70 +102,71 @@ class DeformedRenderer:
 
         Returns:
             Tuple of (mesh, scalar_values) where scalars are displacement values
-            for color mapping
+            for color mapping. The mesh is a shallow copy of a cached one, so
+            adding arrays to it is safe; the scalars are shared with the
+            cache and read-only.
         """
-        if not model.frames:
-            return pv.PolyData(), np.array([])
-
-        # Pre-calculate displaced node positions
-        displaced_positions = self._calculate_displaced_positions(model, results, scale)
-
-        # Pre-allocate arrays
-        n_frames = len(model.frames)
-        n_points_per_frame = self._interpolation_points
-        total_points = n_frames * n_points_per_frame
-        total_lines = n_frames * (n_points_per_frame - 1)
-
-        points = np.zeros((total_points, 3), dtype=np.float64)
-        scalars = np.zeros(total_points, dtype=np.float64)
-        lines = np.zeros(total_lines * 3, dtype=np.int64)
-
-        line_index = 0
-        valid_frames = 0
-
-        for frame in model.frames:
-            frame_points, frame_scalars = self._interpolate_frame(
-                frame,
-                model,
-                results,
-                scale,
-                component,
-                displaced_positions,
-            )
-
-            if frame_points is None:
-                continue
-
-            n_pts = len(frame_points)
-            start_idx = valid_frames * n_points_per_frame
-
-            points[start_idx : start_idx + n_pts] = frame_points
-            scalars[start_idx : start_idx + n_pts] = frame_scalars
-
-            # Create line connectivity for this frame
-            for i in range(n_pts - 1):
-                lines[line_index * 3] = 2
-                lines[line_index * 3 + 1] = start_idx + i
-                lines[line_index * 3 + 2] = start_idx + i + 1
-                line_index += 1
-
-            valid_frames += 1
-
-        if valid_frames == 0:
+        tables = model.coordinate_tables()
+        if not tables.frame_ids:
             return pv.PolyData(), np.array([])
 
-        # Trim arrays to actual size
-        actual_points = valid_frames * n_points_per_frame
-        actual_lines = valid_frames * (n_points_per_frame - 1)
+        key = (
+            id(model),
+            id(results),
+            results.displacement_revision,
+            round(scale, 6),
+            component,
+        )
+        cached = self._mesh_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] is model
+            and cached[1] is results
+            and _same_geometry(cached[2], tables)
+        ):
+            self._mesh_cache.move_to_end(key)
+            return cached[3].copy(deep=False), cached[4]
+
+        # Displaced node positions, then frame end values as (F, 1, 3)
+        frame_nodes = tables.frames_ij
+        node_disp = _node_displacements(tables.node_ids, results)
+        displaced = tables.nodes_xyz + scale * node_disp
+        pos_i = displaced[frame_nodes[:, 0], np.newaxis]
+        pos_j = displaced[frame_nodes[:, 1], np.newaxis]
+        u_i = node_disp[frame_nodes[:, 0], np.newaxis]
+        u_j = node_disp[frame_nodes[:, 1], np.newaxis]
+
+        # Interpolate every frame at once against t as (1, P, 1), giving
+        # (F, P, 3) values that flatten to consecutive points per frame
+        t = self._t[np.newaxis]
+        points = _lerp(pos_i, pos_j, t)
+        u = _lerp(u_i, u_j, t)
+        scalars = _scalar_values(u, component)
+
+        # Line connectivity: segment k of frame f joins points f*P + k and
+        # f*P + k + 1. Every cell has two points, so VTK takes the (n, 2)
+        # array as its connectivity buffer with implicit offsets, instead
+        # of parsing the padded [2, a, b, ...] legacy layout
+        n_frames = len(frame_nodes)
+        n_pts = self._interpolation_points
+        starts = (
+            np.arange(n_frames, dtype=np.int64)[:, np.newaxis] * n_pts
+            + np.arange(n_pts - 1, dtype=np.int64)
+        ).ravel()
+        segments = np.empty((starts.size, 2), dtype=np.int64)
+        segments[:, 0] = starts
+        segments[:, 1] = starts + 1
 
-        points = points[:actual_points]
-        scalars = scalars[:actual_points]
-        lines = lines[: actual_lines * 3]
+        mesh = pv.PolyData(_render_floats(points))
+        mesh.lines = pv.CellArray.from_regular_cells(segments)  # type: ignore[arg-type]
+        scalars = _render_floats(scalars)
+        scalars.setflags(write=False)
 
-        mesh = pv.PolyData(points)
-        mesh.lines = lines  # type: ignore[assignment]
+        self._mesh_cache[key] = (model, results, tables, mesh, scalars)
+        if len(self._mesh_cache) > _MESH_CACHE_SIZE:
+            self._mesh_cache.popitem(last=False)
 
-        return mesh, scalars
+        return mesh.copy(deep=False), scalars
 
     def build_deformed_nodes(
         self,
@@ -152,37 +187,17 @@ class DeformedRenderer:
         Returns:
             Tuple of (point_cloud, scalar_values)
         """
-        if not model.nodes:
+        tables = model.coordinate_tables()
+        node_ids = tables.node_ids
+        if not node_ids:
             return pv.PolyData(), np.array([])
 
-        points = []
-        scalars = []
-        node_ids = []
-
-        for node in model.nodes:
-            disp = results.get_displacement(node.id)
-
-            if disp is None:
-                ux, uy, uz = 0.0, 0.0, 0.0
-            else:
-                ux, uy, uz = disp.Ux, disp.Uy, disp.Uz
+        node_disp = _node_displacements(node_ids, results)
 
-            # Deformed position
-            x_def = node.x + scale * ux
-            y_def = node.y + scale * uy
-            z_def = node.z + scale * uz
+        point_cloud = pv.PolyData(_render_floats(tables.nodes_xyz + scale * node_disp))
+        point_cloud["node_id"] = np.array(node_ids, dtype=_id_dtype(node_ids))
 
-            points.append([x_def, y_def, z_def])
-            scalars.append(self._get_scalar_value(ux, uy, uz, component))
-            node_ids.append(node.id)
-
-        points_array = np.array(points, dtype=np.float64)
-        scalars_array = np.array(scalars, dtype=np.float64)
-
-        point_cloud = pv.PolyData(points_array)
-        point_cloud["node_id"] = np.array(node_ids, dtype=np.int64)  # type: ignore[assignment]
-
-        return point_cloud, scalars_array
+        return point_cloud, _render_floats(_scalar_values(node_disp, component))
 
     def get_deformed_node_position(
         self,
@@ -233,141 +248,77 @@ class DeformedRenderer:
         if not results.displacements:
             return (0.0, 0.0)
 
-        values = []
-        for disp in results.displacements.values():
-            scalar = self._get_scalar_value(disp.Ux, disp.Uy, disp.Uz, component)
-            values.append(scalar)
-
-        if not values:
-            return (0.0, 0.0)
-
-        return (min(values), max(values))
-
-    def _calculate_displaced_positions(
-        self,
-        model: StructuralModel,
-        results: AnalysisResults,
-        scale: float,
-    ) -> dict[int, tuple[float, float, float]]:
-        """
-        Pre-calculate displaced positions for all nodes.
-
-        Args:
-            model: Structural model
-            results: Analysis results
-            scale: Deformation scale factor
-
-        Returns:
-            Dictionary mapping node_id to displaced (x, y, z)
-        """
-        positions = {}
-
-        for node in model.nodes:
-            disp = results.get_displacement(node.id)
-
-            if disp is None:
-                positions[node.id] = (node.x, node.y, node.z)
-            else:
-                positions[node.id] = (
-                    node.x + scale * disp.Ux,
-                    node.y + scale * disp.Uy,
-                    node.z + scale * disp.Uz,
-                )
+        values = _scalar_values(results.displacement_array()[1][:, :3], component)
 
-        return positions
-
-    def _interpolate_frame(
-        self,
-        frame: Frame,
-        _model: StructuralModel,
-        results: AnalysisResults,
-        _scale: float,
-        component: DisplacementComponent,
-        displaced_positions: dict[int, tuple[float, float, float]],
-    ) -> tuple[np.ndarray | None, np.ndarray | None]:
-        """
-        Interpolate deformation along a frame element.
+        return (float(values.min()), float(values.max()))
 
-        Uses linear interpolation between end nodes.
 
-        Args:
-            frame: Frame element
-            _model: Structural model (unused, positions pre-calculated)
-            results: Analysis results
-            _scale: Deformation scale (unused, positions pre-calculated)
-            component: Displacement component for scalars
-            displaced_positions: Pre-calculated displaced node positions
+def _render_floats(values: np.ndarray) -> np.ndarray:
+    """
+    Downcast a finished float64 buffer to contiguous float32 for VTK.
 
-        Returns:
-            Tuple of (points_array, scalars_array) or (None, None) if invalid
-        """
-        # Get displaced end positions
-        pos_i = displaced_positions.get(frame.node_i_id)
-        pos_j = displaced_positions.get(frame.node_j_id)
+    OpenGL draws in single precision, so the doubles would only be halved
+    on upload; the math before this point stays in float64.
+    """
+    return np.ascontiguousarray(values, dtype=np.float32)
 
-        if pos_i is None or pos_j is None:
-            return None, None
 
-        # Get displacement values for scalar interpolation
-        disp_i = results.get_displacement(frame.node_i_id)
-        disp_j = results.get_displacement(frame.node_j_id)
+def _id_dtype(ids: list[int]) -> type[np.signedinteger]:
+    """Use int32 for id arrays whose values fit, int64 otherwise."""
+    limit = np.iinfo(np.int32)
+    if ids and (min(ids) < limit.min or max(ids) > limit.max):
+        return np.int64
+    return np.int32
 
-        if disp_i is None:
-            ux_i, uy_i, uz_i = 0.0, 0.0, 0.0
-        else:
-            ux_i, uy_i, uz_i = disp_i.Ux, disp_i.Uy, disp_i.Uz
 
-        if disp_j is None:
-            ux_j, uy_j, uz_j = 0.0, 0.0, 0.0
-        else:
-            ux_j, uy_j, uz_j = disp_j.Ux, disp_j.Uy, disp_j.Uz
+def _same_geometry(a: CoordinateTables, b: CoordinateTables) -> bool:
+    """Check whether two coordinate tables hold the same nodes and frames."""
+    return (
+        a.node_ids == b.node_ids
+        and np.array_equal(a.nodes_xyz, b.nodes_xyz)
+        and np.array_equal(a.frames_ij, b.frames_ij)
+    )
 
-        # Interpolate along frame
-        n_pts = self._interpolation_points
-        points = np.zeros((n_pts, 3), dtype=np.float64)
-        scalars = np.zeros(n_pts, dtype=np.float64)
 
-        for i in range(n_pts):
-            t = i / (n_pts - 1)
+def _lerp(start: np.ndarray, end: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolate (F, 1, 3) end values at (1, P, 1) parameters.
 
-            # Interpolated position (using displaced positions)
-            points[i, 0] = pos_i[0] + t * (pos_j[0] - pos_i[0])
-            points[i, 1] = pos_i[1] + t * (pos_j[1] - pos_i[1])
-            points[i, 2] = pos_i[2] + t * (pos_j[2] - pos_i[2])
+    Returns the (F * P, 3) values; the start offset is added in place so
+    only one full-size array is allocated.
+    """
+    values: np.ndarray = t * (end - start)
+    values += start
+    return values.reshape(-1, 3)
 
-            # Interpolated displacement for scalar
-            ux = ux_i + t * (ux_j - ux_i)
-            uy = uy_i + t * (uy_j - uy_i)
-            uz = uz_i + t * (uz_j - uz_i)
 
-            scalars[i] = self._get_scalar_value(ux, uy, uz, component)
+def _node_displacements(node_ids: list[int], results: AnalysisResults) -> np.ndarray:
+    """Get the (N, 3) translations of the given nodes, zero where missing."""
+    node_disp = np.zeros((len(node_ids), 3), dtype=np.float64)
+    disp_ids, values = results.displacement_array()
+    if not node_ids or not disp_ids.size:
+        return node_disp
 
-        return points, scalars
+    # Row of each displaced node among node_ids, via a sorted search
+    ids = np.asarray(node_ids, dtype=np.int64)
+    order = np.argsort(ids)
+    rows = order[np.minimum(np.searchsorted(ids, disp_ids, sorter=order), ids.size - 1)]
+    found = ids[rows] == disp_ids
+    node_disp[rows[found]] = values[found, :3]
+    return node_disp
 
-    def _get_scalar_value(
-        self,
-        ux: float,
-        uy: float,
-        uz: float,
-        component: DisplacementComponent,
-    ) -> float:
-        """
-        Get scalar value for a displacement based on selected component.
 
-        Args:
-            ux: X displacement
-            uy: Y displacement
-            uz: Z displacement
-            component: Which component to return
+def _scalar_values(u: np.ndarray, component: DisplacementComponent) -> np.ndarray:
+    """
+    Get scalar values for an (n, 3) array of displacements.
 
-        Returns:
-            Scalar value for color mapping
-        """
-        if component == DisplacementComponent.UX:
-            return ux
-        if component == DisplacementComponent.UY:
-            return uy
-        if component == DisplacementComponent.UZ:
-            return uz
-        # TOTAL - magnitude
-        return float(np.sqrt(ux**2 + uy**2 + uz**2))
+    Single components are a column lookup; TOTAL is the row magnitude.
+    """
+    column = _COMPONENT_COLUMNS.get(component)
+    if column is not None:
+        return u[:, column]
+    # TOTAL - magnitude
+    # Row-wise dot product without a full-size u * u temporary
+    magnitude: np.ndarray = np.einsum("ij,ij->i", u, u)
+    np.sqrt(magnitude, out=magnitude)
+    return magnitude
@@ -7,22 +7,139 @@ with proper orientation based on local coordinate systems.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pyvista as pv
 
-from paz.domain.model.local_axes import calculate_local_axes
+from paz.domain.model.local_axes import LocalAxes, calculate_local_axes_xyz
 from paz.domain.sections.profile_geometry import ProfileGenerator, ProfileGeometry
 
 
 if TYPE_CHECKING:
-    from paz.domain.model import Frame, Node, StructuralModel
+    from collections.abc import Iterable
+
+    from paz.domain.model import Frame, StructuralModel
     from paz.domain.results import AnalysisResults
     from paz.domain.sections.section import Section
 
 
+# Material name patterns and their display colors, matched in order; built
+# once at import instead of on every color lookup
+_MATERIAL_COLORS: dict[str, str] = {
+    "steel": "#708090",  # Steel gray
+    "a36": "#708090",
+    "a572": "#708090",
+    "a992": "#708090",
+    "concrete": "#A9A9A9",  # Concrete gray
+    "h20": "#A9A9A9",
+    "h25": "#A9A9A9",
+    "h30": "#A9A9A9",
+    "wood": "#DEB887",  # Wood brown
+    "timber": "#DEB887",
+    "aluminum": "#C0C0C0",  # Aluminum silver
+    "default": "#4169E1",  # Royal blue default
+}
+
+# (start point, end point, local axes) of a frame to extrude
+_Placement = tuple[np.ndarray, np.ndarray, LocalAxes]
+
+
+@dataclass(frozen=True)
+class _FaceTemplate:
+    """
+    Polygon connectivity of one extruded frame, repeatable for many frames.
+
+    Attributes:
+        offsets: Start of each cell in connectivity
+        connectivity: Point indices of all cells, back to back
+    """
+
+    offsets: np.ndarray
+    connectivity: np.ndarray
+
+    @classmethod
+    def of(cls, connectivity: np.ndarray, cell_size: int) -> _FaceTemplate:
+        """Template of same-size cells given as flat connectivity."""
+        offsets = np.arange(0, connectivity.size, cell_size, dtype=np.int64)
+        return cls(offsets=offsets, connectivity=connectivity)
+
+    def extend(self, connectivity: np.ndarray, cell_size: int) -> _FaceTemplate:
+        """Template with more same-size cells appended."""
+        more = _FaceTemplate.of(connectivity, cell_size)
+        return _FaceTemplate(
+            offsets=np.concatenate((self.offsets, more.offsets + self.connectivity.size)),
+            connectivity=np.concatenate((self.connectivity, connectivity)),
+        )
+
+    def tile_into(
+        self,
+        offsets: np.ndarray,
+        connectivity: np.ndarray,
+        n_copies: int,
+        point_stride: int,
+        point_start: int,
+        connectivity_start: int,
+    ) -> None:
+        """
+        Write the cells of n_copies frames back to back into output slices.
+
+        Copy k refers to points point_start + k * point_stride onwards, and
+        its cells start at connectivity_start + k * len(self.connectivity).
+
+        Args:
+            offsets: Output slice of n_copies * len(self.offsets) cell starts
+            connectivity: Output slice of n_copies * len(self.connectivity)
+                point indices
+            n_copies: Number of frames
+            point_stride: Points per frame
+            point_start: Index of the first frame's first point
+            connectivity_start: Position of the first frame's cells
+        """
+        copies = np.arange(n_copies, dtype=np.int64)[:, np.newaxis]
+        np.add(
+            self.offsets,
+            copies * self.connectivity.size + connectivity_start,
+            out=offsets.reshape(n_copies, self.offsets.size),
+        )
+        np.add(
+            self.connectivity,
+            copies * point_stride + point_start,
+            out=connectivity.reshape(n_copies, self.connectivity.size),
+        )
+
+
+@dataclass(frozen=True)
+class _CachedProfile:
+    """
+    Section profile prepared for extrusion.
+
+    Everything here depends only on the section, so it is built once and
+    shared by every frame using it; only the point positions are per frame.
+
+    Attributes:
+        vertices: Outer boundary (N, 2) as contiguous float64
+        side_faces: Quads joining the start ring (points 0..N-1) to the
+            end ring (points N..2N-1)
+        capped_faces: side_faces followed by the triangles of the start and
+            end caps (just the sides if the profile could not be triangulated)
+    """
+
+    vertices: np.ndarray
+    side_faces: _FaceTemplate
+    capped_faces: _FaceTemplate
+
+
+# Prepared profile, placements and frame ids of frames sharing a section
+_FrameGroup = tuple[_CachedProfile, list[_Placement], list[int]]
+
+# Mesh holding an extruded frame, its profile, its first point and first
+# cell in the mesh, and the material the mesh is for (None if shared)
+_FrameSlot = tuple[pv.PolyData, _CachedProfile, int, int, str | None]
+
+
 @dataclass
 class ExtrudedSettings:
     """Settings for extruded rendering."""
@@ -55,7 +172,13 @@ class ExtrudedRenderer:
         self._profile_generator = ProfileGenerator(
             circle_segments=self._settings.high_detail_segments
         )
-        self._section_cache: dict[str, ProfileGeometry] = {}
+        self._section_cache: dict[str, _CachedProfile] = {}
+        # Sections whose profile could not be generated, not retried
+        # until clear_cache()
+        self._failed_sections: set[str] = set()
+        # Where each frame of the last build_extruded_mesh or
+        # build_extruded_mesh_by_material result sits, for update_frame()
+        self._frame_layout: dict[int, _FrameSlot] = {}
 
     @property
     def settings(self) -> ExtrudedSettings:
@@ -77,29 +200,86 @@ class ExtrudedRenderer:
         Returns:
             Combined PyVista mesh for all extruded frames
         """
+        self._frame_layout = {}
         if not model.frames:
             return pv.PolyData()
 
-        meshes: list[pv.PolyData] = []
+        groups = self._place_frames(model.frames, sections, *_node_table(model))
+        if not groups:
+            return pv.PolyData()
 
-        for frame in model.frames:
-            section = sections.get(frame.section_name)
-            if section is None:
-                continue
+        mesh = self._build_mesh(groups)
+        self._frame_layout = self._frame_slots(mesh, groups, None)
+        return mesh
 
-            mesh = self._extrude_frame(frame, model, section)
-            if mesh is not None and mesh.n_points > 0:
-                meshes.append(mesh)
+    def update_frame(self, model: StructuralModel, frame_id: int) -> bool:
+        """
+        Re-extrude one frame of the last built mesh(es) in place.
 
-        if not meshes:
-            return pv.PolyData()
+        For edits that keep the frame's section (moved nodes, a new
+        rotation), only that frame's points and shading normals are
+        rewritten in the existing mesh; nothing else is extruded, combined
+        or shaded again.
 
-        # Combine all meshes
-        combined = meshes[0]
-        for mesh in meshes[1:]:
-            combined = combined.merge(mesh)
+        Args:
+            model: Structural model owning the frame
+            frame_id: ID of the edited frame
+
+        Returns:
+            True if the mesh was updated; False if the frame is not in it
+            or now uses another section (or, in a per-material mesh,
+            another material), in which case rebuild the mesh
+        """
+        slot = self._frame_layout.get(frame_id)
+        if slot is None or not model.has_frame(frame_id):
+            return False
+
+        mesh, profile, point_start, cell_start, material = slot
+        frame = model.get_frame(frame_id)
+        if self._section_cache.get(frame.section_name) is not profile:
+            return False
+        if material is not None and frame.material_name != material:
+            return False
+
+        node_i = model.get_node(frame.node_i_id)
+        node_j = model.get_node(frame.node_j_id)
+        placement = self._place_frame(
+            frame,
+            {node_i.id: 0, node_j.id: 1},
+            np.array(
+                [(node_i.x, node_i.y, node_i.z), (node_j.x, node_j.y, node_j.z)],
+                dtype=np.float64,
+            ),
+        )
 
-        return combined
+        # Same section, so the frame keeps its point count and its faces
+        n_points = 2 * len(profile.vertices)
+        points = np.empty((n_points, 3), dtype=np.float64)
+        self._extrude_into(profile, [placement], points)
+        mesh.points[point_start : point_start + n_points] = points  # type: ignore[index]
+
+        if self._settings.smooth_shading:
+            # Frames share no points, so the normals of this frame's solid
+            # alone are the ones the whole mesh would get
+            template = self._face_template(profile)
+            offsets = np.empty(template.offsets.size + 1, dtype=pv.ID_TYPE)
+            connectivity = np.empty(template.connectivity.size, dtype=pv.ID_TYPE)
+            template.tile_into(offsets[:-1], connectivity, 1, n_points, 0, 0)
+            offsets[-1] = connectivity.size
+            solid = pv.PolyData(
+                points,
+                faces=pv.CellArray.from_arrays(offsets, connectivity),  # type: ignore[arg-type]
+            ).compute_normals(non_manifold_traversal=False)
+
+            n_cells = template.offsets.size
+            mesh.point_data["Normals"][point_start : point_start + n_points] = (  # type: ignore[index]
+                solid.point_data["Normals"]
+            )
+            mesh.cell_data["Normals"][cell_start : cell_start + n_cells] = (  # type: ignore[index]
+                solid.cell_data["Normals"]
+            )
+
+        return True
 
     def build_extruded_mesh_by_material(
         self,
@@ -116,30 +296,22 @@ class ExtrudedRenderer:
         Returns:
             Dictionary mapping material_id to combined mesh
         """
-        material_meshes: dict[str, list[pv.PolyData]] = {}
+        material_frames: defaultdict[str, list[Frame]] = defaultdict(list)
 
         for frame in model.frames:
-            section = sections.get(frame.section_name)
-            if section is None:
-                continue
-
-            mesh = self._extrude_frame(frame, model, section)
-            if mesh is None or mesh.n_points == 0:
-                continue
-
-            mat_id = frame.material_name
-            if mat_id not in material_meshes:
-                material_meshes[mat_id] = []
-            material_meshes[mat_id].append(mesh)
+            material_frames[frame.material_name].append(frame)
 
         # Combine meshes per material
+        self._frame_layout = {}
+        node_rows, node_xyz = _node_table(model)
         result: dict[str, pv.PolyData] = {}
-        for mat_id, meshes in material_meshes.items():
-            if meshes:
-                combined = meshes[0]
-                for mesh in meshes[1:]:
-                    combined = combined.merge(mesh)
-                result[mat_id] = combined
+        for mat_id, frames in material_frames.items():
+            groups = self._place_frames(frames, sections, node_rows, node_xyz)
+            if groups:
+                result[mat_id] = self._build_mesh(groups)
+                self._frame_layout.update(
+                    self._frame_slots(result[mat_id], groups, mat_id)
+                )
 
         return result
 
@@ -165,204 +337,314 @@ class ExtrudedRenderer:
         if not model.frames:
             return pv.PolyData()
 
-        meshes: list[pv.PolyData] = []
+        # Deformed node positions in one array operation; nodes without
+        # results keep their original position
+        node_rows, node_xyz = _node_table(model)
+        node_disp = np.zeros_like(node_xyz)
+        for node_id, disp in results.displacements.items():
+            row = node_rows.get(node_id)
+            if row is not None:
+                node_disp[row] = (disp.Ux, disp.Uy, disp.Uz)
+        node_xyz += scale * node_disp
+
+        groups = self._place_frames(
+            model.frames, sections, node_rows, node_xyz, deformed=True
+        )
+        if not groups:
+            return pv.PolyData()
 
-        for frame in model.frames:
-            section = sections.get(frame.section_name)
-            if section is None:
-                continue
+        return self._build_mesh(groups)
 
-            mesh = self._extrude_frame_deformed(frame, model, section, results, scale)
-            if mesh is not None and mesh.n_points > 0:
-                meshes.append(mesh)
+    def _build_mesh(self, groups: list[_FrameGroup]) -> pv.PolyData:
+        """
+        Extrude groups of placed frames into a single PolyData.
 
-        if not meshes:
-            return pv.PolyData()
+        Extruded frames are separate solids that never share points: even
+        where two frames meet, each has its own ring there, with its own
+        shading normals. So every group is written straight into slices of
+        buffers sized for the whole mesh, with no cleaning or coincident
+        point search, and no intermediate per-group arrays to concatenate.
+        This is the only VTK object a build creates; shading normals are
+        computed once here, for the whole mesh.
+
+        Args:
+            groups: Non-empty list of (profile, placements, frame ids)
+
+        Returns:
+            Combined mesh
+        """
+        templates = [self._face_template(profile) for profile, _, _ in groups]
+        counts = [len(placements) for _, placements, _ in groups]
+        strides = [2 * len(profile.vertices) for profile, _, _ in groups]
+
+        # Cell buffers are allocated as vtkIdType so VTK wraps them without
+        # a conversion copy. Points stay float64: thin flanges far from the
+        # origin lose too much in float32 for the shading normals
+        points = np.empty(
+            (sum(k * stride for k, stride in zip(counts, strides, strict=True)), 3),
+            dtype=np.float64,
+        )
+        offsets = np.empty(
+            sum(k * t.offsets.size for k, t in zip(counts, templates, strict=True)) + 1,
+            dtype=pv.ID_TYPE,
+        )
+        connectivity = np.empty(
+            sum(k * t.connectivity.size for k, t in zip(counts, templates, strict=True)),
+            dtype=pv.ID_TYPE,
+        )
+
+        point_start = 0
+        cell_start = 0
+        conn_start = 0
+        for (profile, placements, _), template, k, stride in zip(
+            groups, templates, counts, strides, strict=True
+        ):
+            n_cells = k * template.offsets.size
+            n_conn = k * template.connectivity.size
+            self._extrude_into(
+                profile, placements, points[point_start : point_start + k * stride]
+            )
+            template.tile_into(
+                offsets[cell_start : cell_start + n_cells],
+                connectivity[conn_start : conn_start + n_conn],
+                k,
+                stride,
+                point_start,
+                conn_start,
+            )
+            point_start += k * stride
+            cell_start += n_cells
+            conn_start += n_conn
+        offsets[-1] = conn_start
+
+        mesh = pv.PolyData(
+            points,
+            faces=pv.CellArray.from_arrays(offsets, connectivity),  # type: ignore[arg-type]
+        )
 
-        combined = meshes[0]
-        for mesh in meshes[1:]:
-            combined = combined.merge(mesh)
+        if self._settings.smooth_shading:
+            # Every extruded solid is manifold (each edge joins at most two
+            # faces), so the non-manifold edge traversal would find nothing
+            mesh.compute_normals(inplace=True, non_manifold_traversal=False)
 
-        return combined
+        return mesh
 
-    def _extrude_frame(
+    def _frame_slots(
+        self, mesh: pv.PolyData, groups: list[_FrameGroup], material: str | None
+    ) -> dict[int, _FrameSlot]:
+        """Map frame ids to where _build_mesh put them in mesh."""
+        slots: dict[int, _FrameSlot] = {}
+        point_start = 0
+        cell_start = 0
+        for profile, _, frame_ids in groups:
+            n_points = 2 * len(profile.vertices)
+            n_cells = self._face_template(profile).offsets.size
+            for frame_id in frame_ids:
+                slots[frame_id] = (mesh, profile, point_start, cell_start, material)
+                point_start += n_points
+                cell_start += n_cells
+        return slots
+
+    def _face_template(self, profile: _CachedProfile) -> _FaceTemplate:
+        """Side faces of a profile, plus end caps if enabled."""
+        if self._settings.show_end_caps:
+            return profile.capped_faces
+        return profile.side_faces
+
+    def _place_frames(
         self,
-        frame: Frame,
-        model: StructuralModel,
-        section: Section,
-    ) -> pv.PolyData | None:
-        """Extrude a single frame element."""
-        node_i = model.get_node(frame.node_i_id)
-        node_j = model.get_node(frame.node_j_id)
+        frames: list[Frame],
+        sections: dict[str, Section],
+        node_rows: dict[int, int],
+        node_xyz: np.ndarray,
+        deformed: bool = False,
+    ) -> list[_FrameGroup]:
+        """
+        Place frames, grouped by section.
 
-        # Get or generate profile geometry
-        profile = self._get_profile(section)
-        if profile is None:
-            return None
+        Frames sharing a section are placed individually and then extruded
+        together in one batched transform by _build_mesh.
 
-        # Calculate local axes
-        local_axes = calculate_local_axes(node_i, node_j, frame.rotation)
+        Args:
+            frames: Frames to extrude
+            sections: Section dictionary
+            node_rows: Row of each node id in node_xyz
+            node_xyz: (N, 3) node positions, deformed or not
+            deformed: Whether the positions are deformed; frames that the
+                deformation collapses to zero length are then left out
+
+        Returns:
+            Profile, placements and frame ids of the sections used, in
+            order of first use; sections without placed frames are left out
+        """
+        # Profiles are resolved once per distinct section, so frames of
+        # missing or failed sections are skipped with a single dict lookup
+        profiles = self._get_profiles(
+            dict.fromkeys(frame.section_name for frame in frames), sections
+        )
+        groups: dict[str, _FrameGroup] = {
+            name: (profile, [], []) for name, profile in profiles.items()
+        }
+
+        for frame in frames:
+            group = groups.get(frame.section_name)
+            if group is None:
+                continue
 
-        # Transform profile to 3D at start and end positions
-        start_pos = np.array([node_i.x, node_i.y, node_i.z])
-        end_pos = np.array([node_j.x, node_j.y, node_j.z])
+            try:
+                placement = self._place_frame(frame, node_rows, node_xyz)
+            except ValueError:
+                # Zero length element
+                if not deformed:
+                    raise
+                continue
+            group[1].append(placement)
+            group[2].append(frame.id)
 
-        return self._create_extrusion_mesh(profile, start_pos, end_pos, local_axes)
+        return [group for group in groups.values() if group[1]]
 
-    def _extrude_frame_deformed(
+    def _place_frame(
         self,
         frame: Frame,
-        model: StructuralModel,
-        section: Section,
-        results: AnalysisResults,
-        scale: float,
-    ) -> pv.PolyData | None:
-        """Extrude frame with deformed end positions."""
-        node_i = model.get_node(frame.node_i_id)
-        node_j = model.get_node(frame.node_j_id)
+        node_rows: dict[int, int],
+        node_xyz: np.ndarray,
+    ) -> _Placement:
+        """Get the end positions and local axes of a frame."""
+        start_pos = node_xyz[node_rows[frame.node_i_id]]
+        end_pos = node_xyz[node_rows[frame.node_j_id]]
 
-        # Get displacements
-        disp_i = results.get_displacement(node_i.id)
-        disp_j = results.get_displacement(node_j.id)
-
-        # Calculate deformed positions
-        if disp_i:
-            start_pos = np.array([
-                node_i.x + scale * disp_i.Ux,
-                node_i.y + scale * disp_i.Uy,
-                node_i.z + scale * disp_i.Uz,
-            ])
-        else:
-            start_pos = np.array([node_i.x, node_i.y, node_i.z])
-
-        if disp_j:
-            end_pos = np.array([
-                node_j.x + scale * disp_j.Ux,
-                node_j.y + scale * disp_j.Uy,
-                node_j.z + scale * disp_j.Uz,
-            ])
-        else:
-            end_pos = np.array([node_j.x, node_j.y, node_j.z])
-
-        # Get profile and calculate local axes (from deformed geometry)
-        profile = self._get_profile(section)
-        if profile is None:
-            return None
+        # Calculate local axes
+        xi, yi, zi = start_pos.tolist()
+        xj, yj, zj = end_pos.tolist()
+        local_axes = calculate_local_axes_xyz(xi, yi, zi, xj, yj, zj, frame.rotation)
 
-        # Create temporary nodes for local axes calculation
-        from paz.domain.model.node import Node
-        temp_i = Node(id=-1, x=start_pos[0], y=start_pos[1], z=start_pos[2])
-        temp_j = Node(id=-2, x=end_pos[0], y=end_pos[1], z=end_pos[2])
+        return start_pos, end_pos, local_axes
 
-        try:
-            local_axes = calculate_local_axes(temp_i, temp_j, frame.rotation)
-        except ValueError:
-            # Zero length element
-            return None
+    def _get_profiles(
+        self,
+        names: Iterable[str],
+        sections: dict[str, Section],
+    ) -> dict[str, _CachedProfile]:
+        """
+        Get the prepared profiles of the named sections.
 
-        return self._create_extrusion_mesh(profile, start_pos, end_pos, local_axes)
+        Args:
+            names: Section names, without duplicates
+            sections: Section dictionary
 
-    def _get_profile(self, section: Section) -> ProfileGeometry | None:
+        Returns:
+            Profiles by name, in the order of names; sections that are
+            missing or cannot be profiled are left out
+        """
+        profiles: dict[str, _CachedProfile] = {}
+        for name in names:
+            section = sections.get(name)
+            if section is None:
+                continue
+            profile = self._get_profile(section)
+            if profile is not None:
+                profiles[name] = profile
+        return profiles
+
+    def _get_profile(self, section: Section) -> _CachedProfile | None:
         """Get or generate cached profile geometry."""
         cache_key = section.name
         if cache_key in self._section_cache:
             return self._section_cache[cache_key]
+        if cache_key in self._failed_sections:
+            return None
 
         try:
             profile = self._profile_generator.generate(section)
-            self._section_cache[cache_key] = profile
-            return profile
         except Exception:
+            self._failed_sections.add(cache_key)
             return None
 
-    def _create_extrusion_mesh(
-        self,
-        profile: ProfileGeometry,
-        start_pos: np.ndarray,
-        end_pos: np.ndarray,
-        local_axes: Any,
-    ) -> pv.PolyData:
-        """
-        Create 3D extrusion mesh from profile and frame geometry.
+        cached = self._prepare_profile(profile)
+        self._section_cache[cache_key] = cached
+        return cached
 
-        Args:
-            profile: 2D profile geometry
-            start_pos: Start point (3D)
-            end_pos: End point (3D)
-            local_axes: Local coordinate system
-
-        Returns:
-            PyVista mesh representing the extruded section
-        """
-        # Build transformation matrix (local to global)
-        # axis1 is along the element, axis2 and axis3 are perpendicular
-        # Profile is defined in local Y-Z plane (axis2-axis3)
-        rot_matrix = np.array([
-            local_axes.axis2,  # X-profile -> axis2
-            local_axes.axis3,  # Y-profile -> axis3
-            local_axes.axis1,  # Z-profile -> axis1 (extrusion direction)
-        ]).T
-
-        # Transform 2D profile vertices to 3D at start position
-        n_verts = len(profile.vertices)
-        start_verts_3d = np.zeros((n_verts, 3))
-        end_verts_3d = np.zeros((n_verts, 3))
-
-        for i, (px, py) in enumerate(profile.vertices):
-            # Profile point in local coords: (px, py, 0)
-            local_point = np.array([px, py, 0.0])
-            global_offset = rot_matrix @ local_point
-
-            start_verts_3d[i] = start_pos + global_offset
-            end_verts_3d[i] = end_pos + global_offset
-
-        # Create mesh with side faces
-        all_points = np.vstack([start_verts_3d, end_verts_3d])
-
-        # Build faces (quads connecting start and end profiles)
-        faces = []
-        for i in range(n_verts):
-            i_next = (i + 1) % n_verts
-            # Quad: start[i], start[i+1], end[i+1], end[i]
-            faces.append([4, i, i_next, n_verts + i_next, n_verts + i])
-
-        # Add end caps if enabled
-        if self._settings.show_end_caps and n_verts >= 3:
-            # Simple fan triangulation from centroid
-            # This works well for convex and most concave sections
-            try:
-                triangles = self._triangulate_polygon(profile.vertices)
+    def _prepare_profile(self, profile: ProfileGeometry) -> _CachedProfile:
+        """Precompute the vertex array and face connectivity of a profile."""
+        vertices = np.ascontiguousarray(profile.vertices, dtype=np.float64)
+        n_verts = len(vertices)
 
-                # Start cap (reversed winding for correct normal)
-                for tri_idx in triangles:
-                    faces.append([3, tri_idx[2], tri_idx[1], tri_idx[0]])
+        # Side quads: start[i], start[i+1], end[i+1], end[i]
+        i = np.arange(n_verts, dtype=np.int64)
+        i_next = np.roll(i, -1)
+        sides = np.column_stack((i, i_next, i_next + n_verts, i + n_verts)).ravel()
 
-                # End cap
-                for tri_idx in triangles:
-                    faces.append([3, n_verts + tri_idx[0], n_verts + tri_idx[1], n_verts + tri_idx[2]])
+        caps = np.empty(0, dtype=np.int64)
+        if n_verts >= 3:
+            try:
+                triangles = np.array(
+                    self._triangulate_polygon(vertices), dtype=np.int64
+                ).reshape(-1, 3)
+
+                # Start cap (reversed winding for correct normal), then end cap
+                caps = np.concatenate(
+                    (triangles[:, ::-1].ravel(), (triangles + n_verts).ravel())
+                )
             except Exception:
                 # Skip caps if triangulation fails
                 pass
 
-        faces_array = np.hstack(faces)
-        mesh = pv.PolyData(all_points, faces=faces_array)
+        side_faces = _FaceTemplate.of(sides, 4)
+        return _CachedProfile(
+            vertices=vertices,
+            side_faces=side_faces,
+            capped_faces=side_faces.extend(caps, 3),
+        )
 
-        if self._settings.smooth_shading:
-            mesh.compute_normals(inplace=True)
+    def _extrude_into(
+        self,
+        profile: _CachedProfile,
+        placements: list[_Placement],
+        out: np.ndarray,
+    ) -> None:
+        """
+        Write the 3D extrusion points of frames sharing a profile.
 
-        return mesh
+        Args:
+            profile: Prepared 2D profile geometry
+            placements: (start point, end point, local axes) of each frame
+            out: (len(placements) * 2 * V, 3) output slice; per frame the
+                start ring (V points), then the end ring (V points)
+        """
+        starts = np.array([start for start, _, _ in placements], dtype=np.float64)
+        ends = np.array([end for _, end, _ in placements], dtype=np.float64)
+
+        # Profile is defined in the local 2-3 plane: its x maps to axis2 and
+        # its y to axis3 (points are (px, py, 0), so axis1 never applies).
+        # One batched (V, 2) @ (K, 2, 3) product transforms every frame.
+        axes = np.array(
+            [(local_axes.axis2, local_axes.axis3) for _, _, local_axes in placements],
+            dtype=np.float64,
+        )
+        offsets = profile.vertices @ axes
+
+        n_verts = len(profile.vertices)
+        points = out.reshape(len(placements), 2 * n_verts, 3)
+        np.add(starts[:, np.newaxis], offsets, out=points[:, :n_verts])
+        np.add(ends[:, np.newaxis], offsets, out=points[:, n_verts:])
 
     def clear_cache(self) -> None:
         """Clear the section profile cache."""
         self._section_cache.clear()
+        self._failed_sections.clear()
+        self._frame_layout = {}
 
     def _triangulate_polygon(
         self, vertices: np.ndarray
     ) -> list[tuple[int, int, int]]:
         """
-        Simple ear-clipping triangulation for polygon.
+        Ear-clipping triangulation for polygon.
 
-        Works for simple polygons (no self-intersections).
+        Works for simple polygons (no self-intersections), convex or not,
+        so I, C and L profiles get caps without overlapping triangles.
+        Triangles keep the winding of the polygon, and a convex polygon
+        gives the fan from its first vertex. Runs once per section (the
+        result is cached with the profile), so plain Python is enough.
 
         Args:
             vertices: 2D vertices array (N, 2)
@@ -376,15 +658,80 @@ class ExtrudedRenderer:
         if n == 3:
             return [(0, 1, 2)]
 
-        # Simple fan triangulation from first vertex
-        # Works for convex polygons and many concave ones
-        triangles = []
-        for i in range(1, n - 1):
-            triangles.append((0, i, i + 1))
+        points = [(float(x), float(y)) for x, y in vertices]
+        # Signed doubled area: positive for counter-clockwise vertices.
+        # Multiplying by the orientation makes convex corners positive.
+        area = sum(
+            x0 * y1 - x1 * y0
+            for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1], strict=True)
+        )
+        orientation = 1.0 if area >= 0 else -1.0
+        tolerance = abs(area) * 1e-12
+
+        def turn(a: int, b: int, c: int) -> float:
+            (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+            return orientation * ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+        def is_ear(a: int, b: int, c: int) -> bool:
+            if turn(a, b, c) <= tolerance:
+                return False
+            # No other vertex may lie inside the candidate triangle or on
+            # its edges (a vertex on the new diagonal would be cut off)
+            return not any(
+                turn(a, b, p) >= -tolerance
+                and turn(b, c, p) >= -tolerance
+                and turn(c, a, p) >= -tolerance
+                for p in remaining
+                if p not in (a, b, c)
+            )
+
+        remaining = list(range(n))
+        triangles: list[tuple[int, int, int]] = []
+        while len(remaining) > 3:
+            # Try the corner after the first remaining vertex first, so a
+            # convex polygon is clipped into the fan from vertex 0
+            m = len(remaining)
+            for k in range(1, m + 1):
+                a, b, c = remaining[k - 1], remaining[k % m], remaining[(k + 1) % m]
+                if is_ear(a, b, c):
+                    triangles.append((a, b, c))
+                    del remaining[k % m]
+                    break
+            else:
+                # No ear: drop a straight-angle vertex, which only splits
+                # an edge, or give up on a self-intersecting outline
+                straight = [
+                    k
+                    for k in range(m)
+                    if abs(turn(remaining[k - 1], remaining[k], remaining[(k + 1) % m]))
+                    <= tolerance
+                ]
+                if not straight:
+                    raise ValueError("Cannot triangulate self-intersecting polygon")
+                del remaining[straight[0]]
+
+        if abs(turn(*remaining)) > tolerance:
+            triangles.append((remaining[0], remaining[1], remaining[2]))
 
         return triangles
 
 
+def _node_table(model: StructuralModel) -> tuple[dict[int, int], np.ndarray]:
+    """
+    Gather node coordinates as one array.
+
+    Returns:
+        Tuple of (node_rows, node_xyz): the row of each node id, and the
+        (N, 3) coordinates in model order
+    """
+    nodes = model.nodes
+    node_rows = {node.id: k for k, node in enumerate(nodes)}
+    node_xyz = np.array(
+        [(node.x, node.y, node.z) for node in nodes], dtype=np.float64
+    ).reshape(-1, 3)
+    return node_rows, node_xyz
+
+
 def get_material_colors() -> dict[str, str]:
     """
     Get default colors for common materials.
@@ -392,20 +739,7 @@ def get_material_colors() -> dict[str, str]:
     Returns:
         Dictionary mapping material patterns to colors
     """
-    return {
-        "steel": "#708090",  # Steel gray
-        "a36": "#708090",
-        "a572": "#708090",
-        "a992": "#708090",
-        "concrete": "#A9A9A9",  # Concrete gray
-        "h20": "#A9A9A9",
-        "h25": "#A9A9A9",
-        "h30": "#A9A9A9",
-        "wood": "#DEB887",  # Wood brown
-        "timber": "#DEB887",
-        "aluminum": "#C0C0C0",  # Aluminum silver
-        "default": "#4169E1",  # Royal blue default
-    }
+    return dict(_MATERIAL_COLORS)
 
 
 def get_color_for_material(material_id: str) -> str:
@@ -418,11 +752,10 @@ def get_color_for_material(material_id: str) -> str:
     Returns:
         Hex color string
     """
-    colors = get_material_colors()
     material_lower = material_id.lower()
 
-    for pattern, color in colors.items():
+    for pattern, color in _MATERIAL_COLORS.items():
         if pattern in material_lower:
             return color
 
-    return colors["default"]
+    return _MATERIAL_COLORS["default"]
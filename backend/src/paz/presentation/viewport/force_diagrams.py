@@ -16,7 +16,9 @@ import pyvista as pv
 
 
 if TYPE_CHECKING:
-    from paz.domain.model import Frame, StructuralModel
+    from collections.abc import Iterator
+
+    from paz.domain.model import StructuralModel
     from paz.domain.results import AnalysisResults, FrameResult
 
 
@@ -106,45 +108,37 @@ class ForceDiagramRenderer:
         if force_type is None:
             force_type = self._settings.force_type
 
-        all_points: list[list[float]] = []
-        all_lines: list[list[int]] = []
-        all_scalars: list[float] = []
-        point_idx = 0
+        frame_points: list[np.ndarray] = []
+        frame_scalars: list[np.ndarray] = []
 
-        for frame in model.frames:
-            # Skip frames not in filter
-            if frame_ids is not None and frame.id not in frame_ids:
-                continue
-
-            frame_result = results.get_frame_result(frame.id)
-            if frame_result is None or not frame_result.forces:
-                continue
+        for start, end, frame_result in self._frames_with_forces(
+            model, results, frame_ids
+        ):
 
-            points, lines, scalars = self._build_frame_diagram(
-                frame, model, frame_result, force_type
+            points, scalars = self._build_frame_diagram(
+                start, end, frame_result, force_type
             )
 
             if points is None:
                 continue
 
-            # Offset line indices
-            for line in lines:
-                all_lines.append([line[0], line[1] + point_idx, line[2] + point_idx])
-
-            all_points.extend(points)
-            all_scalars.extend(scalars)
-            point_idx += len(points)
+            frame_points.append(points)
+            frame_scalars.append(scalars)
 
-        if not all_points:
+        if not frame_points:
             return pv.PolyData(), np.array([])
 
-        points_array = np.array(all_points, dtype=np.float64)
-        lines_array = np.hstack(all_lines) if all_lines else np.array([], dtype=np.int64)
-        scalars_array = np.array(all_scalars, dtype=np.float64)
+        points_array = np.concatenate(frame_points)
+        scalars_array = np.concatenate(frame_scalars)
+
+        # Every frame has the same number of samples, so its segments are
+        # the first frame's shifted by a multiple of that count
+        n_pts = len(frame_points[0])
+        segments = _repeat_cells(_segment_cells(n_pts), len(frame_points), n_pts)
 
         mesh = pv.PolyData(points_array)
-        if len(lines_array) > 0:
-            mesh.lines = lines_array  # type: ignore[assignment]
+        if len(segments) > 0:
+            mesh.lines = pv.CellArray.from_regular_cells(segments)
 
         return mesh, scalars_array
 
@@ -172,43 +166,37 @@ class ForceDiagramRenderer:
         if force_type is None:
             force_type = self._settings.force_type
 
-        all_points: list[list[float]] = []
-        all_faces: list[list[int]] = []
-        all_scalars: list[float] = []
-        point_idx = 0
-
-        for frame in model.frames:
-            # Skip frames not in filter
-            if frame_ids is not None and frame.id not in frame_ids:
-                continue
+        frame_points: list[np.ndarray] = []
+        frame_scalars: list[np.ndarray] = []
 
-            frame_result = results.get_frame_result(frame.id)
-            if frame_result is None or not frame_result.forces:
-                continue
+        for start, end, frame_result in self._frames_with_forces(
+            model, results, frame_ids
+        ):
 
-            points, faces, scalars = self._build_frame_filled_diagram(
-                frame, model, frame_result, force_type
+            points, scalars = self._build_frame_filled_diagram(
+                start, end, frame_result, force_type
             )
 
             if points is None:
                 continue
 
-            # Offset face indices
-            for face in faces:
-                all_faces.append([face[0]] + [f + point_idx for f in face[1:]])
+            frame_points.append(points)
+            frame_scalars.append(scalars)
 
-            all_points.extend(points)
-            all_scalars.extend(scalars)
-            point_idx += len(points)
-
-        if not all_points:
+        if not frame_points:
             return pv.PolyData(), np.array([])
 
-        points_array = np.array(all_points, dtype=np.float64)
-        faces_array = np.hstack(all_faces) if all_faces else np.array([], dtype=np.int64)
-        scalars_array = np.array(all_scalars, dtype=np.float64)
+        points_array = np.concatenate(frame_points)
+        scalars_array = np.concatenate(frame_scalars)
+
+        # Each frame contributes 2 * n_pts points (base, then diagram)
+        n_pts = len(frame_points[0]) // 2
+        triangles = _repeat_cells(_strip_triangles(n_pts), len(frame_points), 2 * n_pts)
 
-        mesh = pv.PolyData(points_array, faces=faces_array)
+        mesh = pv.PolyData(
+            points_array,
+            faces=pv.CellArray.from_regular_cells(triangles),
+        )
 
         return mesh, scalars_array
 
@@ -239,22 +227,17 @@ class ForceDiagramRenderer:
         positions: list[list[float]] = []
         labels: list[str] = []
 
-        for frame in model.frames:
-            # Skip frames not in filter
-            if frame_ids is not None and frame.id not in frame_ids:
-                continue
-
-            frame_result = results.get_frame_result(frame.id)
-            if frame_result is None or not frame_result.forces:
-                continue
+        for start, end, frame_result in self._frames_with_forces(
+            model, results, frame_ids
+        ):
 
-            node_i = model.get_node(frame.node_i_id)
-            node_j = model.get_node(frame.node_j_id)
+            xi, yi, zi = start
+            xj, yj, zj = end
 
             # Get frame axis vector
-            dx = node_j.x - node_i.x
-            dy = node_j.y - node_i.y
-            dz = node_j.z - node_i.z
+            dx = xj - xi
+            dy = yj - yi
+            dz = zj - zi
             length = np.sqrt(dx**2 + dy**2 + dz**2)
 
             if length < 1e-6:
@@ -285,9 +268,9 @@ class ForceDiagramRenderer:
             # Start label
             if self._settings.show_values and abs(start_val) > 1e-6:
                 pos = [
-                    node_i.x + perp[0] * offset * np.sign(start_val),
-                    node_i.y + perp[1] * offset * np.sign(start_val),
-                    node_i.z + perp[2] * offset * np.sign(start_val),
+                    xi + perp[0] * offset * np.sign(start_val),
+                    yi + perp[1] * offset * np.sign(start_val),
+                    zi + perp[2] * offset * np.sign(start_val),
                 ]
                 positions.append(pos)
                 labels.append(f"{start_val:.1f}")
@@ -295,9 +278,9 @@ class ForceDiagramRenderer:
             # End label
             if self._settings.show_values and abs(end_val) > 1e-6:
                 pos = [
-                    node_j.x + perp[0] * offset * np.sign(end_val),
-                    node_j.y + perp[1] * offset * np.sign(end_val),
-                    node_j.z + perp[2] * offset * np.sign(end_val),
+                    xj + perp[0] * offset * np.sign(end_val),
+                    yj + perp[1] * offset * np.sign(end_val),
+                    zj + perp[2] * offset * np.sign(end_val),
                 ]
                 positions.append(pos)
                 labels.append(f"{end_val:.1f}")
@@ -307,9 +290,9 @@ class ForceDiagramRenderer:
                 if abs(max_val) > max(abs(start_val), abs(end_val)) * 1.1:
                     t = max_loc
                     pos = [
-                        node_i.x + t * dx + perp[0] * offset * np.sign(max_val),
-                        node_i.y + t * dy + perp[1] * offset * np.sign(max_val),
-                        node_i.z + t * dz + perp[2] * offset * np.sign(max_val),
+                        xi + t * dx + perp[0] * offset * np.sign(max_val),
+                        yi + t * dy + perp[1] * offset * np.sign(max_val),
+                        zi + t * dz + perp[2] * offset * np.sign(max_val),
                     ]
                     positions.append(pos)
                     labels.append(f"{max_val:.1f}")
@@ -387,127 +370,118 @@ class ForceDiagramRenderer:
 
         return max_frame_id, max_val
 
-    def _build_frame_diagram(
+    def _frames_with_forces(
         self,
-        frame: Frame,
         model: StructuralModel,
-        frame_result: FrameResult,
-        force_type: ForceType,
-    ) -> tuple[list[list[float]] | None, list[list[int]], list[float]]:
-        """Build diagram lines for a single frame."""
-        node_i = model.get_node(frame.node_i_id)
-        node_j = model.get_node(frame.node_j_id)
-
-        dx = node_j.x - node_i.x
-        dy = node_j.y - node_i.y
-        dz = node_j.z - node_i.z
-        length = np.sqrt(dx**2 + dy**2 + dz**2)
-
-        if length < 1e-6:
-            return None, [], []
+        results: AnalysisResults,
+        frame_ids: set[int] | None,
+    ) -> Iterator[tuple[list[float], list[float], FrameResult]]:
+        """
+        Yield the end coordinates and results of each frame to draw.
 
-        # Get perpendicular direction for diagram
-        perp = self._get_perpendicular_direction(dx, dy, dz)
+        Frames outside frame_ids (when given) or without force results are
+        skipped. End coordinates come from the model's coordinate tables.
+        """
+        tables = model.coordinate_tables()
+        ends = tables.nodes_xyz[tables.frames_ij].tolist()
 
-        # Interpolate forces along frame
-        n_pts = self._settings.interpolation_points
-        points: list[list[float]] = []
-        scalars: list[float] = []
-        lines: list[list[int]] = []
+        for frame_id, (start, end) in zip(tables.frame_ids, ends, strict=True):
+            # Skip frames not in filter
+            if frame_ids is not None and frame_id not in frame_ids:
+                continue
 
-        # Sort forces by location
-        sorted_forces = sorted(frame_result.forces, key=lambda f: f.location)
+            frame_result = results.get_frame_result(frame_id)
+            if frame_result is None or not frame_result.forces:
+                continue
 
-        for i in range(n_pts):
-            t = i / (n_pts - 1)
+            yield start, end, frame_result
 
-            # Interpolate force value at this location
-            val = self._interpolate_force(sorted_forces, t, force_type)
+    def _build_frame_diagram(
+        self,
+        start: list[float],
+        end: list[float],
+        frame_result: FrameResult,
+        force_type: ForceType,
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """Build diagram curve points for a single frame."""
+        samples = self._sample_frame(start, end, frame_result, force_type)
+        if samples is None:
+            return None, np.empty(0)
 
-            # Calculate point on frame axis
-            x_base = node_i.x + t * dx
-            y_base = node_i.y + t * dy
-            z_base = node_i.z + t * dz
+        base, offsets, values = samples
+        return base + offsets, values
 
-            # Offset perpendicular to frame by scaled value
-            offset = self._settings.scale * val
-            x = x_base + perp[0] * offset
-            y = y_base + perp[1] * offset
-            z = z_base + perp[2] * offset
+    def _build_frame_filled_diagram(
+        self,
+        start: list[float],
+        end: list[float],
+        frame_result: FrameResult,
+        force_type: ForceType,
+    ) -> tuple[np.ndarray | None, np.ndarray]:
+        """Build filled diagram points (base, then curve) for a single frame."""
+        samples = self._sample_frame(start, end, frame_result, force_type)
+        if samples is None:
+            return None, np.empty(0)
 
-            points.append([x, y, z])
-            scalars.append(val)
+        base, offsets, values = samples
 
-            # Connect to previous point
-            if i > 0:
-                lines.append([2, i - 1, i])
+        # Combine points: base points first, then diagram points
+        points = np.concatenate((base, base + offsets))
+        # Base points have zero scalar
+        scalars = np.concatenate((np.zeros(len(values)), values))
 
-        return points, lines, scalars
+        return points, scalars
 
-    def _build_frame_filled_diagram(
+    def _sample_frame(
         self,
-        frame: Frame,
-        model: StructuralModel,
+        start: list[float],
+        end: list[float],
         frame_result: FrameResult,
         force_type: ForceType,
-    ) -> tuple[list[list[float]] | None, list[list[int]], list[float]]:
-        """Build filled diagram triangles for a single frame."""
-        node_i = model.get_node(frame.node_i_id)
-        node_j = model.get_node(frame.node_j_id)
-
-        dx = node_j.x - node_i.x
-        dy = node_j.y - node_i.y
-        dz = node_j.z - node_i.z
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        Sample a frame's diagram at evenly spaced points along its axis.
+
+        Returns:
+            Tuple of (base, offsets, values): (n, 3) points on the frame axis,
+            the (n, 3) perpendicular offsets of the diagram curve from them,
+            and the n interpolated force values; None for a zero-length frame
+        """
+        xi, yi, zi = start
+        xj, yj, zj = end
+
+        dx = xj - xi
+        dy = yj - yi
+        dz = zj - zi
         length = np.sqrt(dx**2 + dy**2 + dz**2)
 
         if length < 1e-6:
-            return None, [], []
+            return None
 
+        # Get perpendicular direction for diagram
         perp = self._get_perpendicular_direction(dx, dy, dz)
 
+        # Interpolate forces along frame
         n_pts = self._settings.interpolation_points
-        sorted_forces = sorted(frame_result.forces, key=lambda f: f.location)
-
-        # Create points along frame axis and diagram curve
-        base_points: list[list[float]] = []
-        diagram_points: list[list[float]] = []
-        scalars: list[float] = []
+        t = np.arange(n_pts) / (n_pts - 1)
 
-        for i in range(n_pts):
-            t = i / (n_pts - 1)
-            val = self._interpolate_force(sorted_forces, t, force_type)
-
-            x_base = node_i.x + t * dx
-            y_base = node_i.y + t * dy
-            z_base = node_i.z + t * dz
-
-            base_points.append([x_base, y_base, z_base])
-
-            offset = self._settings.scale * val
-            diagram_points.append([
-                x_base + perp[0] * offset,
-                y_base + perp[1] * offset,
-                z_base + perp[2] * offset,
-            ])
-            scalars.append(val)
-
-        # Combine points: base points first, then diagram points
-        all_points = base_points + diagram_points
-        all_scalars = [0.0] * n_pts + scalars  # Base points have zero scalar
-
-        # Create triangles between base and diagram
-        faces: list[list[int]] = []
-        for i in range(n_pts - 1):
-            # Two triangles per segment
-            base_i = i
-            base_j = i + 1
-            diag_i = n_pts + i
-            diag_j = n_pts + i + 1
+        # Sort forces by location and interpolate them at every sample
+        sorted_forces = sorted(frame_result.forces, key=lambda f: f.location)
+        if sorted_forces:
+            locations = np.array([f.location for f in sorted_forces], dtype=np.float64)
+            force_values = np.array(
+                [self._get_force_value(f, force_type) for f in sorted_forces],
+                dtype=np.float64,
+            )
+            values = np.interp(t, locations, force_values)
+        else:
+            values = np.zeros(n_pts)
 
-            faces.append([3, base_i, base_j, diag_i])
-            faces.append([3, base_j, diag_j, diag_i])
+        # Points on the frame axis, offset perpendicular by the scaled value
+        base = np.array(start) + np.outer(t, (dx, dy, dz))
+        offsets = np.outer(self._settings.scale * values, perp)
 
-        return all_points, faces, all_scalars
+        return base, offsets, values
 
     def _get_perpendicular_direction(
         self, dx: float, dy: float, dz: float
@@ -541,51 +515,40 @@ class ForceDiagramRenderer:
 
         return (px / p_len, py / p_len, pz / p_len)
 
-    def _interpolate_force(
-        self,
-        sorted_forces: list,
-        t: float,
-        force_type: ForceType,
-    ) -> float:
-        """Interpolate force value at location t (0-1)."""
-        if not sorted_forces:
-            return 0.0
-
-        # Find surrounding force values
-        prev_force = sorted_forces[0]
-        next_force = sorted_forces[-1]
-
-        for i, forces in enumerate(sorted_forces):
-            if forces.location <= t:
-                prev_force = forces
-            if forces.location >= t:
-                next_force = forces
-                break
-
-        # Linear interpolation
-        prev_loc = prev_force.location
-        next_loc = next_force.location
-        prev_val = self._get_force_value(prev_force, force_type)
-        next_val = self._get_force_value(next_force, force_type)
-
-        if abs(next_loc - prev_loc) < 1e-6:
-            return prev_val
-
-        factor = (t - prev_loc) / (next_loc - prev_loc)
-        return prev_val + factor * (next_val - prev_val)
-
     def _get_force_value(self, forces: object, force_type: ForceType) -> float:
         """Extract specific force value from FrameForces."""
-        if force_type == ForceType.P:
-            return float(getattr(forces, "P", 0.0))
-        if force_type == ForceType.V2:
-            return float(getattr(forces, "V2", 0.0))
-        if force_type == ForceType.V3:
-            return float(getattr(forces, "V3", 0.0))
-        if force_type == ForceType.T:
-            return float(getattr(forces, "T", 0.0))
-        if force_type == ForceType.M2:
-            return float(getattr(forces, "M2", 0.0))
-        if force_type == ForceType.M3:
-            return float(getattr(forces, "M3", 0.0))
-        return 0.0
+        # Each ForceType's value is the FrameForces attribute name
+        return float(getattr(forces, force_type.value, 0.0))
+
+
+def _segment_cells(n_pts: int) -> np.ndarray:
+    """Get the (n_pts - 1, 2) segments joining consecutive samples of a frame."""
+    starts = np.arange(n_pts - 1, dtype=np.int64)
+    return np.column_stack((starts, starts + 1))
+
+
+def _strip_triangles(n_pts: int) -> np.ndarray:
+    """
+    Get the triangles filling the area between a frame and its diagram.
+
+    Points 0..n_pts-1 are on the frame axis and n_pts..2*n_pts-1 on the
+    diagram curve; each segment is split into (base_i, base_j, diag_i) and
+    (base_j, diag_j, diag_i).
+    """
+    base_i = np.arange(n_pts - 1, dtype=np.int64)
+    base_j = base_i + 1
+    diag_i = base_i + n_pts
+    diag_j = base_j + n_pts
+    return np.stack(
+        (
+            np.column_stack((base_i, base_j, diag_i)),
+            np.column_stack((base_j, diag_j, diag_i)),
+        ),
+        axis=1,
+    ).reshape(-1, 3)
+
+
+def _repeat_cells(cells: np.ndarray, n_frames: int, stride: int) -> np.ndarray:
+    """Repeat one frame's (k, m) cells for n_frames frames of stride points each."""
+    shifts = np.arange(n_frames, dtype=np.int64)[:, np.newaxis, np.newaxis] * stride
+    return (cells[np.newaxis] + shifts).reshape(-1, cells.shape[1])
@@ -37,41 +37,19 @@ class MeshBuilder:
         Returns:
             PyVista PolyData with lines connecting frame endpoints
         """
-        if not model.frames:
+        tables = model.coordinate_tables()
+        n_frames = len(tables.frame_ids)
+        if n_frames == 0:
             return pv.PolyData()
 
-        # Build node coordinate lookup
-        node_positions = {node.id: (node.x, node.y, node.z) for node in model.nodes}
+        # Both end points of every frame, i then j: (M, 2, 3) -> (2M, 3)
+        points = tables.nodes_xyz[tables.frames_ij].reshape(-1, 3)
 
-        # Pre-allocate arrays for performance
-        n_frames = len(model.frames)
-        points = np.zeros((n_frames * 2, 3), dtype=np.float64)
-        lines = np.zeros(n_frames * 3, dtype=np.int64)
-
-        valid_frames = 0
-
-        for frame in model.frames:
-            pos_i = node_positions.get(frame.node_i_id)
-            pos_j = node_positions.get(frame.node_j_id)
-
-            if pos_i is None or pos_j is None:
-                continue
-
-            points[valid_frames * 2] = pos_i
-            points[valid_frames * 2 + 1] = pos_j
-
-            lines[valid_frames * 3] = 2  # Number of points in line
-            lines[valid_frames * 3 + 1] = valid_frames * 2
-            lines[valid_frames * 3 + 2] = valid_frames * 2 + 1
-
-            valid_frames += 1
-
-        if valid_frames == 0:
-            return pv.PolyData()
-
-        # Trim arrays to actual size
-        points = points[: valid_frames * 2]
-        lines = lines[: valid_frames * 3]
+        # Frame k is the line [2, 2k, 2k + 1]
+        lines = np.empty(n_frames * 3, dtype=np.int64)
+        lines[0::3] = 2  # Number of points in line
+        lines[1::3] = np.arange(0, 2 * n_frames, 2)
+        lines[2::3] = lines[1::3] + 1
 
         mesh = pv.PolyData(points)
         mesh.lines = lines  # type: ignore[assignment]
@@ -229,28 +207,13 @@ class MeshBuilder:
         Returns:
             Tuple of (positions array, labels list)
         """
-        if not model.frames:
+        tables = model.coordinate_tables()
+        if not tables.frame_ids:
             return np.array([]).reshape(0, 3), []
 
-        node_positions = {node.id: (node.x, node.y, node.z) for node in model.nodes}
-
-        positions = []
-        labels = []
-
-        for frame in model.frames:
-            pos_i = node_positions.get(frame.node_i_id)
-            pos_j = node_positions.get(frame.node_j_id)
+        # Midpoint of each frame
+        ends = tables.nodes_xyz[tables.frames_ij]
+        positions = (ends[:, 0] + ends[:, 1]) / 2
+        labels = [str(frame_id) for frame_id in tables.frame_ids]
 
-            if pos_i is None or pos_j is None:
-                continue
-
-            # Midpoint of frame
-            mid = (
-                (pos_i[0] + pos_j[0]) / 2,
-                (pos_i[1] + pos_j[1]) / 2,
-                (pos_i[2] + pos_j[2]) / 2,
-            )
-            positions.append(mid)
-            labels.append(str(frame.id))
-
-        return np.array(positions, dtype=np.float64), labels
+        return positions, labels
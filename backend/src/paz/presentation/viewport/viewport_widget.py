@@ -45,6 +45,7 @@ from paz.presentation.widgets.color_scale import ColorScaleWidget
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
 
     from paz.domain.model import StructuralModel
     from paz.domain.results import AnalysisResults
@@ -227,8 +228,35 @@ class ViewportWidget(QWidget):
             model: Structural model with nodes and frames
         """
         self._model = model
+        # Drop deformed meshes built for the previous model
+        self._deformed_renderer.clear_cache()
         self._refresh_display()
 
+    def update_frames(self, frame_ids: Iterable[int]) -> None:
+        """
+        Redraw the current model after in-place edits to some frames.
+
+        Frames that keep their section and material (moved end nodes, a
+        new rotation) are re-extruded in the solid meshes already on
+        screen instead of rebuilding them; every other layer is redrawn as
+        in set_model. Falls back to a full rebuild when any frame cannot
+        be updated in place.
+
+        Args:
+            frame_ids: IDs of the edited frames, including frames whose
+                end nodes moved
+        """
+        if self._model is None:
+            return
+
+        model = self._model
+        keep_extruded = bool(self._extruded_actors) and all(
+            self._extruded_renderer.update_frame(model, frame_id)
+            for frame_id in frame_ids
+        )
+        self._deformed_renderer.clear_cache()
+        self._refresh_display(keep_extruded=keep_extruded)
+
     def set_results(self, results: dict[str, AnalysisResults]) -> None:
         """
         Set analysis results.
@@ -367,9 +395,15 @@ class ViewportWidget(QWidget):
 
         self._load_case_combo.blockSignals(False)
 
-    def _refresh_display(self) -> None:
-        """Rebuild and render all geometry."""
-        self._clear_actors()
+    def _refresh_display(self, keep_extruded: bool = False) -> None:
+        """
+        Rebuild and render all geometry.
+
+        Args:
+            keep_extruded: Keep the extruded solids on screen instead of
+                rebuilding them (they were already updated in place)
+        """
+        self._clear_actors(keep_extruded=keep_extruded)
 
         if self._model is None:
             self._plotter.render()
@@ -377,7 +411,7 @@ class ViewportWidget(QWidget):
 
         # Build and display original structure
         if self._settings.show_original:
-            self._render_original()
+            self._render_original(keep_extruded=keep_extruded)
 
         # Build and display deformed structure
         results = self._get_current_results()
@@ -408,8 +442,8 @@ class ViewportWidget(QWidget):
         self._plotter.reset_camera()
         self._plotter.render()
 
-    def _clear_actors(self) -> None:
-        """Remove all actors from the plotter."""
+    def _clear_actors(self, keep_extruded: bool = False) -> None:
+        """Remove all actors from the plotter, optionally except the extruded solids."""
         for actor in self._original_actors:
             self._plotter.remove_actor(actor, render=False)
         self._original_actors.clear()
@@ -418,9 +452,10 @@ class ViewportWidget(QWidget):
             self._plotter.remove_actor(actor, render=False)
         self._deformed_actors.clear()
 
-        for actor in self._extruded_actors:
-            self._plotter.remove_actor(actor, render=False)
-        self._extruded_actors.clear()
+        if not keep_extruded:
+            for actor in self._extruded_actors:
+                self._plotter.remove_actor(actor, render=False)
+            self._extruded_actors.clear()
 
         for actor in self._grid_actors:
             self._plotter.remove_actor(actor, render=False)
@@ -450,13 +485,14 @@ class ViewportWidget(QWidget):
             self._plotter.remove_actor(self._text_actor, render=False)
             self._text_actor = None
 
-    def _render_original(self) -> None:
+    def _render_original(self, keep_extruded: bool = False) -> None:
         """Render the original (undeformed) structure."""
         if self._model is None:
             return
 
         if self._show_extruded and self._sections:
-            self._render_extruded()
+            if not keep_extruded:
+                self._render_extruded()
         else:
             self._render_wireframe()
 
@@ -842,19 +878,8 @@ class ViewportWidget(QWidget):
 
     def _get_force_value_for_filter(self, forces: object) -> float:
         """Extract force value based on current force type."""
-        if self._current_force_type == ForceType.P:
-            return float(getattr(forces, "P", 0.0))
-        if self._current_force_type == ForceType.V2:
-            return float(getattr(forces, "V2", 0.0))
-        if self._current_force_type == ForceType.V3:
-            return float(getattr(forces, "V3", 0.0))
-        if self._current_force_type == ForceType.T:
-            return float(getattr(forces, "T", 0.0))
-        if self._current_force_type == ForceType.M2:
-            return float(getattr(forces, "M2", 0.0))
-        if self._current_force_type == ForceType.M3:
-            return float(getattr(forces, "M3", 0.0))
-        return 0.0
+        # Each ForceType's value is the FrameForces attribute name
+        return float(getattr(forces, self._current_force_type.value, 0.0))
 
     def highlight_frame(self, frame_id: int | None) -> None:
         """
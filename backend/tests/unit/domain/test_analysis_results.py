@@ -0,0 +1,41 @@
+"""Tests for AnalysisResults container."""
+
+from uuid import uuid4
+
+import numpy as np
+
+from paz.domain.results import AnalysisResults, NodalDisplacement, NodalReaction
+
+
+class TestAnalysisResultsArrays:
+    """Tests for the struct-of-arrays views of nodal results."""
+
+    def test_displacement_array(self) -> None:
+        """Displacements are packed in insertion order."""
+        results = AnalysisResults(load_case_id=uuid4())
+        results.add_displacement(NodalDisplacement(node_id=3, Ux=0.1, Rz=-0.2))
+        results.add_displacement(NodalDisplacement(node_id=1, Uz=-0.5))
+
+        ids, values = results.displacement_array()
+
+        assert ids.tolist() == [3, 1]
+        assert values.shape == (2, 6)
+        np.testing.assert_array_equal(values[0], [0.1, 0, 0, 0, 0, -0.2])
+        np.testing.assert_array_equal(values[1], [0, 0, -0.5, 0, 0, 0])
+
+    def test_reaction_array(self) -> None:
+        """Reactions are packed with force then moment columns."""
+        results = AnalysisResults(load_case_id=uuid4())
+        results.add_reaction(NodalReaction(node_id=2, Fz=10.0, My=-4.0))
+
+        ids, values = results.reaction_array()
+
+        assert ids.tolist() == [2]
+        np.testing.assert_array_equal(values[0], [0, 0, 10.0, 0, -4.0, 0])
+
+    def test_empty_arrays(self) -> None:
+        """Empty results give empty arrays of the right shape."""
+        ids, values = AnalysisResults(load_case_id=uuid4()).displacement_array()
+
+        assert ids.shape == (0,)
+        assert values.shape == (0, 6)
@@ -7,6 +7,7 @@ from paz.domain.model.local_axes import (
     LocalAxes,
     calculate_element_angle,
     calculate_local_axes,
+    calculate_local_axes_xyz,
 )
 from paz.domain.model.node import Node
 from paz.domain.model.restraint import FREE
@@ -188,6 +189,25 @@ class TestCalculateLocalAxes:
             calculate_local_axes(node_i, node_j)
 
 
+class TestCalculateLocalAxesXyz:
+    """Tests for calculate_local_axes_xyz function."""
+
+    def test_matches_node_version(self) -> None:
+        """Coordinates give the same axes as the equivalent nodes."""
+        node_i = Node(id=1, x=1, y=2, z=3, restraint=FREE)
+        node_j = Node(id=2, x=4, y=-2, z=8, restraint=FREE)
+
+        from_nodes = calculate_local_axes(node_i, node_j, rotation=0.4)
+        from_xyz = calculate_local_axes_xyz(1, 2, 3, 4, -2, 8, rotation=0.4)
+
+        assert from_xyz == from_nodes
+
+    def test_zero_length_raises(self) -> None:
+        """Test that coincident points raise error."""
+        with pytest.raises(ValueError, match="zero-length"):
+            calculate_local_axes_xyz(1.5, 2.0, 0.0, 1.5, 2.0, 0.0)
+
+
 class TestCalculateElementAngle:
     """Tests for calculate_element_angle function."""
 
@@ -0,0 +1,62 @@
+"""Tests for NodeGrid spatial hash."""
+
+import random
+
+import pytest
+
+from paz.core.exceptions import ValidationError
+from paz.domain.model.node import Node
+from paz.domain.model.node_grid import NodeGrid
+
+
+class TestNodeGrid:
+    """Tests for NodeGrid lookups."""
+
+    def test_find_exact_and_within_tolerance(self) -> None:
+        """Finds nodes at or near a point."""
+        grid = NodeGrid([Node(1, 0, 0, 0), Node(2, 5, 0, 0)])
+
+        assert grid.find(0, 0, 0).id == 1
+        assert grid.find(5.0005, 0, 0).id == 2
+        assert grid.find(2.5, 0, 0) is None
+
+    def test_find_across_cell_boundary(self) -> None:
+        """Points in a neighbouring cell are still matched."""
+        grid = NodeGrid([Node(1, 0.0009, 0, 0)], tolerance=0.001)
+
+        assert grid.find(0.0011, 0, 0).id == 1
+        assert grid.find(-0.0001, 0, 0).id == 1
+
+    def test_find_returns_closest(self) -> None:
+        """The closest node within tolerance wins."""
+        grid = NodeGrid([Node(1, 0, 0, 0), Node(2, 0.0015, 0, 0)], tolerance=0.001)
+
+        assert grid.find(0.0009, 0, 0).id == 2
+
+    def test_find_matches_linear_scan(self) -> None:
+        """Lookups agree with comparing against every node."""
+        rng = random.Random(0)
+        tol = 0.01
+        nodes = [
+            Node(i, rng.uniform(-0.1, 0.1), rng.uniform(-0.1, 0.1), rng.uniform(-0.1, 0.1))
+            for i in range(1, 201)
+        ]
+        grid = NodeGrid(nodes, tolerance=tol)
+
+        for _ in range(500):
+            x, y, z = (rng.uniform(-0.11, 0.11) for _ in range(3))
+            in_range = [n for n in nodes if n.distance_to_point(x, y, z) <= tol]
+            expected = min(in_range, key=lambda n: n.distance_to_point(x, y, z), default=None)
+            assert grid.find(x, y, z) is expected
+
+    def test_add(self) -> None:
+        """Nodes added later are found."""
+        grid = NodeGrid()
+        grid.add(Node(3, 1, 2, 3))
+
+        assert grid.find(1, 2, 3).id == 3
+
+    def test_invalid_tolerance(self) -> None:
+        """Tolerance must be positive."""
+        with pytest.raises(ValidationError):
+            NodeGrid(tolerance=0)
@@ -357,6 +357,42 @@ class TestTSection:
         yc = section._centroid_y
         assert yc > section.d / 2  # Above geometric center
 
+    def test_t_section_batch_matches_scalar(self) -> None:
+        """Test that batched properties match per-instance calculation."""
+        d = [0.200, 0.250, 0.300]
+        bf = [0.150, 0.160, 0.170]
+        tf = [0.015, 0.016, 0.017]
+        tw = [0.010, 0.011, 0.012]
+        props = TSection.batch(d, bf, tf, tw)
+
+        for i in range(3):
+            section = TSection(d=d[i], bf=bf[i], tf=tf[i], tw=tw[i]).to_section()
+            for name in ("A", "Ix", "Iy", "J", "Sx", "Sy", "Zx", "Zy", "rx", "ry"):
+                assert abs(props[name][i] - getattr(section, name)) < 1e-12
+
+    def test_t_section_batch_invalid_stem(self) -> None:
+        """Test that batch rejects non-positive stem heights."""
+        with pytest.raises(ValueError, match="Stem height"):
+            TSection.batch([0.2, 0.01], 0.15, 0.015, 0.01)
+
+    def test_t_section_batch_invalid_stem_thickness(self) -> None:
+        """Test that batch rejects stems as wide as the flange, like the scalar path."""
+        with pytest.raises(ValueError, match="Stem thickness"):
+            TSection(d=0.2, bf=0.15, tf=0.015, tw=0.15)
+        with pytest.raises(ValueError, match="Stem thickness"):
+            TSection.batch(0.2, [0.15, 0.15], 0.015, [0.01, 0.15])
+
+    def test_t_section_batch_broadcasts_scalars(self) -> None:
+        """Test that scalar dimensions broadcast and match per-instance values."""
+        tw = [0.008, 0.010, 0.012, 0.014]
+        props = TSection.batch(0.25, 0.16, 0.016, tw)
+
+        assert props["Sy"].shape == (4,)
+        for i, t in enumerate(tw):
+            section = TSection(d=0.25, bf=0.16, tf=0.016, tw=t)
+            assert props["Sy"][i] == pytest.approx(section.Sy, rel=1e-12)
+            assert props["Zx"][i] == pytest.approx(section._calculate_Zx(), rel=1e-12)
+
 
 class TestParametricSectionConversion:
     """Tests for converting parametric sections to standard Section."""
@@ -181,6 +181,22 @@ class TestSection:
         )
         assert section.rx_calculated == 0.15
 
+    def test_radius_of_gyration_follows_field_changes(self) -> None:
+        """Test that calculated radii reflect reassigned properties."""
+        section = Section(
+            name="Test",
+            shape=SectionShape.CUSTOM,
+            A=0.01,
+            Ix=1e-4,
+            Iy=2.5e-5,
+        )
+        assert abs(section.rx_calculated - 0.1) < 1e-10
+
+        section.Ix = 4e-4
+        section.Iy = 1e-4
+        assert abs(section.rx_calculated - 0.2) < 1e-10
+        assert abs(section.ry_calculated - 0.1) < 1e-10
+
     def test_to_dict(self) -> None:
         """Test serialization to dictionary."""
         section = Section(
@@ -227,6 +243,12 @@ class TestSection:
         assert section.Sx == 6.89e-4
         assert section.d == 0.351
 
+    def test_from_dict_unknown_shape_raises(self) -> None:
+        """Test that an unknown shape value is rejected."""
+        data = {"name": "X", "shape": "BOGUS", "A": 0.01, "Ix": 1e-4, "Iy": 1e-5}
+        with pytest.raises(ValueError):
+            Section.from_dict(data)
+
     def test_from_dict_with_id(self) -> None:
         """Test deserialization preserves ID if provided."""
         test_id = "12345678-1234-5678-1234-567812345678"
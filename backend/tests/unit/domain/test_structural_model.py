@@ -2,7 +2,12 @@
 
 import pytest
 
-from paz.core.exceptions import DuplicateNodeError, NodeError, ValidationError
+from paz.core.exceptions import (
+    DuplicateNodeError,
+    FrameError,
+    NodeError,
+    ValidationError,
+)
 from paz.domain.model.node import Node
 from paz.domain.model.restraint import FIXED, PINNED
 from paz.domain.model.structural_model import StructuralModel
@@ -72,6 +77,43 @@ class TestStructuralModelNodes:
         model.add_node(x=0, y=0, z=0, check_duplicate=False)
         assert model.node_count == 2
 
+    def test_add_nodes_batch(self) -> None:
+        """Add nodes in one batch with auto and explicit IDs."""
+        model = StructuralModel()
+        model.add_node(x=0, y=0, z=0)
+
+        nodes = model.add_nodes([
+            (1, 0, 0, FIXED, None),
+            (2, 0, 0, None, 10),
+            (3, 0, 0, None, None),
+        ])
+
+        assert [n.id for n in nodes] == [2, 10, 11]
+        assert model.node_count == 4
+        assert model.get_node(2).restraint.is_fixed
+        assert model.add_node(x=4, y=0, z=0).id == 12
+
+    def test_add_nodes_duplicate_is_all_or_nothing(self) -> None:
+        """A duplicate within the batch rejects the whole batch."""
+        model = StructuralModel()
+        model.add_node(x=0, y=0, z=0)
+
+        with pytest.raises(DuplicateNodeError):
+            model.add_nodes([(5, 0, 0, None, None), (5.0001, 0, 0, None, None)])
+
+        with pytest.raises(DuplicateNodeError):
+            model.add_nodes([(0.0005, 0, 0, None, None)])
+
+        assert model.node_count == 1
+
+    def test_add_nodes_duplicate_id_raises(self) -> None:
+        """Reusing a node ID in a batch raises."""
+        model = StructuralModel()
+        model.add_node(x=0, y=0, z=0, node_id=3)
+
+        with pytest.raises(NodeError):
+            model.add_nodes([(1, 0, 0, None, 3)])
+
     def test_get_node(self) -> None:
         """Get a node by ID."""
         model = StructuralModel()
@@ -207,3 +249,92 @@ class TestStructuralModelNodes:
 
         new_node = restored.add_node(x=2, y=0, z=0)
         assert new_node.id == 3
+
+
+class TestStructuralModelBatchFrames:
+    """Tests for batch frame insertion in StructuralModel."""
+
+    def _model_with_nodes(self) -> StructuralModel:
+        model = StructuralModel()
+        model.add_node(0, 0, 0)
+        model.add_node(5, 0, 0)
+        model.add_node(5, 5, 0)
+        return model
+
+    def test_add_frames_batch(self) -> None:
+        """Add frames in one batch."""
+        model = self._model_with_nodes()
+
+        frames = model.add_frames([
+            (1, 2, "Steel", "W14x22", 0.0, None, "Beam"),
+            (2, 3, "Steel", "W14x30", 0.5, 7, ""),
+        ])
+
+        assert [f.id for f in frames] == [1, 7]
+        assert model.frame_count == 2
+        assert model.get_frame(1).label == "Beam"
+        assert model.get_frame(7).rotation == 0.5
+        assert model.get_frame(7).length() == 5.0
+
+    def test_add_frames_duplicate_is_all_or_nothing(self) -> None:
+        """A reversed duplicate within the batch rejects the whole batch."""
+        model = self._model_with_nodes()
+        model.add_frame(1, 2, "Steel", "W14x22")
+
+        with pytest.raises(FrameError):
+            model.add_frames([
+                (2, 3, "Steel", "W14x22", 0.0, None, ""),
+                (3, 2, "Steel", "W14x22", 0.0, None, ""),
+            ])
+
+        with pytest.raises(FrameError):
+            model.add_frames([(2, 1, "Steel", "W14x22", 0.0, None, "")])
+
+        assert model.frame_count == 1
+
+    def test_add_frames_missing_node_raises(self) -> None:
+        """Frames must reference existing nodes."""
+        model = self._model_with_nodes()
+
+        with pytest.raises(NodeError):
+            model.add_frames([(1, 99, "Steel", "W14x22", 0.0, None, "")])
+
+
+class TestStructuralModelCoordinateTables:
+    """Tests for the struct-of-arrays coordinate tables."""
+
+    def test_tables_match_nodes_and_frames(self) -> None:
+        """Rows follow model order and frames point at their node rows."""
+        model = StructuralModel()
+        model.add_node(x=0, y=0, z=0, node_id=5)
+        model.add_node(x=3, y=0, z=0, node_id=2)
+        model.add_node(x=3, y=0, z=4, node_id=9)
+        model.add_frame(5, 2, "Steel", "W14x22")
+        model.add_frame(2, 9, "Steel", "W14x22")
+
+        tables = model.coordinate_tables()
+
+        assert tables.node_ids == [5, 2, 9]
+        assert tables.node_id_to_row == {5: 0, 2: 1, 9: 2}
+        assert tables.nodes_xyz.tolist() == [[0, 0, 0], [3, 0, 0], [3, 0, 4]]
+        assert tables.frame_ids == [1, 2]
+        assert tables.frames_ij.tolist() == [[0, 1], [1, 2]]
+
+    def test_tables_follow_in_place_node_moves(self) -> None:
+        """Nodes moved directly on the Node object show up in new tables."""
+        model = StructuralModel()
+        model.add_node(x=0, y=0, z=0)
+        model.add_node(x=1, y=0, z=0)
+        model.add_frame(1, 2, "Steel", "W14x22")
+        model.coordinate_tables()
+
+        model.get_node(2).move_to(5, 5, 5)
+
+        assert model.coordinate_tables().nodes_xyz[1].tolist() == [5.0, 5.0, 5.0]
+
+    def test_empty_model_tables(self) -> None:
+        """An empty model gives empty, correctly shaped tables."""
+        tables = StructuralModel().coordinate_tables()
+
+        assert tables.nodes_xyz.shape == (0, 3)
+        assert tables.frames_ij.shape == (0, 2)
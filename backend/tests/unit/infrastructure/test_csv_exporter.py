@@ -3,12 +3,20 @@
 import csv
 from io import StringIO
 from pathlib import Path
+from uuid import uuid4
 
 import pytest
 
 from paz.domain.model import StructuralModel
 from paz.domain.model.restraint import FIXED, FREE, PINNED
-from paz.infrastructure.exporters.csv_exporter import CSVExporter
+from paz.domain.results import (
+    AnalysisResults,
+    FrameForces,
+    FrameResult,
+    NodalDisplacement,
+    NodalReaction,
+)
+from paz.infrastructure.exporters.csv_exporter import CSVExporter, ResultsExporter
 
 
 class TestCSVExporter:
@@ -26,6 +34,18 @@ class TestCSVExporter:
         assert len(lines) == 1
         assert "id" in lines[0]
 
+    def test_export_uses_lf_line_endings(self) -> None:
+        """Rows end with LF, for both formatted and csv.writer exports."""
+        model = StructuralModel()
+        model.add_node(0, 0, 0)
+        model.add_node(5, 0, 0)
+        model.add_frame(1, 2, "Steel", "W14x22")
+        exporter = CSVExporter(model)
+
+        assert exporter.export_nodes().count("\n") == 3  # Header + 2 nodes
+        assert exporter.export_frames().count("\n") == 2  # Header + 1 frame
+        assert "\r" not in exporter.export_nodes() + exporter.export_frames()
+
     def test_export_nodes_with_data(self) -> None:
         """Export nodes with coordinates and restraints."""
         model = StructuralModel()
@@ -69,6 +89,19 @@ class TestCSVExporter:
         content = filepath.read_text()
         assert "1,2,3" in content or "1.0,2.0,3.0" in content
 
+    def test_export_to_file_matches_string_export(self, tmp_path: Path) -> None:
+        """File exports stream the same bytes the string export returns."""
+        model = StructuralModel()
+        model.add_node(0, 0, 0, restraint=FIXED)
+        model.add_node(5, 0, 0)
+        model.add_frame(1, 2, "Steel", "W14x22", label="Beam, main")
+
+        exporter = CSVExporter(model)
+        for export in (exporter.export_nodes, exporter.export_frames):
+            filepath = tmp_path / "out.csv"
+            assert export(filepath) == ""
+            assert filepath.read_bytes().decode() == export()
+
     def test_export_frames_empty_model(self) -> None:
         """Export frames from empty model."""
         model = StructuralModel()
@@ -126,3 +159,68 @@ class TestCSVExporter:
 
         # Should preserve reasonable precision
         assert "1.1234" in content or "1.123456" in content
+
+
+@pytest.fixture
+def sample_results() -> AnalysisResults:
+    """Small results set with displacements, reactions and frame forces."""
+    results = AnalysisResults(load_case_id=uuid4())
+    results.add_displacement(NodalDisplacement(node_id=1))
+    results.add_displacement(NodalDisplacement(node_id=2, Ux=0.001, Uz=-0.0025, Ry=0.0003))
+    results.add_reaction(NodalReaction(node_id=1, Fz=10.5, My=-2.25))
+    results.add_frame_result(
+        FrameResult(
+            frame_id=1,
+            forces=[
+                FrameForces(location=0.0, P=-3.0, M3=12.0),
+                FrameForces(location=0.5, P=-3.0, M3=6.0),
+                FrameForces(location=1.0, P=-3.0, M3=0.0),
+            ],
+        )
+    )
+    return results
+
+
+class TestResultsExporter:
+    """Tests for ResultsExporter class."""
+
+    def test_export_displacements(self, sample_results: AnalysisResults) -> None:
+        """Export nodal displacements."""
+        content = ResultsExporter(sample_results).export_displacements()
+
+        rows = list(csv.DictReader(StringIO(content)))
+        assert len(rows) == 2
+        assert rows[1]["node_id"] == "2"
+        assert float(rows[1]["Ux"]) == 0.001
+        assert float(rows[1]["Uz"]) == -0.0025
+        assert float(rows[1]["Ry"]) == 0.0003
+
+    def test_export_reactions(self, sample_results: AnalysisResults) -> None:
+        """Export support reactions."""
+        content = ResultsExporter(sample_results).export_reactions()
+
+        rows = list(csv.DictReader(StringIO(content)))
+        assert len(rows) == 1
+        assert rows[0]["node_id"] == "1"
+        assert float(rows[0]["Fz"]) == 10.5
+        assert float(rows[0]["My"]) == -2.25
+
+    def test_export_frame_forces(self, sample_results: AnalysisResults) -> None:
+        """Export frame forces at each station."""
+        content = ResultsExporter(sample_results).export_frame_forces()
+
+        rows = list(csv.DictReader(StringIO(content)))
+        assert len(rows) == 3
+        assert [float(r["station"]) for r in rows] == [0.0, 0.5, 1.0]
+        assert [float(r["M3"]) for r in rows] == [12.0, 6.0, 0.0]
+        assert all(r["frame_id"] == "1" for r in rows)
+
+    def test_export_all(self, sample_results: AnalysisResults, tmp_path: Path) -> None:
+        """Export all results to directory."""
+        files = ResultsExporter(sample_results).export_all(tmp_path)
+
+        assert set(files) == {"displacements", "reactions", "frame_forces"}
+        for path in files.values():
+            assert path.exists()
+        rows = list(csv.DictReader(StringIO(files["reactions"].read_text())))
+        assert float(rows[0]["Fz"]) == 10.5
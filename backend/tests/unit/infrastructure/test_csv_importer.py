@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from paz.domain.model import StructuralModel
+from paz.domain.model.restraint import FREE
 from paz.infrastructure.importers.csv_importer import CSVImporter, import_model_from_csv
 
 
@@ -40,6 +41,20 @@ class TestCSVImporter:
         assert node2.restraint.ux is False
         assert node2.restraint.uy is False
 
+    def test_import_nodes_restraint_spellings(self, tmp_path: Path) -> None:
+        """Restraint flags accept 1/true/yes/t/y in any case."""
+        csv_content = """id,x,y,z,ux,uy,uz,rx,ry,rz
+1,0,0,0,TRUE,Yes,t,Y,1,no
+"""
+        filepath = tmp_path / "nodes.csv"
+        filepath.write_text(csv_content)
+
+        importer = CSVImporter()
+        importer.import_nodes(filepath)
+
+        restraint = importer.model.get_node(1).restraint
+        assert restraint.to_list() == [True, True, True, True, True, False]
+
     def test_import_nodes_minimal_columns(self, tmp_path: Path) -> None:
         """Import nodes with minimal columns (id, x, y, z only)."""
         csv_content = """id,x,y,z
@@ -57,6 +72,21 @@ class TestCSVImporter:
         node = importer.model.get_node(1)
         assert node.restraint.ux is False
 
+    def test_import_nodes_shares_free_restraint(self, tmp_path: Path) -> None:
+        """Unrestrained nodes reuse the FREE restraint instance."""
+        csv_content = """id,x,y,z,ux,uy,uz,rx,ry,rz
+1,0,0,0,0,0,0,0,0,0
+2,5,0,0,0,0,0,0,0,0
+"""
+        filepath = tmp_path / "nodes.csv"
+        filepath.write_text(csv_content)
+
+        importer = CSVImporter()
+        importer.import_nodes(filepath)
+
+        assert importer.model.get_node(1).restraint is FREE
+        assert importer.model.get_node(2).restraint is FREE
+
     def test_import_nodes_skips_invalid_rows(self, tmp_path: Path) -> None:
         """Import skips invalid rows."""
         csv_content = """id,x,y,z
@@ -73,6 +103,31 @@ invalid,not,a,number
         assert count == 2  # Only valid rows
         assert importer.model.node_count == 2
 
+    def test_import_nodes_reordered_columns(self, tmp_path: Path) -> None:
+        """Columns are matched by header name, not position."""
+        csv_content = """z,uz,id,y,x
+3,1,7,2,1
+"""
+        filepath = tmp_path / "nodes.csv"
+        filepath.write_text(csv_content)
+
+        importer = CSVImporter()
+        assert importer.import_nodes(filepath) == 1
+
+        node = importer.model.get_node(7)
+        assert (node.x, node.y, node.z) == (1, 2, 3)
+        assert node.restraint.uz is True
+        assert node.restraint.ux is False
+
+    def test_import_nodes_missing_required_column(self, tmp_path: Path) -> None:
+        """A file without a required column imports nothing."""
+        filepath = tmp_path / "nodes.csv"
+        filepath.write_text("id,x,y\n1,0,0\n")
+
+        importer = CSVImporter()
+        assert importer.import_nodes(filepath) == 0
+        assert importer.model.node_count == 0
+
     def test_import_nodes_file_not_found(self) -> None:
         """Import raises error for missing file."""
         importer = CSVImporter()
@@ -68,23 +68,6 @@ class TestDXFImporter:
         with pytest.raises(Exception):  # ValidationError
             importer.import_file("/nonexistent/file.dxf")
 
-    def test_layer_filter_none_allows_all(self) -> None:
-        """None layers filter allows all layers."""
-        settings = DXFImportSettings(layers=None)
-        importer = DXFImporter(settings=settings)
-
-        assert importer._layer_allowed("ANY_LAYER") is True
-        assert importer._layer_allowed("ANOTHER") is True
-
-    def test_layer_filter_restricts(self) -> None:
-        """Layer filter restricts to specified layers."""
-        settings = DXFImportSettings(layers=["BEAMS", "COLUMNS"])
-        importer = DXFImporter(settings=settings)
-
-        assert importer._layer_allowed("BEAMS") is True
-        assert importer._layer_allowed("COLUMNS") is True
-        assert importer._layer_allowed("OTHER") is False
-
     def test_transform_point_no_scale(self) -> None:
         """Transform point without scale."""
         settings = DXFImportSettings(scale=1.0)
@@ -114,6 +97,25 @@ class TestDXFImporter:
 
         assert result == (2.0, 3.0, 1.0)
 
+    def test_transform_points_matches_transform_point(self) -> None:
+        """Batch polyline transform agrees with the per-point transform."""
+        settings = DXFImportSettings(scale=0.001, axis_map=("y", "z", "x"))
+        importer = DXFImporter(settings=settings)
+        points = [(1000.0, 2000.0, 3000.0), (4000.0, 5000.0, 6000.0)]
+
+        result = importer._transform_points(points)
+
+        assert result == [importer._transform_point(p) for p in points]
+
+    def test_create_frames_from_closed_polyline(self) -> None:
+        """Closed polyline adds the closing segment."""
+        importer = DXFImporter()
+        square = [(0, 0, 0), (5, 0, 0), (5, 5, 0), (0, 5, 0)]
+
+        assert importer._create_frames_from_polyline(square, closed=False) == (4, 3)
+        assert importer._create_frames_from_polyline(square, closed=True) == (0, 1)
+        assert importer.model.frame_count == 4
+
     def test_create_frame_from_line_new_nodes(self) -> None:
         """Create frame from line creates new nodes."""
         importer = DXFImporter()
@@ -143,6 +145,19 @@ class TestDXFImporter:
         assert new_frames == 1
         assert importer.model.node_count == 3  # Total nodes
 
+    def test_create_frame_from_line_merges_within_tolerance(self) -> None:
+        """Endpoints within node_tolerance merge with existing nodes."""
+        model = StructuralModel()
+        model.add_node(0, 0, 0)
+        importer = DXFImporter(model, DXFImportSettings(node_tolerance=0.01))
+
+        importer._create_frame_from_line((0.005, 0, 0), (5, 0, 0))
+        result = importer._create_frame_from_line((4.995, 0.002, 0), (5, 5, 0))
+
+        assert result == (1, 1)
+        assert model.node_count == 3
+        assert model.get_frame(1).node_i_id == 1
+
     def test_create_frame_from_line_zero_length(self) -> None:
         """Zero-length line returns None."""
         importer = DXFImporter()
@@ -200,6 +215,25 @@ class TestDXFImporterWithMockedEzdxf:
         assert counts["nodes"] == 3  # 3 unique endpoints
         assert counts["frames"] == 2
 
+    def test_import_mixed_entities(self, tmp_path: Path) -> None:
+        """Lines and polylines are imported in a single pass."""
+        import ezdxf
+
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        msp.add_line((0, 0, 0), (5, 0, 0))
+        msp.add_lwpolyline([(5, 0), (5, 5), (0, 5)])
+        msp.add_polyline3d([(0, 5, 0), (0, 5, 3)])
+        msp.add_circle((0, 0, 0), 1.0)  # Not a frame entity
+
+        dxf_file = tmp_path / "test.dxf"
+        doc.saveas(str(dxf_file))
+
+        importer = DXFImporter()
+        counts = importer.import_file(dxf_file)
+
+        assert counts == {"nodes": 5, "frames": 4}
+
     def test_import_with_layer_filter(self, tmp_path: Path) -> None:
         """Import only from specified layers."""
         import ezdxf
@@ -221,6 +255,23 @@ class TestDXFImporterWithMockedEzdxf:
 
         assert counts["frames"] == 1  # Only BEAMS layer
 
+    def test_import_without_layer_filter(self, tmp_path: Path) -> None:
+        """Without a layer filter every layer is imported."""
+        import ezdxf
+
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        msp.add_line((0, 0, 0), (5, 0, 0), dxfattribs={"layer": "BEAMS"})
+        msp.add_line((10, 0, 0), (15, 0, 0), dxfattribs={"layer": "FURNITURE"})
+
+        dxf_file = tmp_path / "test.dxf"
+        doc.saveas(str(dxf_file))
+
+        importer = DXFImporter(settings=DXFImportSettings(layers=None))
+        counts = importer.import_file(dxf_file)
+
+        assert counts["frames"] == 2
+
     def test_import_with_scale(self, tmp_path: Path) -> None:
         """Import with scale factor (mm to m)."""
         import ezdxf
@@ -1,5 +1,7 @@
 """Tests for FileRepository."""
 
+import gzip
+
 import pytest
 from pathlib import Path
 
@@ -47,6 +49,14 @@ class TestFileRepository:
 
         assert path.suffix == ".paz"
 
+    def test_save_keeps_uppercase_extension(
+        self, repo: FileRepository, sample_project_file: ProjectFile
+    ) -> None:
+        """An existing .PAZ extension is accepted regardless of case."""
+        path = repo.save(sample_project_file, "UPPER.PAZ")
+
+        assert path.name == "UPPER.PAZ"
+
     def test_save_creates_parent_directories(
         self, repo: FileRepository, sample_project_file: ProjectFile, tmp_path: Path
     ) -> None:
@@ -123,6 +133,86 @@ class TestFileRepository:
 
         assert magic == b"\x1f\x8b"
 
+    def test_save_writes_compact_json(
+        self, repo: FileRepository, sample_project_file: ProjectFile
+    ) -> None:
+        """The compressed payload is not pretty-printed."""
+        path = repo.save(sample_project_file, "compact.paz")
+
+        with gzip.open(path, "rb") as f:
+            payload = f.read()
+
+        assert b"\n" not in payload
+
+    def test_save_is_reproducible(
+        self,
+        repo: FileRepository,
+        sample_project_file: ProjectFile,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Identical data gives identical bytes, and no temp file is left."""
+        # Freeze the modified timestamp so only the gzip header could differ
+        monkeypatch.setattr(sample_project_file.project, "touch", lambda: None)
+
+        first = repo.save(sample_project_file, "a.paz").read_bytes()
+        second = repo.save(sample_project_file, "b.paz").read_bytes()
+
+        assert first == second
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.paz", "b.paz"]
+
+    def test_save_stringifies_non_string_keys(
+        self, repo: FileRepository, sample_project_file: ProjectFile
+    ) -> None:
+        """Integer dict keys are written as strings, like the stdlib encoder."""
+        sample_project_file.model = {"nodes_by_id": {1: "a", 2: "b"}}
+        path = repo.save(sample_project_file, "keys.paz")
+
+        loaded = repo.load(path)
+
+        assert loaded.model == {"nodes_by_id": {"1": "a", "2": "b"}}
+
+    def test_save_with_compresslevel_roundtrip(
+        self, repo: FileRepository, sample_project_file: ProjectFile
+    ) -> None:
+        """Any gzip level produces a loadable file."""
+        fast = repo.save(sample_project_file, "fast.paz", compresslevel=1)
+        small = repo.save(sample_project_file, "small.paz", compresslevel=9)
+
+        assert repo.load(fast).model == repo.load(small).model
+
+    def test_load_reuses_payload_for_unchanged_file(
+        self, repo: FileRepository, sample_project_file: ProjectFile
+    ) -> None:
+        """Repeated loads reuse the payload but return independent objects."""
+        path = repo.save(sample_project_file, "cached.paz")
+
+        first = repo.load(path)
+        first.model["nodes"].clear()
+        second = repo.load(path)
+
+        assert len(repo._payload_cache) == 1
+        assert second.model["nodes"] == [{"id": 1, "x": 0, "y": 0, "z": 0}]
+
+    def test_load_rereads_modified_file(
+        self, repo: FileRepository, sample_project_file: ProjectFile
+    ) -> None:
+        """Saving over a file invalidates the cached payload."""
+        path = repo.save(sample_project_file, "changed.paz")
+        repo.load(path)
+
+        sample_project_file.model = {"nodes": []}
+        repo.save(sample_project_file, path)
+
+        assert repo.load(path).model == {"nodes": []}
+
+    def test_version_compatibility(self, repo: FileRepository) -> None:
+        """Only the major version has to match the current format."""
+        assert repo._is_version_compatible("1.0")
+        assert repo._is_version_compatible("1.7.2")
+        assert not repo._is_version_compatible("2.0")
+        assert not repo._is_version_compatible("unknown")
+
     def test_save_json_creates_uncompressed(
         self, repo: FileRepository, tmp_path: Path
     ) -> None:
@@ -103,6 +103,20 @@ class TestSectionsRepository:
         with pytest.raises(SectionNotFoundError, match="W99X999"):
             repository.get("W99X999")
 
+    def test_get_by_id(self, repository: SectionsRepository) -> None:
+        """Test getting sections by UUID string."""
+        section = repository.get("W14X30")
+        assert repository.get_by_id(str(section.id)) is section
+
+        custom = Section(name="MY", shape=SectionShape.CUSTOM, A=0.01, Ix=1e-4, Iy=1e-5)
+        custom.is_custom = True
+        repository.add_custom(custom)
+        assert repository.get_by_id(str(custom.id)) is custom
+
+        repository.remove_custom("MY")
+        with pytest.raises(SectionNotFoundError):
+            repository.get_by_id(str(custom.id))
+
     def test_exists(self, repository: SectionsRepository) -> None:
         """Test checking if section exists."""
         assert repository.exists("W14X30") is True
@@ -158,6 +172,23 @@ class TestSectionsRepository:
         results = repository.search("AISC")
         assert len(results) == 3
 
+    def test_search_follows_custom_changes(self, repository: SectionsRepository) -> None:
+        """Search sees added custom sections and forgets removed ones."""
+        custom = Section(
+            name="MyBeam",
+            shape=SectionShape.CUSTOM,
+            A=0.01,
+            Ix=1e-4,
+            Iy=1e-5,
+            description="Built-up Girder",
+            is_custom=True,
+        )
+        repository.add_custom(custom)
+        assert repository.search("girder") == [custom]
+
+        repository.remove_custom("MyBeam")
+        assert repository.search("girder") == []
+
     def test_get_w_shapes(self, repository: SectionsRepository) -> None:
         """Test getting all W shapes."""
         w_shapes = repository.get_w_shapes()
@@ -203,6 +234,19 @@ class TestSectionsRepository:
         assert result is True
         assert not repository.exists("ToRemove")
 
+    def test_filter_indexes_follow_custom_changes(self, repository: SectionsRepository) -> None:
+        """Shape/standard filters reflect added, replaced and removed sections."""
+        custom = Section(name="W14X30", shape=SectionShape.CUSTOM, A=0.01, Ix=1e-4, Iy=1e-5)
+        repository.add_custom(custom)  # Replaces the predefined W14X30
+
+        assert [s.name for s in repository.get_w_shapes()] == ["W12X26"]
+        assert repository.filter_by_shape(SectionShape.CUSTOM) == [custom]
+
+        custom.is_custom = True
+        assert repository.remove_custom("W14X30")
+        assert SectionShape.CUSTOM not in repository.get_shapes()
+        assert repository.count() == 2
+
     def test_remove_predefined_section_fails(self, repository: SectionsRepository) -> None:
         """Test that removing a predefined section fails."""
         result = repository.remove_custom("W14X30")
@@ -244,6 +288,41 @@ class TestSectionsRepository:
         """Test counting sections."""
         assert repository.count() == 3
 
+    def test_load_all_reuses_cached_catalog(self, temp_data_dir: Path) -> None:
+        """A second repository reuses the parsed sections of the first."""
+        first = SectionsRepository(data_path=temp_data_dir)
+        second = SectionsRepository(data_path=temp_data_dir)
+
+        assert first.load_all() == second.load_all() == 3
+        assert second.get("W14X30") is first.get("W14X30")
+
+        # Custom sections stay per instance
+        first.add_custom(
+            Section(name="MY", shape=SectionShape.CUSTOM, A=0.01, Ix=1e-4, Iy=1e-5)
+        )
+        assert not second.exists("MY")
+
+    def test_load_all_rereads_changed_catalog(self, temp_data_dir: Path) -> None:
+        """Adding a catalog file invalidates the cached sections."""
+        SectionsRepository(data_path=temp_data_dir).load_all()
+
+        extra = {
+            "sections": [{"name": "X1", "shape": "CUSTOM", "A": 0.01, "Ix": 1e-4, "Iy": 1e-5}]
+        }
+        (temp_data_dir / "extra.json").write_text(json.dumps(extra))
+
+        repo = SectionsRepository(data_path=temp_data_dir)
+        assert repo.load_all() == 4
+        assert repo.exists("X1")
+
+    def test_load_all_skips_invalid_catalog(self, temp_data_dir: Path) -> None:
+        """A malformed JSON file is logged and skipped."""
+        (temp_data_dir / "broken.json").write_text("{not json")
+
+        repo = SectionsRepository(data_path=temp_data_dir)
+
+        assert repo.load_all() == 3
+
     def test_empty_data_path(self) -> None:
         """Test repository with empty data directory."""
         with TemporaryDirectory() as tmpdir:
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for presentation layer tests.
+
+Widgets run on the offscreen Qt platform, selected here before any
+QApplication can be created.
+"""
+
+import os
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    """Get the Qt application, creating it if needed."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    assert isinstance(app, QApplication)
+    return app
@@ -4,11 +4,16 @@ Unit tests for extruded section rendering.
 Tests ProfileGenerator, ProfileGeometry, and ExtrudedRenderer.
 """
 
+from uuid import uuid4
+
 import numpy as np
 import pytest
+import pyvista as pv
 
 from paz.domain.model import StructuralModel
 from paz.domain.model.restraint import FIXED
+from paz.domain.results import AnalysisResults
+from paz.domain.results.nodal_results import NodalDisplacement
 from paz.domain.sections import Section, SectionShape
 from paz.domain.sections.profile_geometry import ProfileGenerator, ProfileGeometry
 from paz.presentation.viewport.extruded_renderer import (
@@ -290,6 +295,36 @@ class TestExtrudedRenderer:
 
         assert len(triangles) == 2
 
+    def test_triangulate_polygon_concave(self, renderer: ExtrudedRenderer) -> None:
+        """Concave outlines are covered without overlapping triangles."""
+        # U shape, clockwise, whose first vertex sees the notch
+        vertices = np.array(
+            [[0, 3], [1, 3], [1, 1], [2, 1], [2, 3], [3, 3], [3, 0], [0, 0]],
+            dtype=float,
+        )
+        triangles = renderer._triangulate_polygon(vertices)
+
+        def doubled_area(points: np.ndarray) -> float:
+            x, y = points[:, 0], points[:, 1]
+            return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+        areas = [doubled_area(vertices[list(tri)]) for tri in triangles]
+        assert len(triangles) == 6
+        # Same winding as the outline, adding up to exactly its area
+        assert all(area < 0 for area in areas)
+        assert sum(areas) == pytest.approx(doubled_area(vertices))
+
+    def test_triangulate_polygon_convex_is_fan(
+        self, renderer: ExtrudedRenderer
+    ) -> None:
+        """Convex outlines keep the fan from the first vertex."""
+        angles = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+        vertices = np.column_stack((np.cos(angles), np.sin(angles)))
+
+        triangles = renderer._triangulate_polygon(vertices)
+
+        assert triangles == [(0, i, i + 1) for i in range(1, 7)]
+
     def test_triangulate_polygon_empty(self, renderer: ExtrudedRenderer) -> None:
         """Test triangulation of empty polygon."""
         vertices = np.array([]).reshape(0, 2)
@@ -395,3 +430,180 @@ class TestMultiFrameExtrusion:
 
         # 3 frames * 24 points each (12 vertices start + 12 end)
         assert mesh.n_points == 72
+
+    def test_multi_frame_faces_and_normals(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Combined mesh keeps every frame's faces and shading normals."""
+        renderer = ExtrudedRenderer()
+        mesh = renderer.build_extruded_mesh(portal_model, sections)
+
+        # 3 frames * (12 side quads + 2 caps of 10 triangles)
+        assert mesh.n_cells == 96
+        assert mesh.n_verts == 0
+        assert mesh.point_data["Normals"].shape == (72, 3)
+        assert mesh.cell_data["Normals"].shape == (96, 3)
+
+    def test_mesh_buffers_match_vtk_types(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Cell connectivity is built directly as vtkIdType."""
+        renderer = ExtrudedRenderer()
+        mesh = renderer.build_extruded_mesh(portal_model, sections)
+
+        assert mesh.faces.dtype == np.dtype(pv.ID_TYPE)
+
+    def test_flat_shading_skips_normals(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Normals are only computed when smooth shading is on."""
+        renderer = ExtrudedRenderer(ExtrudedSettings(smooth_shading=False))
+        mesh = renderer.build_extruded_mesh(portal_model, sections)
+
+        assert mesh.n_cells == 96
+        assert "Normals" not in mesh.point_data
+        assert "Normals" not in mesh.cell_data
+
+    def test_collinear_frames_keep_their_own_points(
+        self,
+        sections: dict[str, Section],
+    ) -> None:
+        """Coincident end rings of collinear frames are not merged."""
+        model = StructuralModel()
+        model.add_node(0.0, 0.0, 0.0)
+        model.add_node(2.0, 0.0, 0.0)
+        model.add_node(4.0, 0.0, 0.0)
+        model.add_frame(1, 2, "A36", "W12x26")
+        model.add_frame(2, 3, "A36", "W12x26")
+
+        renderer = ExtrudedRenderer(ExtrudedSettings(smooth_shading=False))
+        mesh = renderer.build_extruded_mesh(model, sections)
+
+        # The end ring of the first frame and the start ring of the second
+        # are at the same place, but each solid keeps its own 24 points
+        assert mesh.n_points == 2 * 24
+        assert np.allclose(mesh.points[12:24], mesh.points[24:36])
+
+    def test_failed_profile_not_retried(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A section that cannot be profiled is tried once until cleared."""
+        renderer = ExtrudedRenderer()
+        calls = []
+
+        def fail(section: Section) -> ProfileGeometry:
+            calls.append(section.name)
+            raise ValueError("unsupported shape")
+
+        monkeypatch.setattr(renderer._profile_generator, "generate", fail)
+
+        assert renderer.build_extruded_mesh(portal_model, sections).n_points == 0
+        assert renderer.build_extruded_mesh(portal_model, sections).n_points == 0
+        assert calls == ["W12x26"]
+
+        renderer.clear_cache()
+        renderer.build_extruded_mesh(portal_model, sections)
+        assert calls == ["W12x26", "W12x26"]
+
+    def test_update_frame_matches_rebuild(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Updating edited frames in place gives the rebuilt mesh."""
+        renderer = ExtrudedRenderer()
+        mesh = renderer.build_extruded_mesh(portal_model, sections)
+
+        portal_model.update_node(2, x=0.5, z=3.5)
+        portal_model.update_frame(2, rotation=0.3)
+        for frame_id in (1, 2):
+            assert renderer.update_frame(portal_model, frame_id)
+
+        rebuilt = ExtrudedRenderer().build_extruded_mesh(portal_model, sections)
+        assert np.allclose(mesh.points, rebuilt.points)
+        assert np.allclose(mesh.point_data["Normals"], rebuilt.point_data["Normals"])
+
+    def test_update_frame_needs_rebuild_for_new_section(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Frames changing section, or not in the mesh, are not updated."""
+        renderer = ExtrudedRenderer()
+        assert not renderer.update_frame(portal_model, 1)
+
+        renderer.build_extruded_mesh(portal_model, sections)
+        sections["W8x10"] = sections["W12x26"]
+        portal_model.update_frame(1, section_name="W8x10")
+
+        assert not renderer.update_frame(portal_model, 1)
+        assert not renderer.update_frame(portal_model, 99)
+
+    def test_update_frame_in_material_meshes(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Per-material meshes are updated in place until a frame changes material."""
+        portal_model.update_frame(3, material_name="H25")
+        renderer = ExtrudedRenderer()
+        meshes = renderer.build_extruded_mesh_by_material(portal_model, sections)
+
+        portal_model.update_node(4, x=5.5, z=2.5)
+        for frame_id in (2, 3):
+            assert renderer.update_frame(portal_model, frame_id)
+
+        rebuilt = ExtrudedRenderer().build_extruded_mesh_by_material(
+            portal_model, sections
+        )
+        for material in ("A36", "H25"):
+            assert np.allclose(meshes[material].points, rebuilt[material].points)
+
+        portal_model.update_frame(2, material_name="H25")
+        assert not renderer.update_frame(portal_model, 2)
+
+    def test_deformed_mesh(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Frames follow their node displacements; collapsed ones are skipped."""
+        results = AnalysisResults(load_case_id=uuid4(), success=True)
+        # Node 2 moves onto node 1, collapsing the left column
+        results.add_displacement(NodalDisplacement(node_id=2, Uz=-0.03))
+        results.add_displacement(NodalDisplacement(node_id=4, Ux=0.01))
+
+        renderer = ExtrudedRenderer(ExtrudedSettings(smooth_shading=False))
+        mesh = renderer.build_deformed_extruded_mesh(
+            portal_model, sections, results, scale=100.0
+        )
+
+        assert mesh.n_points == 2 * 24
+        # Rings of the centred W profile are centred on the frame ends: the
+        # right column now runs from node 3 to node 4 moved 1.0 along x
+        assert np.allclose(mesh.points[24:36].mean(axis=0), (5.0, 0.0, 0.0))
+        assert np.allclose(mesh.points[36:48].mean(axis=0), (6.0, 0.0, 3.0))
+
+    def test_profile_prepared_once_per_section(
+        self,
+        portal_model: StructuralModel,
+        sections: dict[str, Section],
+    ) -> None:
+        """Frames sharing a section reuse one prepared profile."""
+        renderer = ExtrudedRenderer(ExtrudedSettings(show_end_caps=False))
+        mesh = renderer.build_extruded_mesh(portal_model, sections)
+
+        assert list(renderer._section_cache) == ["W12x26"]
+        profile = renderer._section_cache["W12x26"]
+        assert profile.side_faces.offsets.size == 12
+        assert profile.capped_faces.offsets.size == 12 + 2 * 10
+        assert mesh.n_cells == 3 * 12
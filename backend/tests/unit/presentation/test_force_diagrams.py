@@ -9,6 +9,7 @@ from uuid import uuid4
 import numpy as np
 import pytest
 
+from paz.application.commands.node_commands import MoveNodeCommand
 from paz.domain.model import StructuralModel
 from paz.domain.model.restraint import FIXED
 from paz.domain.results import AnalysisResults
@@ -201,6 +202,38 @@ class TestForceDiagramRenderer:
         # V2 is constant at 10.0
         assert all(s == pytest.approx(10.0) for s in scalars)
 
+    def test_scalar_values_interpolated_between_unsorted_stations(
+        self, simple_model: StructuralModel
+    ) -> None:
+        """Test values are interpolated between stations and held past the ends."""
+        results = AnalysisResults(load_case_id=uuid4(), success=True)
+        results.add_frame_result(FrameResult(frame_id=1, forces=[
+            FrameForces(location=0.75, M3=30.0),
+            FrameForces(location=0.25, M3=-10.0),
+        ]))
+        settings = DiagramSettings(interpolation_points=5)
+        renderer = ForceDiagramRenderer(settings=settings)
+
+        _, scalars = renderer.build_diagram_mesh(simple_model, results, ForceType.M3)
+
+        # Samples at 0, 0.25, 0.5, 0.75, 1
+        assert scalars == pytest.approx([-10.0, -10.0, 10.0, 30.0, 30.0])
+
+    def test_diagram_follows_moved_node(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Test diagram points follow a node moved by MoveNodeCommand."""
+        model, results = model_with_results
+        settings = DiagramSettings(interpolation_points=3, scale=0.0)
+        renderer = ForceDiagramRenderer(settings=settings)
+        renderer.build_diagram_mesh(model, results, ForceType.M3)
+
+        MoveNodeCommand(model, 2, 0.0, 8.0, 0.0).execute()
+        mesh, _ = renderer.build_diagram_mesh(model, results, ForceType.M3)
+
+        # With zero scale the diagram lies on the frame axis
+        assert np.allclose(mesh.points, [[0, 0, 0], [0, 4, 0], [0, 8, 0]])
+
     def test_get_global_extremes(
         self, model_with_results: tuple[StructuralModel, AnalysisResults]
     ) -> None:
@@ -328,6 +361,40 @@ class TestMultiFrameModel:
         # Should have points for all 3 frames
         assert mesh.n_points == 15  # 3 frames * 5 points
 
+    def test_multiple_frames_lines_stay_within_frame(
+        self, portal_frame_model: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Test each frame's diagram line only joins its own points."""
+        model, results = portal_frame_model
+        settings = DiagramSettings(interpolation_points=5)
+        renderer = ForceDiagramRenderer(settings=settings)
+
+        mesh, _ = renderer.build_diagram_mesh(model, results, ForceType.M3)
+
+        segments = mesh.lines.reshape(-1, 3)
+        assert len(segments) == 12  # 3 frames * 4 segments
+        assert (segments[:, 0] == 2).all()
+        assert (segments[:, 2] == segments[:, 1] + 1).all()
+        assert (segments[:, 1] // 5 == segments[:, 2] // 5).all()
+
+    def test_multiple_frames_filled_triangles(
+        self, portal_frame_model: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Test filled diagrams triangulate each frame separately."""
+        model, results = portal_frame_model
+        settings = DiagramSettings(interpolation_points=5)
+        renderer = ForceDiagramRenderer(settings=settings)
+
+        mesh, scalars = renderer.build_filled_diagram_mesh(model, results, ForceType.M3)
+
+        assert mesh.n_points == 30  # 3 frames * (5 base + 5 diagram)
+        assert len(scalars) == 30
+        triangles = mesh.faces.reshape(-1, 4)
+        assert len(triangles) == 24  # 3 frames * 4 segments * 2 triangles
+        assert (triangles[:, 0] == 3).all()
+        frame_of_point = triangles[:, 1:] // 10
+        assert (frame_of_point == frame_of_point[:, :1]).all()
+
     def test_find_max_in_multiple_frames(
         self, portal_frame_model: tuple[StructuralModel, AnalysisResults]
     ) -> None:
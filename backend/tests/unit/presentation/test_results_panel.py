@@ -0,0 +1,232 @@
+"""
+Unit tests for the results panel.
+
+Tests the stacked force array, the top-frames summary and the panel's
+caching and filter debounce. Widgets run on the offscreen Qt platform.
+"""
+
+import random
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from paz.domain.results import AnalysisResults
+from paz.domain.results.frame_results import FrameForces, FrameResult
+from paz.presentation.panels.results_panel import (
+    FrameSummaryModel,
+    ResultsPanel,
+    _stack_frame_forces,
+)
+from paz.presentation.viewport.force_diagrams import ForceType
+
+
+def _results(frames: dict[int, list[FrameForces]]) -> AnalysisResults:
+    """Build results with the given force stations per frame."""
+    results = AnalysisResults(load_case_id=uuid4(), success=True)
+    for frame_id, forces in frames.items():
+        results.add_frame_result(FrameResult(frame_id=frame_id, forces=forces))
+    return results
+
+
+def _reference_summary(
+    results: AnalysisResults, force_type: ForceType
+) -> list[tuple[int, float, float, float]]:
+    """Top 10 frames as the panel computed them with a full Python sort."""
+    summaries = []
+    for frame_id, frame_result in results.frame_results.items():
+        values = [getattr(forces, force_type.value) for forces in frame_result.forces]
+        max_val = max(values, default=0.0)
+        min_val = min(values, default=0.0)
+        summaries.append((frame_id, max_val, min_val, max(abs(max_val), abs(min_val))))
+    summaries.sort(key=lambda row: row[3], reverse=True)
+    return summaries[:10]
+
+
+class TestStackFrameForces:
+    """Tests for _stack_frame_forces."""
+
+    def test_stations_padded_with_nan(self) -> None:
+        """Frames with fewer stations are padded with NaN."""
+        results = _results({
+            4: [FrameForces(location=0.0, M3=1.0, P=7.0), FrameForces(location=1.0, M3=2.0)],
+            9: [FrameForces(location=0.5, M3=-3.0)],
+            2: [],
+        })
+
+        forces, frame_ids = _stack_frame_forces(results)
+
+        assert frame_ids.tolist() == [4, 9, 2]
+        assert forces.shape == (3, 2, 6)
+        # Columns follow the combo box order: M3, V2, P, M2, V3, T
+        assert forces[0, :, 0].tolist() == [1.0, 2.0]
+        assert forces[0, 0, 2] == 7.0
+        assert forces[1, 0, 0] == -3.0
+        assert np.isnan(forces[1, 1]).all()
+        assert np.isnan(forces[2]).all()
+
+    def test_no_results(self) -> None:
+        """No results give an empty array with one station column."""
+        forces, frame_ids = _stack_frame_forces(None)
+
+        assert forces.shape == (0, 1, 6)
+        assert frame_ids.size == 0
+
+
+class TestFrameSummary:
+    """Tests for the top frames and extremes computed by the panel."""
+
+    @pytest.fixture
+    def panel(self, qapp: QApplication) -> ResultsPanel:
+        """Create a results panel."""
+        return ResultsPanel()
+
+    def _summary(
+        self, panel: ResultsPanel, force_type: ForceType
+    ) -> tuple[dict[str, float], list[tuple[int, float, float, float]]]:
+        panel._current_force_type = force_type
+        extremes, (frame_ids, values) = panel._scan_results()
+        rows = [
+            (frame_id, max_val, min_val, abs_max)
+            for frame_id, (max_val, min_val, abs_max) in zip(
+                frame_ids.tolist(), values.tolist(), strict=True
+            )
+        ]
+        return extremes, rows
+
+    def test_top_frames_match_full_sort(self, panel: ResultsPanel) -> None:
+        """Order and tie handling match a full stable sort of all frames."""
+        rnd = random.Random(7)
+        frames = {}
+        for frame_id in rnd.sample(range(1, 500), 60):
+            # Integer values so many frames tie, some frames have no stations
+            frames[frame_id] = [
+                FrameForces(
+                    location=k / 3,
+                    **{name: float(rnd.randint(-5, 5)) for name in ("P", "V2", "M3")},
+                )
+                for k in range(rnd.choice((0, 1, 2, 4)))
+            ]
+        results = _results(frames)
+        panel.set_results(results)
+
+        for force_type in (ForceType.M3, ForceType.V2, ForceType.P, ForceType.T):
+            _, rows = self._summary(panel, force_type)
+            assert rows == _reference_summary(results, force_type)
+
+    def test_ties_keep_frame_order(self, panel: ResultsPanel) -> None:
+        """With all frames tied, the first ten frames are listed in order."""
+        frame_ids = list(range(30, 0, -1))
+        panel.set_results(
+            _results({fid: [FrameForces(location=0.0, M3=-4.0)] for fid in frame_ids})
+        )
+
+        _, rows = self._summary(panel, ForceType.M3)
+
+        assert [row[0] for row in rows] == frame_ids[:10]
+
+    def test_frames_without_stations(self, panel: ResultsPanel) -> None:
+        """Frames without stations list zeros and do not affect the extremes."""
+        panel.set_results(_results({
+            1: [],
+            2: [FrameForces(location=0.0, M3=-8.0), FrameForces(location=1.0, M3=-2.0)],
+        }))
+
+        extremes, rows = self._summary(panel, ForceType.M3)
+
+        assert extremes == {"max": -2.0, "min": -8.0, "abs_max": 8.0}
+        assert rows == [(2, -2.0, -8.0, 8.0), (1, 0.0, 0.0, 0.0)]
+
+    def test_summary_cached_per_force_type(self, panel: ResultsPanel) -> None:
+        """Summaries are reused per force type until new results are set."""
+        results = _results({1: [FrameForces(location=0.0, M3=3.0, V2=1.0)]})
+        panel.set_results(results)
+
+        first = panel._current_summary()
+        panel._current_force_type = ForceType.V2
+        other = panel._current_summary()
+        panel._current_force_type = ForceType.M3
+
+        assert panel._current_summary() is first
+        assert other is not first
+
+        panel.set_results(_results({1: [FrameForces(location=0.0, M3=5.0)]}))
+
+        extremes, _ = panel._current_summary()
+        assert extremes["max"] == 5.0
+
+    def test_highlight_max_uses_top_frame(self, panel: ResultsPanel) -> None:
+        """The max frame is the first of the top frames."""
+        panel.set_results(_results({
+            1: [FrameForces(location=0.0, M3=2.0)],
+            2: [FrameForces(location=0.0, M3=-9.0)],
+        }))
+        highlighted: list[int] = []
+        panel.highlight_frame.connect(highlighted.append)
+
+        panel._on_highlight_max()
+
+        assert highlighted == [2]
+
+
+class TestResultsPanelWidgets:
+    """Tests for lazy widget creation and the filter debounce."""
+
+    def test_results_ui_built_on_first_results(self, qapp: QApplication) -> None:
+        """Tables are only created once results are set."""
+        panel = ResultsPanel()
+        built = [panel._results_ui_built]
+
+        panel.set_results(None)
+        built.append(panel._results_ui_built)
+
+        panel.set_results(_results({1: [FrameForces(location=0.0, M3=1.5)]}))
+        built.append(panel._results_ui_built)
+
+        assert built == [False, False, True]
+        assert panel._frame_model.rowCount() == 1
+        assert [item.text() for item in panel._extremes_items] == [
+            "1.50",
+            "1.50",
+            "1.50",
+        ]
+
+    def test_filter_edits_debounced(self, qapp: QApplication) -> None:
+        """Spin box steps are emitted once, with the value they settle on."""
+        panel = ResultsPanel()
+        panel.set_results(_results({1: [FrameForces(location=0.0, M3=1.0)]}))
+        emitted: list[tuple[object, object]] = []
+        panel.filter_changed.connect(lambda lo, hi: emitted.append((lo, hi)))
+
+        panel._filter_enabled.setChecked(True)
+        assert emitted == [(0.0, 1000.0)]
+
+        for value in (1.0, 2.0, 3.0):
+            panel._min_spin.setValue(value)
+        assert len(emitted) == 1
+        assert panel._filter_debounce.isActive()
+
+        panel._flush_filter()
+        assert emitted[1:] == [(3.0, 1000.0)]
+        assert not panel._filter_debounce.isActive()
+
+
+class TestFrameSummaryModel:
+    """Tests for the NumPy-backed frame table model."""
+
+    def test_cells_formatted(self, qapp: QApplication) -> None:
+        """Rows show the frame id and values with two decimals."""
+        model = FrameSummaryModel()
+        model.set_summary(
+            np.array([7, 3], dtype=np.int64),
+            np.array([[1.0, -2.5, 2.5], [0.125, 0.0, 0.125]]),
+        )
+
+        assert model.rowCount() == 2
+        assert model.columnCount() == 4
+        assert model.frame_id(1) == 3
+        texts = [
+            [model.data(model.index(row, col)) for col in range(4)] for row in range(2)
+        ]
+        assert texts == [["7", "1.00", "-2.50", "2.50"], ["3", "0.12", "0.00", "0.12"]]
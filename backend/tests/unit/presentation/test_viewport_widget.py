@@ -2,19 +2,24 @@
 Unit tests for viewport presentation layer.
 
 Tests render modes, mesh building, and deformed rendering.
-Qt widget tests are skipped without Qt application context.
+Widget tests run on the offscreen Qt platform.
 """
 
 from uuid import uuid4
 
 import numpy as np
 import pytest
+from PySide6.QtWidgets import QApplication
 
+from paz.application.commands.node_commands import MoveNodeCommand
 from paz.domain.model import StructuralModel
 from paz.domain.model.restraint import FIXED
 from paz.domain.results import AnalysisResults
 from paz.domain.results.nodal_results import NodalDisplacement
+from paz.domain.sections import Section, SectionShape
+from paz.presentation.viewport import ViewportWidget
 from paz.presentation.viewport.deformed_renderer import DeformedRenderer
+from paz.presentation.viewport.extruded_renderer import ExtrudedRenderer
 from paz.presentation.viewport.mesh_builder import MeshBuilder
 from paz.presentation.viewport.render_modes import (
     ColorMapType,
@@ -166,6 +171,18 @@ class TestMeshBuilder:
         # 3 frames * 2 points each = 6 points
         assert mesh.n_points == 6
 
+    def test_build_frame_mesh_after_move_command(
+        self, simple_model: StructuralModel
+    ) -> None:
+        """Test the frame mesh follows a node moved by MoveNodeCommand."""
+        builder = MeshBuilder()
+        builder.build_frame_mesh(simple_model)
+
+        MoveNodeCommand(simple_model, 2, 5.0, 5.0, 5.0).execute()
+        mesh = builder.build_frame_mesh(simple_model)
+
+        assert mesh.points[1].tolist() == [5.0, 5.0, 5.0]
+
     def test_build_node_points(self, simple_model: StructuralModel) -> None:
         """Test node point cloud generation."""
         builder = MeshBuilder()
@@ -278,6 +295,238 @@ class TestDeformedRenderer:
         assert mesh.n_points == 20
         assert len(scalars) == 20
 
+    def test_model_edits_rebuild_mesh(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Nodes and frames added to the same model are picked up."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=2)
+        renderer.build_deformed_mesh(model, results, 1.0, DisplacementComponent.UX)
+
+        model.add_node(5.0, 5.0, 0.0)
+        model.add_frame(2, 3, "A36", "W12x26")
+        mesh, _ = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert mesh.n_points == 4
+        assert mesh.points[-1] == pytest.approx([5.0, 5.0, 0.0])
+
+    def test_moved_node_rebuilds_mesh_and_nodes(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Nodes moved in place are drawn at their new position."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=2)
+        renderer.build_deformed_mesh(model, results, 1.0, DisplacementComponent.UX)
+        renderer.build_deformed_nodes(model, results, 1.0, DisplacementComponent.UX)
+
+        MoveNodeCommand(model, 2, 3.0, 0.0, 0.0).execute()
+        mesh, _ = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+        nodes, _ = renderer.build_deformed_nodes(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert mesh.points[-1] == pytest.approx([3.001, 0.002, -0.005])
+        assert nodes.points[-1] == pytest.approx([3.001, 0.002, -0.005])
+
+    def test_mesh_buffers_are_single_precision(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Points and scalars are handed to VTK as float32."""
+        model, results = model_with_results
+        renderer = DeformedRenderer()
+
+        mesh, scalars = renderer.build_deformed_mesh(
+            model, results, 100.0, DisplacementComponent.TOTAL
+        )
+        nodes, node_scalars = renderer.build_deformed_nodes(
+            model, results, 100.0, DisplacementComponent.TOTAL
+        )
+
+        assert mesh.points.dtype == np.float32
+        assert scalars.dtype == np.float32
+        assert nodes.points.dtype == np.float32
+        assert node_scalars.dtype == np.float32
+        assert nodes["node_id"].dtype == np.int32
+
+    def test_repeated_build_reuses_cached_mesh(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Same inputs reuse the mesh; callers get independent copies."""
+        model, results = model_with_results
+        renderer = DeformedRenderer()
+
+        first, scalars = renderer.build_deformed_mesh(
+            model, results, 10.0, DisplacementComponent.UZ
+        )
+        first["displacement"] = scalars
+        second, cached_scalars = renderer.build_deformed_mesh(
+            model, results, 10.0, DisplacementComponent.UZ
+        )
+        other, _ = renderer.build_deformed_mesh(
+            model, results, 20.0, DisplacementComponent.UZ
+        )
+
+        assert np.array_equal(cached_scalars, scalars)
+        assert not cached_scalars.flags.writeable
+        with pytest.raises(ValueError):
+            cached_scalars[0] = 1.0
+        assert "displacement" not in second.array_names
+        assert np.shares_memory(first.points, second.points)
+        assert not np.allclose(other.points, second.points)
+
+    def test_added_displacement_rebuilds_mesh(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """New displacements in the same results object are not served stale."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=2)
+
+        before, _ = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+        results.add_displacement(NodalDisplacement(node_id=2, Ux=0.5))
+        after, scalars = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert not np.allclose(before.points, after.points)
+        assert scalars.max() == pytest.approx(0.5)
+
+    def test_interpolation_change_rebuilds_mesh(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Changing interpolation points invalidates cached meshes."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=5)
+        renderer.build_deformed_mesh(model, results, 1.0, DisplacementComponent.UX)
+
+        renderer.interpolation_points = 3
+        mesh, _ = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert mesh.n_points == 3
+
+    def test_mesh_matches_per_frame_interpolation(self) -> None:
+        """Points, lines and scalars match interpolating each frame alone."""
+        model = StructuralModel()
+        model.add_node(0.0, 0.0, 0.0, restraint=FIXED)
+        model.add_node(0.0, 0.0, 3.0)
+        model.add_node(4.0, 0.0, 3.0)
+        model.add_node(4.0, 2.0, 0.0)
+        model.add_frame(1, 2, "A36", "W12x26")
+        model.add_frame(2, 3, "A36", "W12x26")
+        model.add_frame(3, 4, "A36", "W12x26")
+        results = AnalysisResults(load_case_id=uuid4(), success=True)
+        results.add_displacement(NodalDisplacement(node_id=2, Ux=0.01, Uy=-0.02, Uz=0.0))
+        results.add_displacement(NodalDisplacement(node_id=3, Ux=0.03, Uy=0.0, Uz=-0.04))
+        # Node 4 has no displacement and stays in place
+        n_pts = 4
+        scale = 50.0
+        renderer = DeformedRenderer(interpolation_points=n_pts)
+
+        def displacement(node_id: int) -> np.ndarray:
+            disp = results.get_displacement(node_id)
+            return np.zeros(3) if disp is None else np.array([disp.Ux, disp.Uy, disp.Uz])
+
+        for component in DisplacementComponent:
+            mesh, scalars = renderer.build_deformed_mesh(model, results, scale, component)
+
+            ref_points, ref_scalars, ref_lines = [], [], []
+            for k, frame in enumerate(model.frames):
+                u_i = displacement(frame.node_i_id)
+                u_j = displacement(frame.node_j_id)
+                p_i = np.array(model.get_node(frame.node_i_id).position) + scale * u_i
+                p_j = np.array(model.get_node(frame.node_j_id).position) + scale * u_j
+                for i in range(n_pts):
+                    t = i / (n_pts - 1)
+                    u = u_i + t * (u_j - u_i)
+                    ref_points.append(p_i + t * (p_j - p_i))
+                    if component == DisplacementComponent.TOTAL:
+                        ref_scalars.append(np.linalg.norm(u))
+                    else:
+                        ref_scalars.append(u["XYZ".index(component.name[-1])])
+                    if i > 0:
+                        ref_lines += [2, k * n_pts + i - 1, k * n_pts + i]
+
+            assert mesh.points == pytest.approx(np.array(ref_points), abs=1e-5)
+            assert scalars == pytest.approx(np.array(ref_scalars), abs=1e-6)
+            assert mesh.lines.tolist() == ref_lines
+
+    def test_new_results_rebuild_mesh(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Another results set is not served the cached mesh of the first."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=2)
+        renderer.build_deformed_mesh(model, results, 1.0, DisplacementComponent.UX)
+
+        other = AnalysisResults(load_case_id=uuid4(), success=True)
+        other.add_displacement(NodalDisplacement(node_id=2, Ux=0.5, Uy=0.0, Uz=0.0))
+        mesh, scalars = renderer.build_deformed_mesh(
+            model, other, 1.0, DisplacementComponent.UX
+        )
+
+        assert mesh.points[-1] == pytest.approx([5.5, 0.0, 0.0])
+        assert scalars[-1] == pytest.approx(0.5)
+
+    def test_new_model_rebuilds_geometry_and_mesh(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Another model gets its own geometry and mesh."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=2)
+        renderer.build_deformed_mesh(model, results, 1.0, DisplacementComponent.UX)
+
+        other = StructuralModel()
+        other.add_node(0.0, 0.0, 0.0)
+        other.add_node(0.0, 7.0, 0.0)
+        other.add_frame(1, 2, "A36", "W12x26")
+        mesh, _ = renderer.build_deformed_mesh(
+            other, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert mesh.points[-1] == pytest.approx([0.001, 7.002, -0.005])
+
+    def test_mesh_cache_is_bounded(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Only the most recent meshes are kept."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=2)
+
+        first, _ = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+        for scale in (2.0, 3.0, 4.0, 5.0):
+            renderer.build_deformed_mesh(model, results, scale, DisplacementComponent.UX)
+        again, _ = renderer.build_deformed_mesh(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert len(renderer._mesh_cache) == 4
+        assert not np.shares_memory(first.points, again.points)
+        assert np.allclose(first.points, again.points)
+
+    def test_displacements_of_unknown_nodes_ignored(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Results for nodes not in the model do not shift other nodes."""
+        model, results = model_with_results
+        results.add_displacement(NodalDisplacement(node_id=99, Ux=1.0, Uy=1.0, Uz=1.0))
+        renderer = DeformedRenderer()
+
+        nodes, scalars = renderer.build_deformed_nodes(
+            model, results, 1.0, DisplacementComponent.UX
+        )
+
+        assert nodes.points == pytest.approx(np.array([[0, 0, 0], [5.001, 0.002, -0.005]]))
+        assert scalars == pytest.approx([0.0, 0.001])
+
     def test_scalar_values_ux_component(
         self, model_with_results: tuple[StructuralModel, AnalysisResults]
     ) -> None:
@@ -297,6 +546,24 @@ class TestDeformedRenderer:
         assert scalars[0] == pytest.approx(0.0)
         assert scalars[-1] == pytest.approx(0.001)
 
+    def test_interpolated_midpoint(
+        self, model_with_results: tuple[StructuralModel, AnalysisResults]
+    ) -> None:
+        """Interior points interpolate positions and displacements linearly."""
+        model, results = model_with_results
+        renderer = DeformedRenderer(interpolation_points=3)
+
+        mesh, scalars = renderer.build_deformed_mesh(
+            model=model,
+            results=results,
+            scale=100.0,
+            component=DisplacementComponent.UZ,
+        )
+
+        # Halfway between (0, 0, 0) and (5.1, 0.2, -0.5)
+        assert mesh.points[1] == pytest.approx([2.55, 0.1, -0.25])
+        assert scalars[1] == pytest.approx(-0.0025)
+
     def test_scalar_values_total_component(
         self, model_with_results: tuple[StructuralModel, AnalysisResults]
     ) -> None:
@@ -443,3 +710,74 @@ class TestEmptyModelEdgeCases:
 
         assert min_val == 0.0
         assert max_val == 0.0
+
+
+class TestViewportFrameUpdates:
+    """Tests for redrawing edited frames in the viewport."""
+
+    @pytest.fixture
+    def sections(self) -> dict[str, Section]:
+        """Create sections dictionary."""
+        return {
+            "W12x26": Section(
+                name="W12x26",
+                shape=SectionShape.W,
+                A=0.0049,
+                Ix=8.55e-5,
+                Iy=1.74e-5,
+                d=0.31,
+                bf=0.165,
+                tf=0.0096,
+                tw=0.0058,
+            )
+        }
+
+    @pytest.fixture
+    def viewport(
+        self, qapp: QApplication, sections: dict[str, Section]
+    ) -> tuple[ViewportWidget, StructuralModel]:
+        """Create a viewport showing a portal frame as extruded solids."""
+        model = StructuralModel()
+        model.add_node(0.0, 0.0, 0.0, restraint=FIXED)
+        model.add_node(0.0, 0.0, 3.0)
+        model.add_node(5.0, 0.0, 0.0, restraint=FIXED)
+        model.add_node(5.0, 0.0, 3.0)
+        model.add_frame(1, 2, "A36", "W12x26")
+        model.add_frame(2, 4, "A36", "W12x26")
+        model.add_frame(3, 4, "H25", "W12x26")
+
+        widget = ViewportWidget()
+        widget.set_sections(sections)
+        widget.set_extruded_view(True)
+        widget.set_model(model)
+        return widget, model
+
+    def test_moved_node_updates_solids_in_place(
+        self,
+        viewport: tuple[ViewportWidget, StructuralModel],
+        sections: dict[str, Section],
+    ) -> None:
+        """Frames at a moved node are re-extruded in the meshes on screen."""
+        widget, model = viewport
+        actors = list(widget._extruded_actors)
+
+        MoveNodeCommand(model, 2, 0.5, 0.0, 3.5).execute()
+        widget.update_frames(frame.id for frame in model.get_frames_using_node(2))
+
+        assert widget._extruded_actors == actors
+        rebuilt = ExtrudedRenderer().build_extruded_mesh_by_material(model, sections)
+        shown = widget._plotter.actors["extruded_A36"].mapper.dataset
+        assert np.allclose(shown.points, rebuilt["A36"].points)
+
+    def test_material_change_rebuilds_solids(
+        self, viewport: tuple[ViewportWidget, StructuralModel]
+    ) -> None:
+        """A frame moving to another material mesh falls back to a rebuild."""
+        widget, model = viewport
+        actors = list(widget._extruded_actors)
+
+        model.update_frame(1, material_name="H25")
+        widget.update_frames([1])
+
+        assert len(widget._extruded_actors) == 2
+        assert not set(widget._extruded_actors) & set(actors)